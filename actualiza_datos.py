@@ -1,73 +1,299 @@
 import pandas as pd
 import numpy as np
 import xlrd
+import argparse
+import json
+import sys
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from proyeccion_ipc import extender_ipc
+from manifiesto import cargar_manifiesto, guardar_manifiesto, verificar, registrar, imprimir_resumen
+from registro_series import cargar_series, serie, leer_deflactor, archivos_deflactor
+from tablas import guardar_tabla, ruta_columnar
+from instrumentacion import medir, medido
 
-def procesar_salarios(tipo):
+# Tipos de salarios declarados en series.json
+TIPOS = list(cargar_series())
+ARCHIVO_ERRORES = Path("datos") / "errores_actualiza_datos.json"
+
+def meses_ordinales(fechas):
     """
-    Procesa los datos de salarios para un tipo específico (cic, beca_conicet, foncyt, profasis)
+    Convierte fechas en números de mes consecutivos (año * 12 + mes - 1)
     """
-    # Leer datos de salarios y estipendios
-    df = pd.read_csv(f"datos/crudo_{tipo}.csv", parse_dates=["fecha"])
+    fechas = pd.DatetimeIndex(fechas)
+    return np.asarray(fechas.year * 12 + fechas.month - 1, dtype=np.int64)
 
-    # Leer datos de inflación
-    ipc = pd.read_csv("datos/ipc_nuevo.csv", parse_dates=["fecha"])
+def alinear_indice(meses, meses_ipc, indice_ipc):
+    """
+    Toma el índice de IPC de cada mes de `meses` (NaN si el mes no está)
+    """
+    pos = np.clip(np.searchsorted(meses_ipc, meses), 0, len(meses_ipc) - 1)
+    return np.where(meses_ipc[pos] == meses, indice_ipc[pos], np.nan)
 
-    # Unir datos
-    df = df.merge(ipc[["fecha", "indice"]], on="fecha", how="left")
+def ajustar_salarios(salario, indice, base):
+    """
+    Núcleo vectorizado del ajuste por inflación.
+    `salario` e `indice` son arrays alineados por mes: 1D para una serie o 2D
+    (series x meses) con NaN fuera del rango de cada serie. `base` es la posición
+    del mes base de `ajustado`.
+    Retorna (ajustado, salario_indice, salario_real_indice, salario_real)
+    """
+    salario = np.asarray(salario, dtype=np.float64)
+    indice = np.broadcast_to(np.asarray(indice, dtype=np.float64), salario.shape)
+    validos = ~np.isnan(salario)
+    n = salario.shape[-1]
+    primero = np.argmax(validos, axis=-1)[..., np.newaxis]
+    ultimo = (n - 1 - np.argmax(validos[..., ::-1], axis=-1))[..., np.newaxis]
+
+    # Salario real en pesos del último mes de cada serie
+    salario_indice = salario / np.take_along_axis(salario, primero, axis=-1)
+    salario_real_indice = salario_indice / indice
+    salario_real = (np.take_along_axis(salario, ultimo, axis=-1) *
+                    salario_real_indice /
+                    np.take_along_axis(salario_real_indice, ultimo, axis=-1))
 
+    # Salario del mes base actualizado por IPC desde ese mes
+    salario_base = salario[..., base:base + 1]
+    indice_base = indice[..., base:base + 1]
+    ajustado = np.where(np.arange(n) < base, salario, salario_base * (indice / indice_base))
+    ajustado = np.where(validos, ajustado, np.nan)
+
+    return ajustado, salario_indice, salario_real_indice, salario_real
+
+def leer_crudos(tipos):
+    """
+    Lee el CSV crudo de cada tipo (datos/crudo_{tipo}.csv salvo que series.json
+    indique otro). Retorna (crudos, errores)
+    """
+    crudos, errores = {}, {}
+    for tipo in tipos:
+        try:
+            df = pd.read_csv(serie(tipo)["crudo"], parse_dates=["fecha"])
+            crudos[tipo] = df.sort_values("fecha").reset_index(drop=True)
+        except Exception as e:
+            errores[tipo] = e
+    return crudos, errores
+
+@medido()
+def procesar_lote(tipos=TIPOS, ipc=None):
+    """
+    Procesa varios tipos de salarios. Los tipos que comparten deflactor y mes base
+    (ver series.json) se procesan juntos, con una sola lectura de IPC y una sola
+    pasada de ajustar_salarios sobre la matriz tipos x meses.
+    Si se pasa `ipc`, se usa para todos los tipos en lugar de su deflactor
+    Retorna (resultados, errores): DataFrame por tipo y excepción por tipo fallido
+    """
+    crudos, errores = leer_crudos(tipos)
+    grupos = {}
+    for tipo in crudos:
+        definicion = serie(tipo)
+        grupos.setdefault((definicion["deflactor"], definicion["base_ajustado"]), []).append(tipo)
+
+    resultados = {}
+    for (deflactor, base_ajustado), grupo in grupos.items():
+        try:
+            ipc_grupo = leer_deflactor(deflactor) if ipc is None else ipc
+        except Exception as e:
+            errores.update({tipo: e for tipo in grupo})
+            continue
+        resultados.update(_procesar_grupo({tipo: crudos[tipo] for tipo in grupo}, ipc_grupo,
+                                          base_ajustado, errores))
+    return {tipo: resultados[tipo] for tipo in tipos if tipo in resultados}, errores
+
+def _procesar_grupo(crudos, ipc, base_ajustado, errores):
+    """
+    Ajusta un grupo de tipos con el mismo IPC y mes base. Anota en `errores`
+    los tipos que no tienen salario en el mes base
+    """
     # Project missing IPC data using previous month's inflation rate
     # For months without IPC data, assume same monthly variation as last available month
-    df = df.sort_values("fecha").reset_index(drop=True)
-    for i in range(len(df)):
-        if pd.isna(df.loc[i, "indice"]):
-            if i >= 2 and pd.notna(df.loc[i-1, "indice"]) and pd.notna(df.loc[i-2, "indice"]):
-                # Calculate monthly growth rate from previous month
-                prev_growth = df.loc[i-1, "indice"] / df.loc[i-2, "indice"]
-                # Apply same growth rate
-                df.loc[i, "indice"] = df.loc[i-1, "indice"] * prev_growth
-            elif i >= 1 and pd.notna(df.loc[i-1, "indice"]):
-                # If only one previous value, just carry it forward
-                df.loc[i, "indice"] = df.loc[i-1, "indice"]
+    ultima_fecha = max(df["fecha"].max() for df in crudos.values())
+    ipc = extender_ipc(ipc, ultima_fecha)
+
+    # Matriz tipos x meses (NaN fuera del rango de cada serie)
+    meses_tipo = {tipo: meses_ordinales(df["fecha"]) for tipo, df in crudos.items()}
+    primer_mes = min(m.min() for m in meses_tipo.values())
+    meses = np.arange(primer_mes, max(m.max() for m in meses_tipo.values()) + 1)
+    salarios = np.full((len(crudos), len(meses)), np.nan)
+    for fila, tipo in enumerate(crudos):
+        salarios[fila, meses_tipo[tipo] - primer_mes] = crudos[tipo]["salario"].to_numpy()
+
+    # Unir datos
+    indice = alinear_indice(meses, meses_ordinales(ipc["fecha"]), ipc["indice"].to_numpy(dtype=np.float64))
 
     # Calcular ajustes
-    fecha_inicio = pd.to_datetime("2023-11-01")
-    salario_base = df.loc[df["fecha"] == fecha_inicio, "salario"].iloc[0]
-    indice_base = df.loc[df["fecha"] == fecha_inicio, "indice"].iloc[0]
+    base = meses_ordinales([base_ajustado])[0] - primer_mes
+    if not 0 <= base < len(meses):
+        errores.update({tipo: ValueError(f"No hay salario para el mes base {base_ajustado}") for tipo in crudos})
+        return {}
+    ajustado, salario_indice, salario_real_indice, salario_real = ajustar_salarios(salarios, indice, base)
+
+    resultados = {}
+    for fila, (tipo, df) in enumerate(crudos.items()):
+        if np.isnan(salarios[fila, base]):
+            errores[tipo] = ValueError(f"No hay salario para el mes base {base_ajustado}")
+            continue
+        pos = meses_tipo[tipo] - primer_mes
+        resultados[tipo] = pd.DataFrame({
+            "fecha": df["fecha"],
+            "salario": df["salario"],
+            "indice": indice[pos],
+            "ajustado": ajustado[fila, pos],
+            "salario_indice": salario_indice[fila, pos],
+            "nominal": df["salario"],
+            "salario_real_indice": salario_real_indice[fila, pos],
+            "salario_real": salario_real[fila, pos],
+        })
+    return resultados
+
+@medido()
+def procesar_salarios(tipo, ipc=None):
+    """
+    Procesa los datos de salarios para un tipo específico (cic, beca_conicet, foncyt, profasis).
+    Si no se pasa `ipc`, se usa el deflactor del tipo en series.json
+    """
+    resultados, errores = procesar_lote([tipo], ipc)
+    if tipo in errores:
+        raise errores[tipo]
+    return resultados[tipo]
 
-    df["ajustado"] = np.where(
-        df["fecha"] < fecha_inicio,
-        df["salario"],
-        salario_base * (df["indice"] / indice_base)
-    )
+@medido()
+def guardar_salarios(tipo, df):
+    """
+    Guarda los datos procesados de un tipo
+    """
+    guardar_tabla(df, f"datos/{tipo}.csv", "salario_real")
+    guardar_tabla(df[df["fecha"] >= serie(tipo)["base_ajustado"]], f"datos/{tipo}_ajustado.csv", "ajustado")
 
-    df["salario_indice"] = df["salario"] / df["salario"].iloc[0]
-    df["nominal"] = df["salario"]
-    df["salario_real_indice"] = df["salario_indice"] / df["indice"]
-    df["salario_real"] = (df["salario"].iloc[-1] *
-                         df["salario_real_indice"] /
-                         df["salario_real_indice"].iloc[-1])
+def entradas_salidas(tipo):
+    """
+    Archivos de los que depende cada tipo y archivos que genera (para el manifiesto)
+    """
+    definicion = serie(tipo)
+    entradas = [definicion["crudo"], *archivos_deflactor(definicion["deflactor"]), "series.json",
+                "actualiza_datos.py", "registro_series.py", "proyeccion_ipc.py"]
+    salidas = [f"datos/{tipo}.csv", f"datos/{tipo}_ajustado.csv"]
+    salidas += [ruta_columnar(salida) for salida in salidas]
+    return entradas, salidas
 
-    return df
+def registro_error(tipo, etapa, error):
+    """
+    Entrada del reporte de errores: tipo, etapa ("procesar" o "guardar"),
+    clase de la excepción, mensaje y traceback
+    """
+    return {
+        "tipo": tipo,
+        "etapa": etapa,
+        "error": type(error).__name__,
+        "mensaje": str(error),
+        "traceback": "".join(traceback.format_exception(error)),
+    }
 
-def actualizar_datos():
+def procesar_y_guardar(tipos):
     """
-    Procesa todos los tipos de salarios y guarda los resultados
+    Procesa y guarda `tipos`. Retorna {tipo: None si salió bien, o su registro_error}.
+    Nunca lanza excepciones, así puede correr en un proceso aparte
     """
-    tipos = ["cic", "beca_conicet", "foncyt", "profasis", "art9", "resgarrahan"]
-    
+    try:
+        resultados, errores = procesar_lote(tipos)
+    except Exception as e:
+        return {tipo: registro_error(tipo, "procesar", e) for tipo in tipos}
+
+    estado = {}
     for tipo in tipos:
+        if tipo in errores:
+            estado[tipo] = registro_error(tipo, "procesar", errores[tipo])
+            continue
         try:
-            df = procesar_salarios(tipo)
-            
             # Guardar datos procesados
-            df[["fecha", "salario_real"]].to_csv(f"datos/{tipo}.csv", index=False)
-            df[df["fecha"] >= "2023-11-01"][["fecha", "nominal", "ajustado"]].to_csv(
-                f"datos/{tipo}_ajustado.csv", index=False)
-            
-            print(f"Procesamiento exitoso para {tipo}")
-            
+            guardar_salarios(tipo, resultados[tipo])
+            estado[tipo] = None
         except Exception as e:
-            print(f"Error procesando {tipo}: {e}")
+            estado[tipo] = registro_error(tipo, "guardar", e)
+    return estado
+
+def actualizar_datos(forzar=False, jobs=1):
+    """
+    Procesa los tipos de salarios cuyas entradas cambiaron desde la última corrida
+    (todos si `forzar`) y guarda los resultados. Con `jobs` > 1 cada tipo se procesa
+    en un proceso aparte; las salidas son idénticas a las de la corrida en serie.
+    Retorna la lista de errores (vacía si todo salió bien), que también se guarda
+    en datos/errores_actualiza_datos.json
+    """
+    manifiesto = cargar_manifiesto()
+    pendientes, omitidos = {}, []
+    for tipo in TIPOS:
+        motivo = "forzado" if forzar else verificar(manifiesto, "actualiza_datos", tipo, *entradas_salidas(tipo))
+        if motivo is None:
+            omitidos.append(tipo)
+        else:
+            pendientes[tipo] = motivo
+
+    if jobs > 1 and len(pendientes) > 1:
+        estado = {}
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for parcial in pool.map(procesar_y_guardar, [[tipo] for tipo in pendientes]):
+                estado.update(parcial)
+    else:
+        estado = procesar_y_guardar(list(pendientes)) if pendientes else {}
+
+    errores = []
+    for tipo in pendientes:
+        if estado[tipo] is not None:
+            errores.append(estado[tipo])
+            print(f"Error procesando {tipo}: {estado[tipo]['mensaje']}")
+            continue
+        registrar(manifiesto, "actualiza_datos", tipo, *entradas_salidas(tipo))
+        print(f"Procesamiento exitoso para {tipo}")
+
+    # Archivos derivados de todas las series: índice acumulado para expresarlas en
+    # pesos de cualquier mes (pesos_constantes.py) y cubo serie x mes x métrica
+    # mapeable en memoria (cubo_salarios.py)
+    from pesos_constantes import construir_indice_acumulado, ARCHIVO_INDICE
+    from cubo_salarios import construir_cubo, ARCHIVO_CUBO, ARCHIVO_CABECERA
+    entradas = sorted({archivo for tipo in TIPOS for archivo in entradas_salidas(tipo)[0]})
+    derivados = [
+        ("indice_acumulado", lambda: construir_indice_acumulado(TIPOS), [ARCHIVO_INDICE], "pesos_constantes.py"),
+        ("cubo_salarios", lambda: construir_cubo(procesar_lote(TIPOS)[0]), [ARCHIVO_CUBO, ARCHIVO_CABECERA],
+         "cubo_salarios.py"),
+    ]
+    for nombre, construir, salidas, codigo in derivados:
+        motivo = "forzado" if forzar else verificar(manifiesto, "actualiza_datos", nombre,
+                                                     entradas + [codigo], salidas)
+        if motivo is None:
+            omitidos.append(nombre)
+            continue
+        try:
+            with medir(nombre):
+                construir()
+            registrar(manifiesto, "actualiza_datos", nombre, entradas + [codigo], salidas)
+            pendientes[nombre] = motivo
+        except Exception as e:
+            errores.append(registro_error(nombre, "procesar", e))
+            print(f"Error procesando {nombre}: {e}")
+
+    guardar_manifiesto(manifiesto, etapas=["actualiza_datos"])
+    imprimir_resumen("actualiza_datos", {t: m for t, m in pendientes.items() if estado.get(t) is None}, omitidos)
+    guardar_reporte_errores(errores)
+    return errores
+
+def guardar_reporte_errores(errores, archivo=ARCHIVO_ERRORES):
+    """
+    Escribe el reporte de errores de la corrida (o lo borra si no hubo errores)
+    """
+    if not errores:
+        Path(archivo).unlink(missing_ok=True)
+        return
+    with open(archivo, "w", encoding="utf-8") as f:
+        json.dump(errores, f, ensure_ascii=False, indent=1)
+    print(f"\n{len(errores)} serie(s) con error; detalle en {archivo}")
 
 if __name__ == "__main__":
-    actualizar_datos()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Ajusta por inflación las series de salarios")
+    parser.add_argument("--forzar", action="store_true",
+                        help="Recalcula todos los tipos aunque sus entradas no hayan cambiado")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Cantidad de procesos para procesar los tipos en paralelo")
+    args = parser.parse_args()
+    sys.exit(1 if actualizar_datos(forzar=args.forzar, jobs=args.jobs) else 0)
@@ -2,35 +2,151 @@ import pandas as pd
 import numpy as np
 import xlrd 
 import urllib.request
+import urllib.error
 import os
+import json
+import shutil
+import hashlib
+import argparse
+import threading
+import re
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from proyeccion_ipc import extender_ipc, REGLAS
+from tablas import guardar_tabla
+from instrumentacion import medido
 
+INDEC_URL = "https://www.indec.gob.ar/ftp/cuadros/economia"
+HOJA_INDICES = "Índices IPC Cobertura Nacional"
+SERIE_NACIONAL = "nacional.nivel_general"
+CACHE_DIR = Path("datos") / "cache_ipc"
+cache_stats = {"aciertos": 0, "fallos": 0}
+_cache_lock = threading.Lock()
+
+def _hash_archivo(filename):
+    """
+    Calcula el SHA-256 del contenido de un archivo
+    """
+    h = hashlib.sha256()
+    with open(filename, "rb") as f:
+        for bloque in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+def _slug(texto):
+    texto = unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]+", "_", texto.lower()).strip("_")
+
+def _extraer_series_xls(filename):
+    """
+    Extrae en una sola pasada todas las series de la hoja de índices nacionales
+    (nivel general, divisiones COICOP, categorías y bienes/servicios de cada región).
+    Retorna (fechas, nombres, matriz meses x series)
+    """
+    workbook = xlrd.open_workbook(filename)
+    sheet = workbook.sheet_by_name(HOJA_INDICES)
+
+    celdas = np.array([sheet.row_values(r) for r in range(sheet.nrows)], dtype=object)
+    tipos = np.array([sheet.row_types(r) for r in range(sheet.nrows)])
+    numerico = tipos == xlrd.XL_CELL_NUMBER
+    es_fecha = tipos == xlrd.XL_CELL_DATE
+    etiquetas = np.array([str(x).strip() for x in celdas[:, 0]])
+
+    # Filas de encabezado de región ("Total nacional", "Región GBA", ...) con las fechas
+    es_region = es_fecha[:, 1] & (np.char.startswith(etiquetas, "Total nacional") |
+                                  np.char.startswith(etiquetas, "Región"))
+    filas_region = np.flatnonzero(es_region)
+    # Para cada fila, la región a la que pertenece (la última cabecera anterior)
+    region_de_fila = np.maximum.accumulate(np.where(es_region, np.arange(len(es_region)), -1))
+    filas = np.flatnonzero(numerico[:, 1] & (region_de_fila >= 0))
+
+    # Meses: desde la columna 2 (la columna 1 es diciembre 2016 = 100)
+    columnas = np.flatnonzero(es_fecha[filas_region[0], 2:]) + 2
+    fechas = np.array([xlrd.xldate_as_datetime(celdas[filas_region[0], c], workbook.datemode)
+                       for c in columnas], dtype="datetime64[M]")
+
+    regiones = {r: _slug(etiquetas[r].replace("Total ", "").replace("Región ", "")) for r in filas_region}
+    nombres = np.array([f"{regiones[region_de_fila[r]]}.{_slug(etiquetas[r])}" for r in filas])
+
+    bloque = celdas[np.ix_(filas, columnas)]
+    valores = np.where(numerico[np.ix_(filas, columnas)], bloque, np.nan).astype(np.float64).T
+    return fechas, nombres, valores
+
+def leer_series_ipc(filename):
+    """
+    Retorna (fechas, nombres, valores) de todas las series del archivo XLS usando
+    una caché por hash de contenido. Si el archivo no cambió, no se vuelve a abrir con xlrd.
+    """
+    filename = Path(filename)
+    digest = _hash_archivo(filename)
+    cache_path = CACHE_DIR / f"{filename.stem}.{digest[:16]}.npz"
+
+    if cache_path.exists():
+        with _cache_lock:
+            cache_stats["aciertos"] += 1
+        print(f"Caché IPC: acierto para {filename.name}")
+        with np.load(cache_path) as cache:
+            return cache["fechas"], cache["nombres"], cache["valores"]
+
+    with _cache_lock:
+        cache_stats["fallos"] += 1
+    print(f"Caché IPC: fallo para {filename.name}, leyendo XLS...")
+    fechas, nombres, valores = _extraer_series_xls(filename)
+
+    # Invalidar entradas previas del mismo archivo (contenido distinto)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    for viejo in CACHE_DIR.glob(f"{filename.stem}.*"):
+        viejo.unlink()
+    temp_path = cache_path.with_suffix(".tmp")
+    with open(temp_path, "wb") as f:
+        np.savez(f, fechas=fechas, nombres=nombres, valores=valores)
+    os.replace(temp_path, cache_path)
+    return fechas, nombres, valores
+
+def leer_valores_ipc(filename):
+    """
+    Retorna los índices IPC nacionales (nivel general) del archivo XLS
+    """
+    _, nombres, valores = leer_series_ipc(filename)
+    return valores[:, list(nombres).index(SERIE_NACIONAL)]
+
+@medido()
 def read_ipc_from_xls(filename, start_date="2017-01-01"):
     """
     Lee valores de IPC desde archivo XLS y retorna DataFrame
     """
-    # Leer archivo XLS
-    workbook = xlrd.open_workbook(filename)
-    sheet = workbook.sheet_by_name("Índices IPC Cobertura Nacional")
-    
-    # Extraer valores
-    ipc_values = []
-    for col in range(2, sheet.ncols):
-        value = sheet.cell_value(9, col)
-        if value:
-            ipc_values.append(value)
+    # Extraer valores (desde la caché si el archivo no cambió)
+    ipc_values = leer_valores_ipc(filename)
     
     # Crear fechas y DataFrame
     ipc_dates = pd.date_range(start=start_date, periods=len(ipc_values), freq='MS')
     
     ipc = pd.read_csv("datos/ipc_crudo.csv", parse_dates=["fecha"])
     ultimo_indice = ipc["indice"].iloc[-1]
-    ipc_values = [x * ultimo_indice/100 for x in ipc_values]
+    ipc_values = ipc_values * ultimo_indice / 100
     ipc2 = pd.DataFrame({"fecha": ipc_dates, "indice": ipc_values})
     ipc = pd.concat([ipc, ipc2], ignore_index=True)
 
     return ipc
 
+@medido()
+def read_ipc_series_from_xls(filename):
+    """
+    Lee todas las series de IPC (regiones, divisiones y categorías) y retorna un
+    DataFrame mes x serie. Se reescalan con el mismo factor que el nivel general
+    (ipc_crudo.csv), de modo que la serie nacional coincide con la columna
+    "indice" de ipc_nuevo.csv.
+    """
+    fechas, nombres, valores = leer_series_ipc(filename)
+
+    ipc = pd.read_csv("datos/ipc_crudo.csv", parse_dates=["fecha"])
+    ultimo_indice = ipc["indice"].iloc[-1]
+
+    series = pd.DataFrame(valores * ultimo_indice / 100, columns=nombres)
+    series.insert(0, "fecha", pd.to_datetime(fechas))
+    return series
+
 def parse_ipc_filename(filename):
     """
     Parse IPC filename to extract month and year
@@ -41,31 +157,155 @@ def parse_ipc_filename(filename):
     year = int(parts[3])   # Get year number
     return month, year
 
-def download_ipc_file(filename, data_dir):
+def ipc_filename_offset(filename, months):
+    """
+    Returns the IPC filename `months` months after the given one
+    """
+    month, year = parse_ipc_filename(filename)
+    total = (year * 12 + month - 1) + months
+    return f"sh_ipc_{total % 12 + 1:02d}_{(total // 12) % 100:02d}.xls"
+
+def _sidecar_path(path):
+    return path.with_name(path.name + ".json")
+
+def _leer_sidecar(path):
     """
-    Downloads IPC file from INDEC website
+    Reads the checksum/validator sidecar of a downloaded file (empty dict if missing)
     """
-    url = f"https://www.indec.gob.ar/ftp/cuadros/economia/{filename}"
+    try:
+        with open(_sidecar_path(path), "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _escribir_sidecar(path, meta):
+    with open(_sidecar_path(path), "w") as f:
+        json.dump(meta, f, indent=2)
+
+def _descargar(url, final_path):
+    """
+    Transfers url into final_path using conditional and ranged requests.
+    Returns False if the server reports that the local copy is up to date.
+    """
+    part_path = final_path.with_name(final_path.name + ".part")
+    meta = _leer_sidecar(final_path)
+    tiene_copia = (final_path.exists() and "sha256" in meta
+                   and meta["sha256"] == _hash_archivo(final_path))
+
+    request = urllib.request.Request(url)
+    offset = 0
+    if tiene_copia:
+        if meta.get("etag"):
+            request.add_header("If-None-Match", meta["etag"])
+        if meta.get("last_modified"):
+            request.add_header("If-Modified-Since", meta["last_modified"])
+    elif part_path.exists() and (meta.get("etag") or meta.get("last_modified")):
+        # Resume an interrupted transfer only if the remote file did not change
+        offset = part_path.stat().st_size
+        request.add_header("Range", f"bytes={offset}-")
+        request.add_header("If-Range", meta.get("etag") or meta["last_modified"])
+
+    try:
+        response = urllib.request.urlopen(request, timeout=60)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return False
+        if e.code == 416 and part_path.exists():
+            # Stale partial file, start over
+            part_path.unlink()
+            return _descargar(url, final_path)
+        raise
+
+    with response:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if tiene_copia and (etag or last_modified) and \
+                etag == meta.get("etag") and last_modified == meta.get("last_modified"):
+            # Servers (and file:// mirrors) that ignore conditional headers
+            return False
+
+        # file:// responses carry no status code
+        status = getattr(response, "status", None) or 200
+        content_range = response.headers.get("Content-Range", "")
+        if status == 206 and content_range.startswith(f"bytes {offset}-"):
+            print(f"Resuming {final_path.name} from byte {offset}")
+            mode = "ab"
+        else:
+            mode = "wb"
+
+        _escribir_sidecar(final_path, {"etag": etag, "last_modified": last_modified})
+        with open(part_path, mode) as f:
+            shutil.copyfileobj(response, f, 1 << 16)
+
+    os.replace(part_path, final_path)
+    _escribir_sidecar(final_path, {
+        "etag": etag,
+        "last_modified": last_modified,
+        "sha256": _hash_archivo(final_path),
+        "size": final_path.stat().st_size,
+    })
+    return True
+
+def download_ipc_file(filename, data_dir, base_url=INDEC_URL):
+    """
+    Downloads IPC file from INDEC website (or from a file:// mirror).
+    Unchanged files are not transferred again and interrupted
+    transfers resume from the .part file.
+    """
+    url = f"{base_url}/{filename}"
     temp_path = data_dir / filename
     try:
-        urllib.request.urlretrieve(url, temp_path)
-        # Verify it's a valid Excel file
+        if not _descargar(url, temp_path):
+            print(f"{filename} unchanged, skipping download")
+        # Verify it's a valid Excel file (parsing also populates the cache)
         try:
-            xlrd.open_workbook(temp_path)
+            leer_valores_ipc(temp_path)
             return True
         except Exception as e:
             # Not a valid Excel file, remove it
             if temp_path.exists():
                 temp_path.unlink()
+            _sidecar_path(temp_path).unlink(missing_ok=True)
             print(f"Downloaded file is not valid: {e}")
             return False
+    except urllib.error.HTTPError as e:
+        if e.code == 404:
+            # Expected while probing months INDEC has not published yet
+            print(f"{filename} not published yet (404)")
+        else:
+            print(f"Error downloading {filename}: {e}")
+        return False
     except Exception as e:
         print(f"Error downloading {filename}: {e}")
         return False
 
-def update_ipc_data(df):
+def url_espejo(directorio):
+    """
+    Convierte un directorio local con copias de los XLS en una URL base file://
+    """
+    return Path(directorio).resolve().as_uri()
+
+@medido(categoria="descarga")
+def buscar_ipc_reciente(current_file, data_dir, ventana=1, max_workers=4, base_url=INDEC_URL):
+    """
+    Prueba en paralelo los `ventana` archivos posteriores a `current_file`
+    y retorna el nombre del más reciente que sea válido (o None)
+    """
+    candidatos = [ipc_filename_offset(current_file, k) for k in range(1, ventana + 1)]
+    print(f"Verificando si existe archivo más reciente: {', '.join(candidatos)}...")
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(candidatos))) as executor:
+        resultados = list(executor.map(
+            lambda nombre: download_ipc_file(nombre, data_dir, base_url), candidatos))
+
+    validos = [nombre for nombre, ok in zip(candidatos, resultados) if ok]
+    return validos[-1] if validos else None
+
+@medido()
+def update_ipc_data(df, ventana=1, max_workers=4, base_url=INDEC_URL, regla="crecimiento"):
     """
-    Actualiza datos de IPC si es necesario
+    Actualiza datos de IPC si es necesario.
+    Con ventana > 1 busca en paralelo varios meses hacia adelante (modo de puesta al día).
     """
     data_dir = Path("datos")
     data_dir.mkdir(exist_ok=True)
@@ -81,11 +321,12 @@ def update_ipc_data(df):
     # Descargar archivo si no existe
     if not current_path.exists():
         print(f"Archivo {current_file} no encontrado. Descargando del sitio de INDEC...")
-        if not download_ipc_file(current_file, data_dir):
+        if not download_ipc_file(current_file, data_dir, base_url):
             print(f"No se pudo descargar {current_file}")
             return None
     
     # Leer IPC actual
+    ipc_path = current_path
     try:
         ipc = read_ipc_from_xls(current_path)
     except Exception as e:
@@ -94,51 +335,63 @@ def update_ipc_data(df):
 
     # Intentar descargar archivo más reciente
     try:
-        current_month, current_year = parse_ipc_filename(current_file)
-        # Calcular próximo mes
-        next_month = current_month + 1
-        next_year = current_year
-        if next_month > 12:
-            next_month = 1
-            next_year += 1
-        
-        next_file = f"sh_ipc_{next_month:02d}_{next_year % 100:02d}.xls"
-        print(f"Verificando si existe archivo más reciente: {next_file}...")
-        
-        if download_ipc_file(next_file, data_dir):
+        next_file = buscar_ipc_reciente(current_file, data_dir, ventana, max_workers, base_url)
+
+        if next_file is not None:
             print(f"Archivo {next_file} descargado exitosamente. Actualizando datos...")
-            ipc = read_ipc_from_xls(data_dir / next_file)
+            ipc_path = data_dir / next_file
+            ipc = read_ipc_from_xls(ipc_path)
             # Update version file only if new file is valid
             with open("version_IPC.txt", "w") as f:
                 f.write(next_file)
         else:
-            print(f"Archivo {next_file} no disponible. Usando {current_file}...")
+            print(f"No hay archivo más reciente disponible. Usando {current_file}...")
     except Exception as e:
         print(f"Error al intentar descargar archivo más reciente: {e}")
 
     # Estimar meses faltantes si es necesario
-    while ipc["fecha"].max() < df["fecha"].max():
-        print(f"Falta dato de IPC para {(ipc['fecha'].max() + pd.DateOffset(months=1)).strftime('%Y-%m')}. Estimando...")
-        ultimo_indice = ipc["indice"].iloc[-1] * (ipc["indice"].iloc[-1] / ipc["indice"].iloc[-2])
-        siguiente_fecha = ipc["fecha"].max() + pd.DateOffset(months=1)
-        ipc = pd.concat([ipc, pd.DataFrame({
-            "fecha": [siguiente_fecha],
-            "indice": [ultimo_indice]
-        })], ignore_index=True)
+    faltantes = pd.date_range(ipc["fecha"].max() + pd.DateOffset(months=1), df["fecha"].max(), freq="MS")
+    for fecha in faltantes:
+        print(f"Falta dato de IPC para {fecha.strftime('%Y-%m')}. Estimando...")
+    ipc = extender_ipc(ipc, df["fecha"].max(), regla=regla)
 
     # Guardar datos actualizados
-    ipc.to_csv(data_dir / "ipc_nuevo.csv", index=False)
+    guardar_tabla(ipc, data_dir / "ipc_nuevo.csv", "ipc")
+    # Todas las series (regiones, divisiones, categorías) del mismo archivo
+    read_ipc_series_from_xls(ipc_path).to_csv(data_dir / "ipc_series.csv", index=False)
     return ipc
 
 def main():
     """
     Función principal
     """
+    parser = argparse.ArgumentParser(description="Actualiza los datos de IPC desde INDEC")
+    parser.add_argument("--ventana", type=int, default=1,
+                        help="Cantidad de meses posteriores a probar en paralelo (puesta al día)")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Máximo de descargas simultáneas")
+    parser.add_argument("--url-base", default=INDEC_URL,
+                        help="URL base del directorio de cuadros de INDEC")
+    parser.add_argument("--espejo", default=os.environ.get("IPC_ESPEJO"),
+                        help="Directorio local con copias de los XLS (reemplaza a --url-base)")
+    parser.add_argument("--regla", choices=REGLAS, default="crecimiento",
+                        help="Regla para estimar los meses de IPC aún no publicados")
+    args = parser.parse_args()
+    if args.espejo:
+        args.url_base = url_espejo(args.espejo)
+
     try:
-        df = pd.read_csv("datos/crudo_cic.csv", parse_dates=["fecha"])
-        ipc = update_ipc_data(df)
+        # Extender el IPC hasta el último salario de cualquier serie de series.json
+        from registro_series import ultima_fecha_salarios
+        df = pd.DataFrame({"fecha": [ultima_fecha_salarios()]})
+        ipc = update_ipc_data(df, ventana=args.ventana, max_workers=args.workers,
+                              base_url=args.url_base, regla=args.regla)
         if ipc is not None:
             print("Actualización de IPC completada exitosamente")
+            # Registrar la versión descargada en el almacén de versiones
+            from versiones_ipc import actualizar_versiones
+            actualizar_versiones()
+        print(f"Caché IPC: {cache_stats['aciertos']} aciertos, {cache_stats['fallos']} fallos")
     except Exception as e:
         print(f"Error en el proceso: {e}")
 
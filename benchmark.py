@@ -0,0 +1,381 @@
+"""
+Benchmarks con series sintéticas de IPC y salarios a escala creciente.
+
+Mide el ajuste por inflación de _procesar_grupo, el núcleo vectorizado de
+procesar_salarios sin la lectura de archivos (10, 100 y 10.000 series de 100 y
+1.000 meses, con inflación normal y con hiperinflación), la extensión de
+meses de IPC sin publicar (extender_ipc), el empalme de la serie histórica de
+profasis de graf_cic.py, los escenarios de proyeccion_profasis.py y el dibujo
+de un gráfico (plot_nominal_vs_adjusted).
+
+Cada caso corre una vez sin medir y después se repite al menos REPETICIONES
+veces y TIEMPO_MINIMO_S segundos (o hasta agotar PRESUPUESTO_S), de modo que
+los casos de pocos ms juntan cientos de muestras. Se guarda el mínimo y la
+mediana en datos/benchmark.json, junto con la comparación contra la base
+(datos/benchmark_base.json).
+
+Antes de cada caso se mide una carga fija de referencia (~10 ms de Python y
+numpy); la mediana del caso se divide por cuánto cambió la referencia respecto
+de la base, lo que descuenta la deriva de toda la máquina (en un equipo
+compartido corridas enteras salen 20-35% más lentas o más rápidas). Un caso
+cuenta como regresión si su mediana normalizada empeora más que --umbral y,
+además, en más de --piso segundos. Con el código sin cambios, la variación
+normalizada entre corridas queda típicamente dentro de ±10% y llega a ~20% en
+los casos más cortos, así que el umbral de 25% sólo salta con regresiones
+reales; sin la normalización el mismo código marcaba regresiones de +25-34%.
+
+Si hay regresiones el script termina con código 1. Los tiempos dependen de la
+máquina, así que la base no se versiona: se toma con --guardar-base en la misma
+máquina, y sin base el script termina con código 2 en lugar de pasar sin
+comparar nada.
+
+Uso:
+    python benchmark.py                  # todo, compara con la base
+    python benchmark.py --rapido         # sin 10.000 series ni gráficos
+    python benchmark.py --guardar-base   # toma esta corrida como base
+    python benchmark.py --solo extender_ipc --solo escenarios
+"""
+
+import argparse
+import atexit
+import json
+import logging
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ARCHIVO_RESULTADOS = Path("datos") / "benchmark.json"
+ARCHIVO_BASE = Path("datos") / "benchmark_base.json"
+# Cada caso corre al menos REPETICIONES veces y al menos TIEMPO_MINIMO_S segundos
+# (los casos de pocos ms suman cientos de repeticiones), hasta PRESUPUESTO_S
+REPETICIONES = 5
+MAX_REPETICIONES = 1000
+TIEMPO_MINIMO_S = 0.5
+PRESUPUESTO_S = 3.0
+UMBRAL = 0.25
+# Diferencia absoluta de medianas por debajo de la cual no hay regresión
+PISO_S = 0.0005
+SEMILLA = 2015
+
+SERIES = (10, 100, 10_000)
+MESES = (100, 1000)
+# Inflación mensual media; "hiper" multiplica los precios por ~10^170 en 1000 meses
+INFLACIONES = {"normal": 0.03, "hiper": 0.5}
+# 10.000 series x 1.000 meses ocupa varios GB como DataFrames; sólo con --completo
+MAX_CELDAS = 2_000_000
+
+
+# =====================
+# Datos sintéticos
+# =====================
+
+def ipc_sintetico(meses, inflacion, rng, inicio="1990-01-01"):
+    """IPC mensual (fecha, indice) con variaciones lognormales alrededor de `inflacion`"""
+    tasas = inflacion * rng.lognormal(0, 0.3, meses)
+    return pd.DataFrame({
+        "fecha": pd.date_range(inicio, periods=meses, freq="MS"),
+        "indice": 100 * np.cumprod(1 + tasas),
+    })
+
+
+def salarios_sinteticos(n_series, ipc, rng):
+    """
+    {tipo: DataFrame fecha, salario} que siguen al IPC con aumentos escalonados.
+    Cada serie empieza en un mes al azar de la primera mitad, así todas cubren
+    el mes base (el del medio). Los salarios son float: con hiperinflación
+    superan el rango de int64
+    """
+    meses = len(ipc)
+    indice = ipc["indice"].to_numpy()
+    crudos = {}
+    for k in range(n_series):
+        inicio = int(rng.integers(0, meses // 2))
+        # Paritarias cada 3 meses que recuperan entre 80% y 105% de la inflación
+        paso = np.repeat(indice[inicio::3], 3)[:meses - inicio]
+        recuperacion = np.cumprod(rng.uniform(0.995, 1.001, meses - inicio))
+        crudos[f"serie_{k}"] = pd.DataFrame({
+            "fecha": ipc["fecha"].iloc[inicio:].to_numpy(),
+            "salario": np.round(1000 * paso / paso[0] * recuperacion),
+        })
+    return crudos
+
+
+def ajustado_sintetico(meses, rng):
+    """Tabla fecha, nominal, ajustado en el rango de pesos de los gráficos reales"""
+    crecimiento = 4 ** (1 / meses)
+    ajustado = 600_000 * crecimiento ** np.arange(meses)
+    nominal = ajustado * np.cumprod(rng.uniform(0.995, 1.004, meses))
+    return pd.DataFrame({
+        "fecha": pd.date_range("2015-12-01", periods=meses, freq="MS"),
+        "nominal": np.round(nominal).astype(np.int64),
+        "ajustado": ajustado,
+    })
+
+
+# =====================
+# Casos
+# =====================
+
+def casos(rapido=False, completo=False):
+    """
+    Lista de (grupo, parámetros, preparar) donde preparar() retorna la función
+    sin argumentos a medir (la preparación de datos no se mide)
+    """
+    lista = []
+
+    def procesar(n_series, meses, inflacion):
+        def preparar():
+            from actualiza_datos import _procesar_grupo
+            rng = np.random.default_rng(SEMILLA)
+            ipc = ipc_sintetico(meses, INFLACIONES[inflacion], rng)
+            crudos = salarios_sinteticos(n_series, ipc, rng)
+            base = ipc["fecha"].iloc[meses // 2]
+            return lambda: _procesar_grupo(crudos, ipc, base, {})
+        return preparar
+
+    for n_series in SERIES:
+        if rapido and n_series > 100:
+            continue
+        for meses in MESES:
+            if n_series * meses > MAX_CELDAS and not completo:
+                continue
+            for inflacion in INFLACIONES:
+                lista.append(("procesar_grupo", {"series": n_series, "meses": meses, "inflacion": inflacion},
+                              procesar(n_series, meses, inflacion)))
+
+    def extension(meses, faltan, regla, inflacion):
+        def preparar():
+            from proyeccion_ipc import extender_ipc
+            rng = np.random.default_rng(SEMILLA)
+            ipc = ipc_sintetico(meses, INFLACIONES[inflacion], rng)
+            hasta = ipc["fecha"].iloc[-1] + pd.DateOffset(months=faltan)
+            tasas = pd.Series(INFLACIONES[inflacion],
+                              index=pd.date_range(ipc["fecha"].iloc[-1], periods=7, freq="MS"))
+            return lambda: extender_ipc(ipc, hasta, regla=regla, tasas=tasas)
+        return preparar
+
+    for meses in MESES:
+        for faltan in (1, 12, 120):
+            for regla in ("crecimiento", "rem", "promedio"):
+                for inflacion in INFLACIONES:
+                    lista.append(("extender_ipc", {"meses": meses, "faltan": faltan, "regla": regla,
+                                                   "inflacion": inflacion},
+                                  extension(meses, faltan, regla, inflacion)))
+
+    def empalme(meses, inflacion):
+        def preparar():
+            from graf_cic import empalmar_profasis
+            rng = np.random.default_rng(SEMILLA)
+            ipc = ipc_sintetico(meses, INFLACIONES[inflacion], rng, inicio="2015-12-01")
+            # El empalme toma como referencia el salario real de 2026-01: el nominal
+            # cubre todo el rango y la serie base 100 sólo la primera mitad
+            nominal = pd.DataFrame({
+                "fecha": ipc["fecha"],
+                "salario": np.round(1000 * ipc["indice"] / ipc["indice"].iloc[0]
+                                    * np.cumprod(rng.uniform(0.995, 1.001, meses))),
+            })
+            mitad = ipc["fecha"].iloc[: meses // 2]
+            base100 = pd.DataFrame({"fecha": mitad, "indice": 100 * np.cumprod(rng.uniform(0.97, 1.02, len(mitad)))})
+            return lambda: empalmar_profasis(nominal.copy(), base100, ipc)
+        return preparar
+
+    for meses in MESES:
+        for inflacion in INFLACIONES:
+            lista.append(("empalme_profasis", {"meses": meses, "inflacion": inflacion}, empalme(meses, inflacion)))
+
+    def escenarios(meses, variante):
+        def preparar():
+            from proyeccion_profasis import proyectar_escenario
+            rng = np.random.default_rng(SEMILLA)
+            fechas = pd.date_range("2026-03-01", periods=meses, freq="MS")
+            ipc_mensual = pd.DataFrame({"fecha": fechas, "ipc_mensual": rng.uniform(1, 4, meses)})
+            opciones = {
+                "ipc": {},
+                "aumentos": {"aumentos": {d: 50_000 for d in fechas if d.month in (3, 7, 9)}},
+                "recortes": {"recortes": np.linspace(0.2, 1.3, meses)},
+            }[variante]
+            return lambda: proyectar_escenario(1_500_000, fechas, ipc_mensual, **opciones)
+        return preparar
+
+    for meses in (12, 100, 1000):
+        for variante in ("ipc", "aumentos", "recortes"):
+            lista.append(("escenarios", {"meses": meses, "variante": variante}, escenarios(meses, variante)))
+
+    def dibujo(meses, directorio):
+        def preparar():
+            from graf_cic import plot_nominal_vs_adjusted
+            rng = np.random.default_rng(SEMILLA)
+            csv_file = Path(directorio) / f"ajustado_{meses}.csv"
+            ajustado_sintetico(meses, rng).to_csv(csv_file, index=False)
+            # plot_nominal_vs_adjusted guarda en plots/ relativo al directorio actual
+            salida = os.path.relpath(Path(directorio) / f"grafico_{meses}.png", "plots")
+            return lambda: plot_nominal_vs_adjusted(str(csv_file), "Sintético", "Benchmark", salida)
+        return preparar
+
+    if not rapido:
+        directorio = tempfile.mkdtemp(prefix="benchmark_")
+        atexit.register(shutil.rmtree, directorio, True)
+        # Con 1.000 meses el MonthLocator de los gráficos supera MAXTICKS y avisa en cada dibujo
+        logging.getLogger("matplotlib.ticker").setLevel(logging.ERROR)
+        for meses in MESES:
+            lista.append(("grafico", {"meses": meses}, dibujo(meses, directorio)))
+    return lista
+
+
+# =====================
+# Medición y comparación
+# =====================
+
+def referencia():
+    """
+    Trabajo fijo (bucle de Python y operaciones de numpy, ~10 ms) que se mide
+    antes de cada caso: su tiempo sigue a la velocidad de la máquina en ese momento
+    """
+    total = 0
+    for i in range(80_000):
+        total += i % 7
+    valores = np.linspace(1.0, 2.0, 800_000)
+    return total + float(np.cumprod(valores / valores.sum()).sum())
+
+
+def clave(grupo, parametros):
+    return "/".join([grupo] + [f"{k}={v}" for k, v in parametros.items()])
+
+
+def medir_tiempo(funcion, repeticiones=REPETICIONES, minimo=TIEMPO_MINIMO_S, presupuesto=PRESUPUESTO_S):
+    """
+    Corre `funcion` una vez sin medir (cachés, imports) y luego la repite hasta
+    haber hecho `repeticiones` corridas y sumado `minimo` segundos, sin pasar de
+    MAX_REPETICIONES ni de `presupuesto` segundos (siempre al menos una).
+    Retorna (tiempos)
+    """
+    funcion()
+    tiempos = []
+    inicio = time.perf_counter()
+    while not tiempos or len(tiempos) < MAX_REPETICIONES:
+        transcurrido = time.perf_counter() - inicio
+        if tiempos and (transcurrido >= presupuesto or
+                        (len(tiempos) >= repeticiones and transcurrido >= minimo)):
+            break
+        t = time.perf_counter()
+        funcion()
+        tiempos.append(time.perf_counter() - t)
+    return tiempos
+
+
+def comparar(resultados, base, umbral, piso=PISO_S):
+    """
+    {caso: {base_s, actual_s, escala, cambio, regresion}} para los casos presentes
+    en ambas corridas. La mediana actual se divide por `escala` (cuánto más lenta
+    corrió la referencia que en la base) y `cambio` es su variación relativa. Es
+    regresión si supera `umbral` y la mediana escalada además creció más de `piso`
+    segundos
+    """
+    comparacion = {}
+    for caso, actual in resultados["casos"].items():
+        previo = base.get("casos", {}).get(caso)
+        if previo is None:
+            continue
+        escala = 1.0
+        if actual.get("referencia_s") and previo.get("referencia_s"):
+            escala = actual["referencia_s"] / previo["referencia_s"]
+        actual_s = actual["mediana_s"] / escala
+        cambio = actual_s / previo["mediana_s"] - 1
+        comparacion[caso] = {
+            "base_s": previo["mediana_s"],
+            "actual_s": actual_s,
+            "escala": round(escala, 4),
+            "cambio": round(cambio, 4),
+            "regresion": cambio > umbral and actual_s - previo["mediana_s"] > piso,
+        }
+    return comparacion
+
+
+def correr(lista, solo=None):
+    resultados = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "plataforma": platform.platform(),
+        "casos": {},
+    }
+    for grupo, parametros, preparar in lista:
+        if solo and grupo not in solo:
+            continue
+        caso = clave(grupo, parametros)
+        funcion = preparar()
+        tiempo_referencia = statistics.median(medir_tiempo(referencia, repeticiones=9, minimo=0.1))
+        tiempos = medir_tiempo(funcion)
+        resultados["casos"][caso] = {
+            "grupo": grupo,
+            "parametros": parametros,
+            "min_s": min(tiempos),
+            "mediana_s": statistics.median(tiempos),
+            "repeticiones": len(tiempos),
+            "referencia_s": tiempo_referencia,
+        }
+        print(f"{caso:<75} {min(tiempos) * 1000:>11.3f} ms  (x{len(tiempos)})")
+    return resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks con series sintéticas")
+    parser.add_argument("--rapido", action="store_true", help="Omitir 10.000 series y el dibujo de gráficos")
+    parser.add_argument("--completo", action="store_true", help="Incluir 10.000 series x 1.000 meses")
+    parser.add_argument("--solo", action="append",
+                        choices=["procesar_grupo", "extender_ipc", "empalme_profasis", "escenarios", "grafico"],
+                        help="Correr sólo este grupo (se puede repetir)")
+    parser.add_argument("--umbral", type=float, default=UMBRAL,
+                        help="Empeoramiento relativo del mínimo que cuenta como regresión (0.25 = 25%%)")
+    parser.add_argument("--piso", type=float, default=PISO_S,
+                        help="Aumento absoluto mínimo de la mediana, en segundos, para contar una regresión")
+    parser.add_argument("--salida", default=str(ARCHIVO_RESULTADOS), help="Archivo JSON de resultados")
+    parser.add_argument("--base", default=str(ARCHIVO_BASE), help="Archivo JSON con la corrida base")
+    parser.add_argument("--guardar-base", action="store_true", help="Guardar esta corrida como nueva base")
+    args = parser.parse_args()
+
+    resultados = correr(casos(args.rapido, args.completo), args.solo)
+
+    base_path = Path(args.base)
+    regresiones = []
+    if base_path.exists():
+        with open(base_path, encoding="utf-8") as f:
+            base = json.load(f)
+        resultados["base"] = {"archivo": str(base_path), "fecha": base.get("fecha")}
+        resultados["comparacion"] = comparar(resultados, base, args.umbral, args.piso)
+        print(f"\n=== Comparación con {base_path} ({base.get('fecha')}) ===")
+        for caso, c in resultados["comparacion"].items():
+            marca = "  REGRESIÓN" if c["regresion"] else ""
+            print(f"{caso:<75} {c['base_s'] * 1000:>11.3f} -> {c['actual_s'] * 1000:>11.3f} ms "
+                  f"({c['cambio']:+.1%}, escala {c['escala']:.2f}){marca}")
+        regresiones = [caso for caso, c in resultados["comparacion"].items() if c["regresion"]]
+
+    with open(args.salida, "w", encoding="utf-8") as f:
+        json.dump(resultados, f, ensure_ascii=False, indent=1)
+    print(f"\nResultados en {args.salida}")
+    if args.guardar_base:
+        with open(base_path, "w", encoding="utf-8") as f:
+            json.dump(resultados, f, ensure_ascii=False, indent=1)
+        print(f"Base guardada en {base_path}")
+    elif not base_path.exists():
+        print(f"\nNo hay base en {base_path}: no se comparó nada. "
+              f"Correr con --guardar-base para tomar esta corrida como base", file=sys.stderr)
+        sys.exit(2)
+
+    if regresiones:
+        print(f"\n{len(regresiones)} caso(s) con regresión mayor a {args.umbral:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""
+Modo borrador (--draft) para iterar sobre el diseño de los gráficos.
+
+graf_cic.py, proyeccion_profasis.py y proyecta_nov2027.py aceptan --draft: los
+PNG se guardan a DPI bajo en DIRECTORIO (no en plots/), sin los ejes Y espejados
+a la derecha, y sin tocar el manifiesto ni las claves de dibujo. La corrida
+normal no cambia.
+
+    python graf_cic.py --draft --only art9
+    python proyeccion_profasis.py --draft
+"""
+
+from pathlib import Path
+
+import matplotlib
+
+DIRECTORIO = Path("plots_borrador")
+DPI = 60
+
+activo = False
+
+
+def activar():
+    """Pasa a modo borrador: savefig usa DPI y las salidas van a DIRECTORIO"""
+    global activo
+    activo = True
+    # Las figuras se crean con dpi=300 para el diseño; sólo baja la resolución al guardar
+    matplotlib.rcParams["savefig.dpi"] = DPI
+    DIRECTORIO.mkdir(exist_ok=True)
+
+
+def salida(ruta):
+    """Ruta donde guardar `ruta` (plots/...): la misma, o en DIRECTORIO en modo borrador"""
+    return str(DIRECTORIO / Path(ruta).name) if activo else ruta
@@ -0,0 +1,207 @@
+"""
+Consultas sobre las series salariales para usar desde notebooks u otros servicios.
+
+    from consultas import serie, ipc, real, perdida_desde, proyeccion
+    real("cic", base="2019-12")
+    perdida_desde("profasis", "2023-11")
+    proyeccion("cic", "congelado", hasta="2026-12")
+
+Todo se calcula con procesar_salarios y extender_ipc, los mismos que usan los
+scripts; real() en pesos de otro mes base multiplica por el índice acumulado de
+pesos_constantes.py (datos/indice_acumulado.npz), igual que `python
+pesos_constantes.py --base`. Cada resultado se memoriza en un caché LRU cuya
+clave incluye el hash SHA-256 de los archivos de entrada (CSV crudo, IPC,
+series.json y el código); los hashes se recalculan sólo cuando cambia la fecha
+de modificación o el tamaño de un archivo, así que una consulta repetida cuesta
+microsegundos y una consulta después de actualizar los datos se recalcula sola.
+"""
+
+import inspect
+import os
+from functools import lru_cache, wraps
+
+import numpy as np
+import pandas as pd
+
+import pesos_constantes
+from actualiza_datos import procesar_salarios, entradas_salidas
+from manifiesto import hash_archivo
+from proyeccion_ipc import extender_ipc
+from registro_series import DEFLACTOR_GENERAL, archivos_deflactor, leer_deflactor, serie as definicion_serie
+
+ARCHIVO_REM = "datos/relevamiento-expectativas-mercado-rem.csv"
+ESCENARIOS = ("ipc", "congelado", "tendencia")
+
+_hashes = {}
+
+
+def huella(archivos):
+    """
+    Hashes de `archivos` (None si no existe). Sólo se vuelve a leer un archivo si
+    cambió su fecha de modificación o su tamaño
+    """
+    resultado = []
+    for archivo in archivos:
+        archivo = str(archivo)
+        try:
+            st = os.stat(archivo)
+        except FileNotFoundError:
+            resultado.append(None)
+            continue
+        estado = (st.st_mtime_ns, st.st_size)
+        previo = _hashes.get(archivo)
+        if previo is None or previo[0] != estado:
+            previo = (estado, hash_archivo(archivo))
+            _hashes[archivo] = previo
+        resultado.append(previo[1])
+    return tuple(resultado)
+
+
+def _memoizar(entradas, maxsize=256):
+    """
+    Memoriza una consulta con un caché LRU. `entradas` recibe los mismos
+    argumentos que la consulta y retorna los archivos de los que depende.
+    Los DataFrame se devuelven como copia para que el caché no se modifique
+    """
+    def decorador(funcion):
+        firma = inspect.signature(funcion)
+
+        @lru_cache(maxsize=maxsize)
+        def calcular(clave_archivos, argumentos):
+            return funcion(**dict(argumentos))
+
+        @wraps(funcion)
+        def consulta(*args, **kwargs):
+            argumentos = firma.bind(*args, **kwargs)
+            argumentos.apply_defaults()
+            resultado = calcular(huella(entradas(**argumentos.arguments)),
+                                 tuple(argumentos.arguments.items()))
+            return resultado.copy() if isinstance(resultado, (pd.DataFrame, dict)) else resultado
+
+        consulta.cache_info = calcular.cache_info
+        consulta.cache_clear = calcular.cache_clear
+        return consulta
+    return decorador
+
+
+def _entradas_tipo(tipo, **_):
+    return entradas_salidas(tipo)[0]
+
+
+def entradas_real(tipo, base=None):
+    """Archivos de los que depende real(tipo, base); con `base`, también el índice acumulado"""
+    if base is None:
+        return _entradas_tipo(tipo)
+    return _entradas_tipo(tipo) + [pesos_constantes.ARCHIVO_INDICE, "pesos_constantes.py"]
+
+
+def _entradas_proyeccion(tipo, **_):
+    return entradas_salidas(tipo)[0] + [ARCHIVO_REM]
+
+
+def _mes(fecha):
+    return pd.Timestamp(str(fecha)[:7] + "-01")
+
+
+@_memoizar(_entradas_tipo)
+def serie(tipo):
+    """
+    Serie procesada de `tipo` (columnas de procesar_salarios: fecha, salario,
+    indice, ajustado, salario_indice, nominal, salario_real_indice, salario_real)
+    """
+    return procesar_salarios(tipo)
+
+
+@_memoizar(lambda deflactor=DEFLACTOR_GENERAL: archivos_deflactor(deflactor) + ["registro_series.py"])
+def ipc(deflactor=DEFLACTOR_GENERAL):
+    """Serie de IPC (fecha, indice); por defecto el nivel general nacional"""
+    return leer_deflactor(deflactor)
+
+
+def _indice_extendido(tipo, hasta, regla="crecimiento"):
+    definicion = definicion_serie(tipo)
+    return extender_ipc(leer_deflactor(definicion["deflactor"]), hasta, regla=regla)
+
+
+@_memoizar(entradas_real)
+def real(tipo, base=None):
+    """
+    Salario real de `tipo` (fecha, salario_real) en pesos del mes `base`
+    ("2019-12"); por defecto, del último mes de la serie
+    """
+    if base is None:
+        return serie(tipo)[["fecha", "salario_real"]]
+    meses, valores = pesos_constantes.real(tipo, base)
+    return pd.DataFrame({"fecha": meses.astype("datetime64[ns]"), "salario_real": valores})
+
+
+@_memoizar(_entradas_tipo)
+def perdida_desde(tipo, fecha):
+    """
+    Variación del salario real de `tipo` entre el mes `fecha` y el último mes.
+    Retorna un dict con desde, hasta, salario_real_desde, salario_real_hasta y
+    perdida_pct (positivo si el salario real cayó)
+    """
+    df = real(tipo)
+    desde = _mes(fecha)
+    fila = df[df["fecha"] == desde]
+    if fila.empty:
+        raise ValueError(f"{tipo} no tiene salario en {desde:%Y-%m}")
+    valor_desde = fila["salario_real"].iloc[0]
+    valor_hasta = df["salario_real"].iloc[-1]
+    return {
+        "tipo": tipo,
+        "desde": desde.strftime("%Y-%m-%d"),
+        "hasta": df["fecha"].iloc[-1].strftime("%Y-%m-%d"),
+        "salario_real_desde": float(valor_desde),
+        "salario_real_hasta": float(valor_hasta),
+        "perdida_pct": float((1 - valor_hasta / valor_desde) * 100),
+    }
+
+
+@_memoizar(_entradas_proyeccion)
+def proyeccion(tipo, escenario="ipc", hasta="2026-12"):
+    """
+    Proyecta `tipo` hasta el mes `hasta` con la inflación esperada del REM-BCRA
+    (extender_ipc, regla "rem"). Escenarios:
+      "ipc": el salario nominal sigue a la inflación (salario real constante)
+      "congelado": el salario nominal queda en su último valor
+      "tendencia": el salario real sigue la variación mensual promedio de los
+                   últimos 12 meses
+    Retorna fecha, nominal, salario_real (pesos del último mes observado) y proyectado
+    """
+    if escenario not in ESCENARIOS:
+        raise ValueError(f"Escenario desconocido: {escenario}")
+    df = serie(tipo)
+    hasta = _mes(hasta)
+    ultima = df["fecha"].iloc[-1]
+    futuras = pd.date_range(ultima + pd.DateOffset(months=1), hasta, freq="MS")
+
+    indice = _indice_extendido(tipo, hasta, regla="rem").set_index("fecha")["indice"]
+    indice_ultimo = df["indice"].iloc[-1]
+    inflacion = indice.reindex(futuras).to_numpy() / indice_ultimo
+
+    salario_ultimo = df["salario"].iloc[-1]
+    if escenario == "ipc":
+        nominal = salario_ultimo * inflacion
+    elif escenario == "congelado":
+        nominal = np.full(len(futuras), float(salario_ultimo))
+    else:
+        reales = df["salario_real"].to_numpy()
+        meses = min(12, len(reales) - 1)
+        variacion = (reales[-1] / reales[-1 - meses]) ** (1 / meses) if meses > 0 else 1.0
+        nominal = salario_ultimo * inflacion * variacion ** np.arange(1, len(futuras) + 1)
+
+    observado = pd.DataFrame({
+        "fecha": df["fecha"],
+        "nominal": df["salario"].astype(float),
+        "salario_real": df["salario_real"],
+        "proyectado": False,
+    })
+    proyectado = pd.DataFrame({
+        "fecha": futuras,
+        "nominal": nominal,
+        "salario_real": nominal / inflacion,
+        "proyectado": True,
+    })
+    return pd.concat([observado, proyectado], ignore_index=True)
@@ -0,0 +1,82 @@
+"""
+Cubo de salarios serie x mes x métrica en un archivo .npy mapeable en memoria.
+
+actualiza_datos.py escribe datos/cubo_salarios.npy (float64, NaN donde una serie
+no tiene dato) y datos/cubo_salarios.json con la cabecera: nombres de series y
+métricas (posiciones en los ejes 0 y 2) y el mes ordinal (año * 12 + mes - 1)
+de la primera columna del eje 1. Abrirlo no lee el archivo: cada corte es una
+vista sobre el mapa de memoria.
+
+Uso:
+    from cubo_salarios import abrir_cubo, serie_cubo
+    fechas, valores = serie_cubo("cic", "salario_real")
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+
+ARCHIVO_CUBO = Path("datos") / "cubo_salarios.npy"
+ARCHIVO_CABECERA = Path("datos") / "cubo_salarios.json"
+METRICAS = ["nominal", "salario_real", "ajustado", "indice", "salario_indice", "salario_real_indice"]
+
+
+def construir_cubo(resultados, archivo=ARCHIVO_CUBO, cabecera=ARCHIVO_CABECERA):
+    """
+    Escribe el cubo a partir de los resultados de procesar_lote ({tipo: DataFrame})
+    """
+    from actualiza_datos import meses_ordinales
+
+    meses_tipo = {tipo: meses_ordinales(df["fecha"]) for tipo, df in resultados.items()}
+    primer_mes = int(min(m.min() for m in meses_tipo.values()))
+    n_meses = int(max(m.max() for m in meses_tipo.values())) - primer_mes + 1
+
+    temp_path = Path(archivo).with_suffix(".tmp")
+    cubo = np.lib.format.open_memmap(temp_path, mode="w+", dtype=np.float64,
+                                     shape=(len(resultados), n_meses, len(METRICAS)))
+    cubo[:] = np.nan
+    for fila, (tipo, df) in enumerate(resultados.items()):
+        pos = meses_tipo[tipo] - primer_mes
+        for k, metrica in enumerate(METRICAS):
+            cubo[fila, pos, k] = df[metrica].to_numpy(dtype=np.float64)
+    cubo.flush()
+    del cubo
+    temp_path.replace(archivo)
+
+    datos_cabecera = {
+        "series": list(resultados),
+        "metricas": METRICAS,
+        "primer_mes": primer_mes,
+        "meses": n_meses,
+    }
+    with open(cabecera, "w", encoding="utf-8") as f:
+        json.dump(datos_cabecera, f, indent=1)
+
+
+def abrir_cubo(archivo=ARCHIVO_CUBO, cabecera=ARCHIVO_CABECERA):
+    """
+    Retorna (cabecera, cubo) con el cubo mapeado en memoria en modo lectura
+    """
+    with open(cabecera, encoding="utf-8") as f:
+        datos_cabecera = json.load(f)
+    return datos_cabecera, np.load(archivo, mmap_mode="r")
+
+
+def fechas_cubo(cabecera):
+    """Meses del eje 1 como datetime64[M]"""
+    return (cabecera["primer_mes"] - 1970 * 12 + np.arange(cabecera["meses"])).astype("datetime64[M]")
+
+
+def serie_cubo(tipo, metrica="salario_real", archivo=ARCHIVO_CUBO, cabecera=ARCHIVO_CABECERA):
+    """
+    Retorna (fechas, valores) de una métrica de un tipo; `valores` es una vista
+    sobre el archivo (sin copiar) que incluye NaN fuera del rango de la serie
+    """
+    datos_cabecera, cubo = abrir_cubo(archivo, cabecera)
+    if tipo not in datos_cabecera["series"]:
+        raise ValueError(f"Tipo desconocido: {tipo}")
+    if metrica not in datos_cabecera["metricas"]:
+        raise ValueError(f"Métrica desconocida: {metrica}")
+    fila = datos_cabecera["series"].index(tipo)
+    return fechas_cubo(datos_cabecera), cubo[fila, :, datos_cabecera["metricas"].index(metrica)]
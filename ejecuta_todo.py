@@ -0,0 +1,299 @@
+"""
+Corre todos los scripts en el orden que imponen sus entradas y salidas.
+
+Cada etapa es un script con los archivos que lee y los que escribe; una etapa
+depende de otra si lee algo que la otra escribe (por ejemplo proyecta_nov2027.py
+lee plots/profasis_plotted_series.csv, que genera graf_cic.py). Las etapas
+independientes corren en paralelo y una etapa se omite si sus entradas y
+salidas no cambiaron desde la última corrida (datos/manifiesto.json, etapa
+"pipeline"). actualiza_datos_IPC.py corre siempre, porque sólo INDEC sabe si
+hay un IPC nuevo; si no cambia ipc_nuevo.csv, lo que depende de él se omite.
+
+Uso:
+    python ejecuta_todo.py                  # corre lo que haga falta
+    python ejecuta_todo.py --dry-run        # sólo muestra el plan
+    python ejecuta_todo.py --forzar         # corre todo salvo las etapas de ADOPTAR (y pasa --forzar a cada script)
+    python ejecuta_todo.py --omitir actualiza_datos_IPC   # sin conexión
+    python ejecuta_todo.py --reporte datos/reporte_tiempos.json --perfil perfiles
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+
+from instrumentacion import ENV_PERFIL, ENV_REPORTE, anotar, maxrss_mb
+from manifiesto import cargar_manifiesto, guardar_manifiesto, verificar, registrar, imprimir_resumen
+from tablas import ruta_columnar
+
+# Etapas que siempre se corren: deciden por sí mismas si hay datos nuevos
+SIEMPRE = {"actualiza_datos_IPC"}
+# Scripts que aceptan --forzar
+ACEPTAN_FORZAR = {"actualiza_datos", "graf_cic", "proyeccion_profasis"}
+# Etapas que reescriben datos crudos también mantenidos a mano (crudo_profasis.csv
+# tiene la historia 2020-2023 que actualiza_crudo_profasis.py no reconstruye):
+# sin registro previo se toman sus salidas actuales como al día, y sólo corren
+# cuando cambian sus entradas
+ADOPTAR = {"actualiza_crudo_profasis", "combina_profasis_historico"}
+ADOPTADA = "sin registro previo, se toman los archivos actuales"
+
+
+def _con_columnar(archivos):
+    return list(archivos) + [str(ruta_columnar(a)) for a in archivos if str(a).endswith(".csv")]
+
+
+def etapas():
+    """
+    Lista de (nombre, entradas, salidas); cada etapa corre {nombre}.py, que
+    cuenta también como entrada
+    """
+    from actualiza_datos import TIPOS, entradas_salidas
+    from cubo_salarios import ARCHIVO_CUBO, ARCHIVO_CABECERA
+    from graf_cic import GRAFICOS, MODULOS_DIBUJO
+    from pesos_constantes import ARCHIVO_INDICE
+    from registro_series import cargar_series
+
+    crudos = [definicion["crudo"] for definicion in cargar_series().values()]
+
+    entradas_datos, salidas_datos = [], []
+    for tipo in TIPOS:
+        entradas, salidas = entradas_salidas(tipo)
+        entradas_datos += [str(a) for a in entradas]
+        salidas_datos += [str(a) for a in salidas]
+    entradas_datos += ["pesos_constantes.py", "cubo_salarios.py"]
+    salidas_datos += [str(ARCHIVO_INDICE), str(ARCHIVO_CUBO), str(ARCHIVO_CABECERA)]
+
+    entradas_graficos, salidas_graficos = [], []
+    for _, _, entradas, salidas in GRAFICOS:
+        entradas_graficos += _con_columnar(entradas)
+        salidas_graficos += salidas
+
+    lista = [
+        ("actualiza_crudo_profasis", ["datos/profasis_indice.csv", "datos/profasis_bolsillo.csv"],
+         ["datos/crudo_profasis.csv"]),
+        # Lee y reescribe crudo_profasis_historico.csv, que genera scrape_profasis_historico.py
+        ("combina_profasis_historico", ["datos/crudo_profasis_historico.csv", "datos/crudo_profasis.csv"],
+         ["datos/crudo_profasis_historico.csv"]),
+        # Extiende el IPC hasta el último salario de cualquier serie
+        ("actualiza_datos_IPC", crudos + ["series.json", "registro_series.py", "proyeccion_ipc.py", "versiones_ipc.py"],
+         _con_columnar(["datos/ipc_nuevo.csv"]) + ["datos/ipc_series.csv", "datos/ipc_versiones.npz"]),
+        ("actualiza_datos", entradas_datos, salidas_datos),
+        ("graf_cic", entradas_graficos, salidas_graficos),
+        ("proyeccion_profasis",
+         ["datos/tablas-relevamiento-expectativas-mercado-ene-2026.xlsx", "datos/crudo_profasis.csv",
+          *_con_columnar(["datos/ipc_nuevo.csv"]), "proyeccion_ipc.py", *MODULOS_DIBUJO],
+         ["plots/proyeccion_profasis_2026.png"]),
+        ("proyecta_nov2027",
+         _con_columnar(["plots/profasis_plotted_series.csv", "datos/cic.csv", "datos/beca_conicet.csv"])
+         + ["tablas.py", "borrador.py", "exportacion.py"],
+         ["plots/grafico_salarios_profasis_porhora_proy.png", "plots/grafico_salarios_CIC_proy.png",
+          "plots/grafico_salarios_beca_doctoral_proy.png"]),
+    ]
+    return [(nombre, list(dict.fromkeys(entradas + [f"{nombre}.py"])), list(dict.fromkeys(salidas)))
+            for nombre, entradas, salidas in lista]
+
+
+def dependencias(lista):
+    """
+    {etapa: etapas de las que depende} y el orden topológico. Lanza ValueError si
+    hay un ciclo
+    """
+    salidas = {nombre: set(s) for nombre, _, s in lista}
+    deps = {nombre: {otra for otra in salidas if otra != nombre and salidas[otra] & set(entradas)}
+            for nombre, entradas, _ in lista}
+    orden, pendientes = [], dict(deps)
+    while pendientes:
+        listas = [n for n, d in pendientes.items() if not d - set(orden)]
+        if not listas:
+            raise ValueError(f"Ciclo entre las etapas: {', '.join(pendientes)}")
+        orden += listas
+        for n in listas:
+            del pendientes[n]
+    return deps, orden
+
+
+def niveles(deps, orden):
+    """Nivel de cada etapa: 0 si no depende de nadie, si no 1 + el máximo de sus dependencias"""
+    nivel = {}
+    for nombre in orden:
+        nivel[nombre] = 1 + max((nivel[d] for d in deps[nombre]), default=-1)
+    return nivel
+
+
+def faltantes(lista):
+    """
+    Entradas de cada etapa que no existen y que ninguna otra etapa genera
+    (datos que hay que conseguir a mano, como crudo_profasis_historico.csv).
+    Los archivos columnares son opcionales: sin ellos se lee el CSV
+    """
+    generados = {}
+    for nombre, _, salidas in lista:
+        for salida in salidas:
+            generados.setdefault(salida, set()).add(nombre)
+    return {nombre: [a for a in entradas if not Path(a).exists() and not generados.get(a, set()) - {nombre}
+                     and not a.endswith(".columnas.npz")]
+            for nombre, entradas, _ in lista}
+
+
+def decidir(manifiesto, nombre, entradas, salidas, faltan, forzar, omitir):
+    """
+    Retorna (correr, motivo) para una etapa cuyas dependencias ya terminaron
+    """
+    if nombre in omitir:
+        return False, "omitida por --omitir"
+    if faltan:
+        return False, f"falta {', '.join(faltan)}"
+    if nombre in ADOPTAR:
+        motivo = verificar(manifiesto, "pipeline", nombre, entradas, salidas)
+        if motivo == "sin registro previo" and all(Path(s).exists() for s in salidas):
+            return False, ADOPTADA
+        return (False, "entradas sin cambios") if motivo is None else (True, motivo)
+    if forzar:
+        return True, "forzado"
+    if nombre in SIEMPRE:
+        return True, "se corre siempre"
+    motivo = verificar(manifiesto, "pipeline", nombre, entradas, salidas)
+    return (False, "entradas sin cambios") if motivo is None else (True, motivo)
+
+
+def correr(nombre, forzar):
+    """
+    Corre {nombre}.py; retorna (código de salida, salida combinada, medición con
+    tiempo de reloj y, donde existe os.wait4, CPU y pico de RSS del subproceso)
+    """
+    comando = [sys.executable, f"{nombre}.py"] + (["--forzar"] if forzar and nombre in ACEPTAN_FORZAR else [])
+    medicion = {}
+    inicio = time.perf_counter()
+    with tempfile.TemporaryFile() as salida:
+        proceso = subprocess.Popen(comando, stdout=salida, stderr=subprocess.STDOUT)
+        if hasattr(os, "wait4"):
+            _, estado, uso = os.wait4(proceso.pid, 0)
+            proceso.returncode = os.waitstatus_to_exitcode(estado)
+            medicion = {"cpu_s": round(uso.ru_utime + uso.ru_stime, 6), "rss_pico_mb": maxrss_mb(uso.ru_maxrss)}
+        else:
+            proceso.wait()
+        salida.seek(0)
+        texto = salida.read().decode("utf-8", errors="replace")
+    return proceso.returncode, texto, {"pared_s": round(time.perf_counter() - inicio, 6), **medicion}
+
+
+def plan(lista, forzar=False, omitir=()):
+    """Imprime qué correría cada etapa, por nivel, sin ejecutar nada"""
+    deps, orden = dependencias(lista)
+    nivel = niveles(deps, orden)
+    faltan = faltantes(lista)
+    manifiesto = cargar_manifiesto()
+    definiciones = {nombre: (entradas, salidas) for nombre, entradas, salidas in lista}
+    correra = set()
+    for nombre in sorted(orden, key=lambda n: (nivel[n], orden.index(n))):
+        correr_etapa, motivo = decidir(manifiesto, nombre, *definiciones[nombre], faltan[nombre], forzar, omitir)
+        previas = sorted(deps[nombre] & correra)
+        if not correr_etapa and previas and nombre not in omitir and not faltan[nombre]:
+            motivo = f"se decide al terminar {', '.join(previas)}"
+            correr_etapa = True
+        if correr_etapa:
+            correra.add(nombre)
+        estado = "correr " if correr_etapa else "omitir "
+        despues = f"  (después de {', '.join(sorted(deps[nombre]))})" if deps[nombre] else ""
+        print(f"  nivel {nivel[nombre]}  {estado} {nombre}: {motivo}{despues}")
+
+
+def ejecutar(lista, jobs=1, forzar=False, omitir=()):
+    """
+    Corre las etapas en paralelo respetando las dependencias. Cada etapa se
+    decide recién cuando terminaron las suyas, con los hashes de ese momento.
+    Retorna {etapa: mensaje} de las etapas que fallaron
+    """
+    deps, orden = dependencias(lista)
+    faltan = faltantes(lista)
+    definiciones = {nombre: (entradas, salidas) for nombre, entradas, salidas in lista}
+    manifiesto = cargar_manifiesto()
+
+    terminadas, fallidas = set(), {}
+    procesados, omitidos = {}, {}
+    en_curso = {}
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while len(terminadas) + len(en_curso) < len(orden) or en_curso:
+            for nombre in orden:
+                if nombre in terminadas or nombre in en_curso.values() or deps[nombre] - terminadas:
+                    continue
+                fallaron = sorted(deps[nombre] & set(fallidas))
+                if fallaron:
+                    fallidas[nombre] = f"no se corrió: falló {', '.join(fallaron)}"
+                    terminadas.add(nombre)
+                    continue
+                correr_etapa, motivo = decidir(manifiesto, nombre, *definiciones[nombre], faltan[nombre],
+                                               forzar, omitir)
+                if not correr_etapa:
+                    print(f"--- {nombre}: omitida ({motivo})")
+                    if motivo == ADOPTADA:
+                        registrar(manifiesto, "pipeline", nombre, *definiciones[nombre])
+                        guardar_manifiesto(manifiesto, etapas=["pipeline"])
+                    omitidos[nombre] = motivo
+                    terminadas.add(nombre)
+                    continue
+                print(f"--- {nombre}: corriendo ({motivo})")
+                procesados[nombre] = motivo
+                en_curso[pool.submit(correr, nombre, forzar)] = nombre
+            if not en_curso:
+                continue
+            listos, _ = wait(en_curso, return_when=FIRST_COMPLETED)
+            for futuro in listos:
+                nombre = en_curso.pop(futuro)
+                codigo, salida, medicion = futuro.result()
+                anotar(nombre, "etapa", codigo=codigo, **medicion)
+                print(f"\n=== {nombre} ({medicion['pared_s']:.1f} s, código {codigo}) ===")
+                print(salida.rstrip())
+                if codigo == 0:
+                    registrar(manifiesto, "pipeline", nombre, *definiciones[nombre])
+                    guardar_manifiesto(manifiesto, etapas=["pipeline"])
+                else:
+                    fallidas[nombre] = f"terminó con código {codigo}"
+                terminadas.add(nombre)
+
+    for nombre in fallidas:
+        procesados.pop(nombre, None)
+    imprimir_resumen("pipeline", procesados, omitidos)
+    for nombre, mensaje in fallidas.items():
+        print(f"  falló {nombre}: {mensaje}")
+    return fallidas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Corre todas las etapas según sus dependencias")
+    parser.add_argument("--dry-run", action="store_true", help="Mostrar el plan sin correr nada")
+    parser.add_argument("--forzar", action="store_true", help="Correr todas las etapas aunque estén al día")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Máximo de etapas corriendo a la vez")
+    parser.add_argument("--omitir", action="append", default=[], metavar="ETAPA",
+                        help="No correr esta etapa (se puede repetir)")
+    parser.add_argument("--reporte", metavar="ARCHIVO",
+                        help="Guardar tiempos, CPU y memoria de cada etapa y gráfico en este JSON")
+    parser.add_argument("--perfil", metavar="DIR", help="Guardar un volcado de cProfile por etapa en DIR")
+    args = parser.parse_args()
+
+    lista = etapas()
+    desconocidas = set(args.omitir) - {nombre for nombre, _, _ in lista}
+    if desconocidas:
+        parser.error(f"Etapas desconocidas: {', '.join(sorted(desconocidas))}")
+
+    if args.dry_run:
+        plan(lista, args.forzar, set(args.omitir))
+        return
+    # Los scripts heredan estas variables y agregan sus mediciones al mismo reporte
+    if args.reporte:
+        Path(args.reporte).unlink(missing_ok=True)
+        os.environ[ENV_REPORTE] = args.reporte
+    if args.perfil:
+        os.environ[ENV_PERFIL] = args.perfil
+    fallidas = ejecutar(lista, max(1, args.jobs), args.forzar, set(args.omitir))
+    if fallidas:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
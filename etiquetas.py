@@ -0,0 +1,115 @@
+"""
+Ubicación determinística de etiquetas con valores (cajas con flecha) sobre los gráficos.
+
+`colocar_etiquetas(ax, puntos)` reemplaza a adjustText y a los desplazamientos
+(dx, dy) ajustados a mano. Para cada etiqueta prueba, en orden, las posiciones
+de CANDIDATOS alrededor de su punto y se queda con la primera cuya caja (en
+coordenadas de pantalla) queda dentro de los ejes sin tapar otras etiquetas,
+textos, la leyenda ni los puntos etiquetados; si ninguna sirve, con la que menos
+superpone. Al final un barrido vertical separa las cajas que aún se tocan.
+
+Se llama con los límites de los ejes ya fijados y después de tight_layout, justo
+antes de guardar: la misma figura siempre da las mismas posiciones, sin iterar.
+"""
+
+from matplotlib.text import Text
+from matplotlib.transforms import Bbox
+
+# Desplazamientos (dx, dy) en puntos, en orden de preferencia
+CANDIDATOS = [(8, 12), (-8, 12), (8, -12), (-8, -12), (15, 0), (-15, 0),
+              (8, 32), (-8, 32), (8, -32), (-8, -32)]
+SEPARACION = 4  # puntos entre cajas
+RADIO_PUNTO = 5  # puntos alrededor de cada punto etiquetado que no se tapan
+
+
+def _alineacion(dx, dy):
+    """Alineación del texto respecto de su ancla para un desplazamiento (dx, dy)"""
+    return "right" if dx < 0 else "left", "bottom" if dy > 0 else ("top" if dy < 0 else "center")
+
+
+def _caja(punto, ancho, alto, dx, dy, escala):
+    """Caja en pantalla de una etiqueta de ancho x alto anclada a dx, dy puntos de `punto`"""
+    x = punto[0] + dx * escala
+    y = punto[1] + dy * escala
+    ha, va = _alineacion(dx, dy)
+    x0 = x - ancho if ha == "right" else x
+    y0 = {"bottom": y, "top": y - alto, "center": y - alto / 2}[va]
+    return Bbox.from_bounds(x0, y0, ancho, alto)
+
+
+def _superposicion(caja, otras):
+    total = 0.0
+    for otra in otras:
+        ancho = min(caja.x1, otra.x1) - max(caja.x0, otra.x0)
+        alto = min(caja.y1, otra.y1) - max(caja.y0, otra.y0)
+        if ancho > 0 and alto > 0:
+            total += ancho * alto
+    return total
+
+
+def colocar_etiquetas(ax, puntos, fontsize=13):
+    """
+    Agrega a `ax` una etiqueta por cada (x, y, texto, color) de `puntos`, en
+    coordenadas de datos, con caja redondeada y flecha al punto. Retorna las
+    anotaciones
+    """
+    figura = ax.figure
+    renderer = figura.canvas.get_renderer()
+    escala = figura.dpi / 72
+    area = ax.get_window_extent(renderer)
+
+    obstaculos = [t.get_window_extent(renderer) for t in ax.texts if t.get_text() and t.get_visible()]
+    if ax.get_legend() is not None:
+        obstaculos.append(ax.get_legend().get_window_extent(renderer))
+
+    pantalla = [ax.transData.transform((ax.convert_xunits(x), ax.convert_yunits(y))) for x, y, _, _ in puntos]
+    radio = RADIO_PUNTO * escala
+    obstaculos += [Bbox.from_bounds(px - radio, py - radio, 2 * radio, 2 * radio) for px, py in pantalla]
+
+    anotaciones, cajas, desplazamientos = [], [], []
+    for (x, y, texto, color), punto in zip(puntos, pantalla):
+        anotacion = ax.annotate(
+            texto, xy=(x, y), xycoords="data", xytext=(0, 0), textcoords="offset points",
+            color=color, fontsize=fontsize, fontweight="bold",
+            bbox=dict(boxstyle="round,pad=0.5", fc="white", ec=color, alpha=1, zorder=3),
+            arrowprops=dict(arrowstyle="->", connectionstyle="arc3,rad=0", color=color,
+                            shrinkB=4, lw=2, zorder=2.5),
+            zorder=3,
+        )
+        # Tamaño del texto más el relleno de la caja (pad=0.5 del tamaño de letra)
+        texto_px = Text.get_window_extent(anotacion, renderer)
+        relleno = 0.5 * fontsize * escala
+        ancho, alto = texto_px.width + 2 * relleno, texto_px.height + 2 * relleno
+
+        mejor = None
+        for dx, dy in CANDIDATOS:
+            caja = _caja(punto, ancho, alto, dx, dy, escala)
+            afuera = caja.x0 < area.x0 or caja.x1 > area.x1 or caja.y0 < area.y0 or caja.y1 > area.y1
+            costo = (afuera, _superposicion(caja, obstaculos + cajas))
+            if mejor is None or costo < mejor[0]:
+                mejor = (costo, dx, dy, caja)
+            if costo == (False, 0.0):
+                break
+        _, dx, dy, caja = mejor
+        anotaciones.append(anotacion)
+        cajas.append(caja)
+        desplazamientos.append([dx, dy, *_alineacion(dx, dy)])
+
+    # Barrido vertical: de abajo hacia arriba, cada caja sube lo necesario para
+    # no tocar a las de abajo con las que comparte columna
+    separacion = SEPARACION * escala
+    orden = sorted(range(len(cajas)), key=lambda i: (cajas[i].y0, cajas[i].x0))
+    for k, i in enumerate(orden):
+        for j in orden[:k]:
+            comparte_columna = cajas[i].x0 < cajas[j].x1 and cajas[j].x0 < cajas[i].x1
+            if comparte_columna and cajas[i].y0 < cajas[j].y1 + separacion:
+                subir = cajas[j].y1 + separacion - cajas[i].y0
+                cajas[i] = Bbox.from_bounds(cajas[i].x0, cajas[i].y0 + subir, cajas[i].width, cajas[i].height)
+                desplazamientos[i][1] += subir / escala
+
+    # La alineación es la de la posición elegida aunque el barrido cambie el signo de dy
+    for anotacion, (dx, dy, ha, va) in zip(anotaciones, desplazamientos):
+        anotacion.xyann = (dx, dy)
+        anotacion.set_horizontalalignment(ha)
+        anotacion.set_verticalalignment(va)
+    return anotaciones
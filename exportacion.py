@@ -0,0 +1,165 @@
+"""
+Exportación de cada gráfico en varios formatos a partir de un solo dibujo.
+
+Los scripts de gráficos guardan con `guardar(ruta)` en lugar de plt.savefig. Sin
+más, es lo mismo que plt.savefig (respetando el modo borrador). Con --exportar,
+además de plots/{nombre}.png se escriben:
+
+    plots/svg/{nombre}.svg, plots/pdf/{nombre}.pdf   vectoriales
+    plots/web/{nombre}.png                           PNG reducido y cuantizado que
+                                                     entra en el presupuesto de bytes
+
+La variante web sale de la imagen que Agg ya dibujó para el PNG completo (no se
+vuelve a dibujar la figura); los vectoriales recorren la misma figura con su
+propio backend. Los tamaños quedan en plots/tamanos.json:
+
+    {"plots/x.png": {"png": bytes, "svg": bytes, "pdf": bytes, "web": bytes,
+                     "web_ancho": px, "web_colores": n, "presupuesto_web": bytes,
+                     "cumple_presupuesto": bool}}
+
+parser_graficos() arma las opciones comunes de los tres scripts de gráficos
+(--draft, --exportar, --presupuesto-web, --fecha y, donde hay manifiesto,
+--forzar); cada script agrega las suyas y llama a activar_opciones(args). Con
+--fecha las notas al pie llevan esa fecha de generación en lugar de la de hoy:
+con la misma fecha y los mismos datos, el PNG sale idéntico byte a byte.
+"""
+
+import argparse
+import io
+import json
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import pandas as pd
+from PIL import Image
+
+import borrador
+from manifiesto import bloqueo
+
+FORMATOS_VECTOR = ("svg", "pdf")
+DIRECTORIO_WEB = "web"
+ARCHIVO_REPORTE = Path("plots") / "tamanos.json"
+PRESUPUESTO_WEB_KB = 250
+ANCHO_WEB = 1600
+ANCHO_MINIMO = 640
+COLORES = (256, 128, 64)
+# Sin fecha de creación: el mismo gráfico produce los mismos bytes
+METADATOS = {"svg": {"Date": None}, "pdf": {"CreationDate": None}}
+
+presupuesto_web = None
+
+
+def activar(presupuesto_kb=PRESUPUESTO_WEB_KB):
+    """Exportar cada gráfico que se guarde con `guardar`; la variante web no supera `presupuesto_kb`"""
+    global presupuesto_web
+    presupuesto_web = presupuesto_kb * 1024
+    plt.rcParams["svg.hashsalt"] = "salarios"
+
+
+def parser_graficos(descripcion, forzar=True):
+    """ArgumentParser con las opciones comunes de los scripts de gráficos; --forzar sólo si `forzar`"""
+    parser = argparse.ArgumentParser(description=descripcion)
+    if forzar:
+        parser.add_argument("--forzar", action="store_true",
+                            help="Regenera los gráficos aunque sus entradas no hayan cambiado")
+    parser.add_argument("--draft", action="store_true",
+                        help=f"Borrador rápido: DPI {borrador.DPI}, sin ejes espejados, en {borrador.DIRECTORIO}/ "
+                             "y sin usar ni actualizar el manifiesto ni las claves de dibujo")
+    parser.add_argument("--exportar", action="store_true",
+                        help=f"Guardar además SVG, PDF y una versión web de cada gráfico, con su tamaño en {ARCHIVO_REPORTE}")
+    parser.add_argument("--fecha", type=lambda texto: pd.Timestamp(texto).strftime("%d/%m/%Y"),
+                        default=pd.Timestamp.now().strftime("%d/%m/%Y"),
+                        help="Fecha de generación que muestran los gráficos (AAAA-MM-DD; por defecto hoy)")
+    parser.add_argument("--presupuesto-web", type=int, default=PRESUPUESTO_WEB_KB, metavar="KB",
+                        help="Tamaño máximo de la versión web de cada gráfico (con --exportar)")
+    return parser
+
+
+def activar_opciones(args):
+    """Activa en este proceso el modo borrador y la exportación pedidos en `args`"""
+    if args.draft:
+        borrador.activar()
+    if args.exportar:
+        activar(args.presupuesto_web)
+
+
+def rutas_exportadas(ruta):
+    """Archivos que escribe la exportación de `ruta` (plots/x.png)"""
+    ruta = Path(ruta)
+    return [str(ruta.parent / formato / f"{ruta.stem}.{formato}") for formato in FORMATOS_VECTOR] + \
+           [str(ruta.parent / DIRECTORIO_WEB / ruta.name)]
+
+
+def imagen_web(imagen, presupuesto):
+    """
+    PNG de `imagen` reducido a lo sumo a ANCHO_WEB px y cuantizado: prueba menos
+    colores y luego anchos menores (hasta ANCHO_MINIMO) hasta entrar en
+    `presupuesto` bytes. Retorna (bytes, ancho, colores)
+    """
+    ancho = min(ANCHO_WEB, imagen.width)
+    while True:
+        alto = round(imagen.height * ancho / imagen.width)
+        reducida = imagen.resize((ancho, alto), Image.LANCZOS) if ancho < imagen.width else imagen
+        for colores in COLORES:
+            buffer = io.BytesIO()
+            reducida.quantize(colores, dither=Image.Dither.NONE).save(buffer, "PNG", optimize=True)
+            if buffer.tell() <= presupuesto:
+                return buffer.getvalue(), ancho, colores
+        if ancho <= ANCHO_MINIMO:
+            return buffer.getvalue(), ancho, colores
+        ancho = max(ANCHO_MINIMO, int(ancho * 0.8))
+
+
+def guardar(ruta):
+    """
+    plt.savefig(ruta) de la figura actual y, con la exportación activa (y fuera
+    del modo borrador), sus variantes vectoriales y web con su entrada en el reporte
+    """
+    ruta = borrador.salida(ruta)
+    figura = plt.gcf()
+    figura.savefig(ruta)
+    if presupuesto_web is None or borrador.activo:
+        return
+
+    *vectoriales, web = rutas_exportadas(ruta)
+    tamanos = {"png": Path(ruta).stat().st_size}
+
+    # El lienzo Agg todavía tiene el PNG recién dibujado
+    imagen = Image.frombuffer("RGBA", figura.canvas.get_width_height(), figura.canvas.buffer_rgba()).convert("RGB")
+    datos, ancho, colores = imagen_web(imagen, presupuesto_web)
+    Path(web).parent.mkdir(parents=True, exist_ok=True)
+    Path(web).write_bytes(datos)
+
+    for formato, destino in zip(FORMATOS_VECTOR, vectoriales):
+        Path(destino).parent.mkdir(parents=True, exist_ok=True)
+        figura.savefig(destino, format=formato, metadata=METADATOS[formato])
+        tamanos[formato] = Path(destino).stat().st_size
+
+    tamanos.update({
+        "web": len(datos),
+        "web_ancho": ancho,
+        "web_colores": colores,
+        "presupuesto_web": presupuesto_web,
+        "cumple_presupuesto": len(datos) <= presupuesto_web,
+    })
+    registrar_tamanos(ruta, tamanos)
+    print(f"  {ruta}: png {tamanos['png'] // 1024} KB, "
+          + ", ".join(f"{f} {tamanos[f] // 1024} KB" for f in FORMATOS_VECTOR)
+          + f", web {len(datos) // 1024} KB ({ancho} px, {colores} colores)"
+          + ("" if tamanos["cumple_presupuesto"] else " EXCEDE EL PRESUPUESTO"))
+
+
+def registrar_tamanos(ruta, tamanos, archivo=ARCHIVO_REPORTE):
+    """Agrega (o reemplaza) la entrada de `ruta` en el reporte; los procesos del pool escriben a la vez"""
+    archivo = Path(archivo)
+    with bloqueo(archivo):
+        try:
+            with open(archivo, encoding="utf-8") as f:
+                reporte = json.load(f)
+        except (OSError, ValueError):
+            reporte = {}
+        reporte[str(ruta)] = tamanos
+        temp_path = archivo.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(reporte, f, ensure_ascii=False, indent=1, sort_keys=True)
+        temp_path.replace(archivo)
@@ -1,8 +1,25 @@
+import hashlib
+import inspect
+import json
+import os
+import re
+import sys
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
+import matplotlib
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import numpy as np
-from adjustText import adjust_text
+from proyeccion_ipc import extender_ipc
+from functools import lru_cache, partial
+from manifiesto import cargar_manifiesto, guardar_manifiesto, verificar, registrar, imprimir_resumen, hashes, hash_archivo
+from registro_series import cargar_series
+from tablas import leer_tabla, guardar_tabla
+from instrumentacion import medir, anotar, reporte
+import borrador
+import exportacion
+from etiquetas import colocar_etiquetas
 
 # Format y-axis labels for per-hour plots: show integer values with dot as thousands separator
 def miles_formatter_dot(x, pos):
@@ -18,249 +35,411 @@ def millones_coma(x, pos):
     # swap thousand separator and decimal point: '1,234.5' -> '1.234,5'
     return s.replace(',', 'TEMP').replace('.', ',').replace('TEMP', '.')
 
-# Add generation date to first two plots
+# Fecha de generación de las notas al pie; main() la reemplaza por --fecha
 current_date = pd.Timestamp.now().strftime("%d/%m/%Y")
 _AUTHOR = "Por Rodrigo Quiroga. Ver github.com/rquiroga7/salarios_CONICET"
-footnote_text = (
-    f"Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\n"
-    f"Serie reconstruida en base a actas paritarias de UPCN. Gráfico generado el {current_date}.\n{_AUTHOR}"
-)
-
-
-# Leer el archivo CSV
-df = pd.read_csv("datos/cic.csv", parse_dates=["fecha"])
-
-# Crear figura
-fig, ax = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
-
-# Definir períodos presidenciales
-periodos = [
-    ("Menem", "1989-07-01", "1999-11-30", "#d9d9d9"),            # gris
-    ("De la Rúa", "1999-12-01", "2001-12-20", "#ffccdf"),      # rosa
-    ("Duhalde", "2002-01-02", "2003-05-24", "#d6f5d6"),        # verde claro
-    ("Néstor Kirchner", "2003-05-25", "2007-12-09", "#d9eefc"),# celeste claro
-    ("Cristina Fernández", "2007-12-10", "2015-12-09", "#bfe6ff"), # celeste
-    ("Macri", "2015-12-10", "2019-12-09", "#fff3b0"),         # amarillo pálido
-    ("Fernández", "2019-12-10", "2023-11-30", "#cce5ff"),     # celeste pálido
-    ("Milei", "2023-12-01", df["fecha"].max(), "#e6ccff")     # violeta pálido
-]
 
-# Dibujar fondos de colores por período
-# Para el gráfico CIC (serie iniciando en 2015) sólo mostrar presidencias
-# que se solapen con 2015 en adelante
-periodos_cic = [p for p in periodos if pd.to_datetime(p[2]) >= pd.to_datetime("2015-01-01")]
-for nombre, inicio, fin, color in periodos_cic:
-    # Exclude Cristina Fernández from the CIC legend (still draw the span)
-    label_name = '_nolegend_' if 'Cristina' in nombre else nombre
-    ax.axvspan(pd.to_datetime(inicio), pd.to_datetime(fin), color=color, label=label_name)
-
-# Dibujar línea con puntos
-ax.plot(df["fecha"], df["salario_real"], color="black", linewidth=2,
-        marker='o', markersize=3, label="Salario")
-
-# Eje Y: límites y ticks basados en los datos
-min_value = df["salario_real"].min()
-max_value = df["salario_real"].max()
-ylim_min = np.floor(0.95 * min_value / 100000) * 100000
-ylim_max = np.ceil(1.05 * max_value / 100000) * 100000
-
-ax.set_ylim(ylim_min, ylim_max)
-yticks = np.arange(ylim_min, ylim_max + 100000, 100000)
-ax.set_yticks(yticks)
-
-ax.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
-
-# Líneas horizontales en cada tick
-for y in yticks:
-    ax.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
-
-# Mirror y-axis labels on the right side for CIC
-ax_right = ax.twinx()
-ax_right.set_ylim(ylim_min, ylim_max)
-ax_right.set_yticks(yticks)
-ax_right.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
-# Copy font properties from left y-tick labels so size and font match exactly
-left_labels = ax.yaxis.get_ticklabels()
-if len(left_labels) > 0:
-    left_fp = left_labels[0].get_fontproperties()
-    for lbl in ax_right.yaxis.get_ticklabels():
-        lbl.set_fontproperties(left_fp)
-else:
-    ax_right.tick_params(axis='y', labelsize=20)
-
-# Formatear eje de fechas
-ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-# Explicit January ticks for CIC so year labels align with January data points
-start_year = 2016
-end_year = 2026
-ticks = [pd.to_datetime(f"{y}-01-01") for y in range(start_year, end_year+1)]
-ax.set_xticks(ticks)
-ax.tick_params(axis='x', rotation=45)
-for lbl in ax.get_xticklabels():
-    lbl.set_ha('right')
-# Force CIC x-axis start at January 2016 and limit to July 2026
-ax.set_xlim(left=pd.to_datetime("2016-01-01"), right=pd.to_datetime("2026-07-01"))
-# Get the last date from the data
+
+def footnote_text():
+    return (
+        f"Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\n"
+        f"Serie reconstruida en base a actas paritarias de UPCN. Gráfico generado el {current_date}.\n{_AUTHOR}"
+    )
+
+
 MONTH_NAMES = {
     1: 'enero', 2: 'febrero', 3: 'marzo', 4: 'abril',
     5: 'mayo', 6: 'junio', 7: 'julio', 8: 'agosto',
     9: 'septiembre', 10: 'octubre', 11: 'noviembre', 12: 'diciembre'
 }
-last_date = df["fecha"].max()
-last_date_str = f"{MONTH_NAMES[last_date.month]} de {last_date.year}"
+HORAS_MENSUALES = 176
 
-# Update title with dynamic date reference
-ax.set_title(f"Salario de bolsillo ajustado por IPC\nInvestigador asistente (pesos de {last_date_str})", fontsize=28)
-ax.set_xlabel("Fecha", fontsize=20)
-ax.set_ylabel("Salario real (millones)", fontsize=20)
-ax.legend(fontsize=20)
 
-plt.figtext(0.98, 0.01, footnote_text,
-            ha="right", fontsize=14, style='italic')
+# =====================
+# Datos compartidos entre gráficos (se calculan una vez por corrida)
+# =====================
 
-# Ajustar diseño y guardar
-plt.tight_layout(rect=[0, 0.06, 1, 1])  # Increased bottom margin
-plt.savefig("plots/grafico_salarios_CIC.png")
-plt.close()
+@lru_cache(maxsize=None)
+def periodos_presidenciales():
+    """Períodos presidenciales (nombre, inicio, fin, color); Milei hasta el último dato de CIC"""
+    df = leer_tabla("datos/cic.csv")
+    return [
+        ("Menem", "1989-07-01", "1999-11-30", "#d9d9d9"),            # gris
+        ("De la Rúa", "1999-12-01", "2001-12-20", "#ffccdf"),      # rosa
+        ("Duhalde", "2002-01-02", "2003-05-24", "#d6f5d6"),        # verde claro
+        ("Néstor Kirchner", "2003-05-25", "2007-12-09", "#d9eefc"),# celeste claro
+        ("Cristina Fernández", "2007-12-10", "2015-12-09", "#bfe6ff"), # celeste
+        ("Macri", "2015-12-10", "2019-12-09", "#fff3b0"),         # amarillo pálido
+        ("Fernández", "2019-12-10", "2023-11-30", "#cce5ff"),     # celeste pálido
+        ("Milei", "2023-12-01", df["fecha"].max(), "#e6ccff")     # violeta pálido
+    ]
 
 
-# =====================
-# Gráfico Beca Doctoral CONICET (format/style matched to grafico_salarios_CIC.png)
-# =====================
+@lru_cache(maxsize=None)
+def salario_hora_profasis():
+    """Salario por hora Profasis desde 2020 en pesos del último mes de IPC"""
+    # Leer datos profasis (desde 2020)
+    df_prof_crudo = pd.read_csv("datos/crudo_profasis.csv", parse_dates=["fecha"])
 
-# Leer el archivo CSV de CONICET
-df_con = pd.read_csv("datos/beca_conicet.csv", parse_dates=["fecha"]) 
-
-# Crear figura
-figc, axc = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
-
-# Dibujar fondos de colores por período (usar same selection as CIC: desde 2015 en adelante)
-for nombre, inicio, fin, color in periodos_cic:
-    # Exclude Cristina Fernández from the legend (same behavior as CIC)
-    label_name = '_nolegend_' if 'Cristina' in nombre else nombre
-    axc.axvspan(pd.to_datetime(inicio), pd.to_datetime(fin), color=color, alpha=0.6, label=label_name)
-
-
-# Dibujar línea con puntos
-axc.plot(df_con["fecha"], df_con["salario_real"], color="black", linewidth=2,
-         marker='o', markersize=3, label="Beca Doctoral")
-
-# Eje Y: igual que CIC (ticks cada 100k, formatter millones_coma)
-min_value_c = df_con["salario_real"].min()
-max_value_c = df_con["salario_real"].max()
-ylim_min_c = np.floor(0.95 * min_value_c / 100000) * 100000
-ylim_max_c = np.ceil(1.05 * max_value_c / 100000) * 100000
-axc.set_ylim(ylim_min_c, ylim_max_c)
-yticks_c = np.arange(ylim_min_c, ylim_max_c + 100000, 100000)
-axc.set_yticks(yticks_c)
-axc.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
-
-# Líneas horizontales en cada tick
-for y in yticks_c:
-    axc.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
-
-# Mirror y-axis labels on the right side (copy font properties)
-axc_right = axc.twinx()
-axc_right.set_ylim(ylim_min_c, ylim_max_c)
-axc_right.set_yticks(yticks_c)
-axc_right.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
-left_labels_c = axc.yaxis.get_ticklabels()
-if len(left_labels_c) > 0:
-    left_fp_c = left_labels_c[0].get_fontproperties()
-    for lbl in axc_right.yaxis.get_ticklabels():
-        lbl.set_fontproperties(left_fp_c)
-else:
-    axc_right.tick_params(axis='y', labelsize=20)
-
-# Formatear eje de fechas (same styling as CIC)
-axc.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-start_year_c = max(2016, df_con['fecha'].min().year)
-end_year_c = max(df_con['fecha'].max().year, 2026)
-ticks_c_years = [pd.to_datetime(f"{y}-01-01") for y in range(start_year_c, end_year_c+1)]
-axc.set_xticks(ticks_c_years)
-axc.tick_params(axis='x', rotation=45)
-for lbl in axc.get_xticklabels():
-    lbl.set_ha('right')
-
-# Set x-limits similar to CIC (but anchored to data range if earlier)
-axc.set_xlim(left=pd.to_datetime("2016-01-01"), right=pd.to_datetime("2026-07-01"))
-
-# Update title with dynamic date reference
-last_date_c = df_con["fecha"].max()
-last_date_str_c = f"{MONTH_NAMES[last_date_c.month]} de {last_date_c.year}"
-axc.set_title(f"Beca Doctoral CONICET\n(ajustado por inflación, en pesos de {last_date_str_c})", fontsize=28)
-axc.set_xlabel("Fecha", fontsize=20)
-axc.set_ylabel("Salario real (millones)", fontsize=20)
-axc.legend(fontsize=20)
-
-# Footnote specific to CONICET (centered like other plots)
-footnote_con = (
-    f"Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\n"
-    f"Serie reconstruida en base a publicaciones periódicas de CONICET y actas paritarias de UPCN. Gráfico generado el {current_date}.\n{_AUTHOR}"
-)
-plt.figtext(0.5, 0.01, footnote_con, ha="center", fontsize=14, style='italic')
-
-# Ajustar diseño y guardar
-plt.tight_layout(rect=[0, 0.06, 1, 1])
-plt.savefig("plots/grafico_beca_doctoral.png")
-plt.close()
+    # Leer índice IPC para ajuste por inflación
+    df_ipc = leer_tabla("datos/ipc_nuevo.csv")
 
+    # Calcular salario por hora usando 176 horas mensuales
+    df_prof_crudo["salario_hora"] = df_prof_crudo["salario"] / HORAS_MENSUALES
 
+    # Extender IPC si falta algún mes
+    last_prof_date = df_prof_crudo['fecha'].max()
+    df_ipc = extender_ipc(df_ipc, last_prof_date)
 
+    # Fusionar con IPC para ajuste
+    df_prof_hora = df_prof_crudo.merge(df_ipc, on="fecha", how="left")
 
-# =====================
-# Segundo gráfico: índice base 100 en 2015-12-01
-# =====================
+    # Obtener el último índice IPC disponible
+    ultimo_indice = df_ipc["indice"].iloc[-1]
+    ultima_fecha = df_ipc["fecha"].iloc[-1]
+
+    # Ajustar salario por hora a pesos de la última fecha
+    # Fórmula: salario_ajustado = salario_nominal * (indice_ultimo / indice_mes)
+    df_prof_hora["salario_hora_ajustado"] = df_prof_hora["salario_hora"] * (ultimo_indice / df_prof_hora["indice"])
+    return df_prof_hora
+
+
+def empalmar_profasis(df_prof_nominal, df_prof_index, df_ipc):
+    """
+    Empalma la serie índice base 100 de Profasis (`df_prof_index`: fecha, indice)
+    con el salario nominal (`df_prof_nominal`: fecha, salario) ajustado por IPC y
+    la expresa en pesos del último salario nominal.
+    Retorna (df_index_full, last_nominal_date, nominal_last_value), con df_index_full
+    en las columnas de plots/profasis_plotted_series.csv
+    """
+    # Determinar fecha y salario nominal más reciente
+    last_nominal_date = df_prof_nominal["fecha"].max()
+    last_nominal_value = df_prof_nominal.loc[df_prof_nominal["fecha"] == last_nominal_date, "salario"].values
+    if last_nominal_value.size == 0:
+        # fallback to last available nominal
+        last_nominal_value = df_prof_nominal["salario"].iloc[-1]
+    else:
+        last_nominal_value = last_nominal_value[0]
+
+    # Obtener el último índice disponible y asegurar que el salario nominal usado
+    # corresponde a la misma fecha del índice (si el índice no llega hasta el
+    # último nominal, elegir el nominal más cercano al último índice disponible).
+    last_index_date = df_prof_index["fecha"].max()
+    last_index_value = df_prof_index.loc[df_prof_index["fecha"] == last_index_date, "indice"].values[0]
+    if last_nominal_date != last_index_date:
+        # intentar usar el salario nominal en la fecha del último índice
+        nominal_on_index = df_prof_nominal.loc[df_prof_nominal["fecha"] == last_index_date, "salario"]
+        if nominal_on_index.size > 0:
+            last_nominal_value = nominal_on_index.values[0]
+            last_nominal_date = last_index_date
+        else:
+            # usar el nominal más cercano en el tiempo al último índice
+            idx_near = (df_prof_nominal["fecha"] - last_index_date).abs().argmin()
+            last_nominal_value = df_prof_nominal.iloc[idx_near]["salario"]
+            last_nominal_date = df_prof_nominal.iloc[idx_near]["fecha"]
+
+    # Calcular proyección de la serie histórica en pesos de la última fecha
+    # Paso 1: ajustar crudo_profasis por IPC para obtener salarios "reales" (pesos de la última fecha IPC)
+    # Extender IPC si falta algún mes (como hace actualiza_datos_IPC.py)
+    last_nominal_date_ext = df_prof_nominal['fecha'].max()
+    df_ipc = extender_ipc(df_ipc, last_nominal_date_ext)
+
+    ultimo_indice_ipc = df_ipc["indice"].iloc[-1]
+
+    # Fusionar IPC con crudo nominal
+    df_prof_nominal = df_prof_nominal.merge(df_ipc, on='fecha', how='left')
+    df_prof_nominal['salario_real_ipc'] = df_prof_nominal['salario'] * (ultimo_indice_ipc / df_prof_nominal['indice'])
+
+    # Paso 2: extendemos la serie base100 hasta el último mes nominal disponible
+    last_nominal_date = df_prof_nominal['fecha'].max()
+    nominal_last_value = df_prof_nominal.loc[df_prof_nominal['fecha'] == last_nominal_date, 'salario'].values[0]
+
+    # referencia: valor base100 en su última fecha
+    base_last_date = df_prof_index['fecha'].max()
+    base_last_value = df_prof_index.loc[df_prof_index['fecha'] == base_last_date, 'indice'].values[0]
+
+    # referencia para escala temporal: usar salario real de referencia en 2026-01-01 (o nearest)
+    ref_date = pd.to_datetime('2026-01-01')
+    if ref_date not in df_prof_nominal['fecha'].values:
+        # choose nearest previous
+        ref_date = df_prof_nominal.loc[df_prof_nominal['fecha'] <= ref_date, 'fecha'].max()
+    ref_real = df_prof_nominal.loc[df_prof_nominal['fecha'] == ref_date, 'salario_real_ipc'].values[0]
+
+    # crear rango mensual desde primer mes del base100 hasta último nominal
+    full_dates = pd.date_range(start=df_prof_index['fecha'].min(), end=last_nominal_date, freq='MS')
+    df_index_full = pd.DataFrame({'fecha': full_dates})
+
+    # incorporar índice original donde exista
+    df_index_full = df_index_full.merge(df_prof_index, on='fecha', how='left')
+
+    # incorporar salario_real_ipc por fecha si existe (no traer la columna nominal 'salario')
+    df_index_full = df_index_full.merge(df_prof_nominal[['fecha','salario_real_ipc']], on='fecha', how='left')
+
+    # Calcular indice_ext: para fechas posteriores al último base100, usar
+    # indice_ext[month] = salario_real_ipc[month] / ref_real * base_last_value
+    idx_ext = []
+    for _, row in df_index_full.iterrows():
+        d = row['fecha']
+        if pd.notna(row.get('indice')):
+            idx_ext.append(row['indice'])
+        else:
+            if pd.notna(row.get('salario_real_ipc')):
+                val = row['salario_real_ipc'] / ref_real * base_last_value
+                idx_ext.append(val)
+            else:
+                idx_ext.append(np.nan)
+
+    df_index_full['indice_ext'] = idx_ext
+    df_index_full['indice_ext'] = df_index_full['indice_ext'].ffill()
+
+    # Paso 3: escalar indice_ext para que su valor en last_nominal_date corresponda
+    # al último salario nominal disponible
+    if last_nominal_date in df_index_full['fecha'].values:
+        idx_at_last = df_index_full.loc[df_index_full['fecha'] == last_nominal_date, 'indice_ext'].values[0]
+    else:
+        idx_at_last = df_index_full['indice_ext'].iloc[-1]
+
+    df_index_full['salario_pesos_actuales'] = df_index_full['indice_ext'] / idx_at_last * nominal_last_value
+    return df_index_full, last_nominal_date, nominal_last_value
+
+
+@lru_cache(maxsize=None)
+def empalme_profasis_historico():
+    """empalmar_profasis con los archivos de datos/"""
+    # Leer datos nominales recientes
+    df_prof_nominal = pd.read_csv("datos/crudo_profasis.csv", parse_dates=["fecha"]) 
+
+    # Leer serie índice base 100 (ya ajustada por inflación)
+    df_prof_index = pd.read_csv("datos/profasis_base100.csv", header=None,
+                                names=["fecha", "indice"], parse_dates=["fecha"],
+                                skipinitialspace=True)
+
+    df_ipc = leer_tabla("datos/ipc_nuevo.csv")
+    return empalmar_profasis(df_prof_nominal, df_prof_index, df_ipc)
+
+
+@lru_cache(maxsize=None)
+def serie_profasis_historica():
+    """
+    Serie histórica Profasis (base100 empalmada con crudo ajustado por IPC) en pesos
+    actuales. Retorna (df_prof_index, last_nominal_date, nominal_last_value)
+    """
+    df_index_full, last_nominal_date, nominal_last_value = empalme_profasis_historico()
+
+    # preparar df_prof_index para graficar (usar fecha y salario_pesos_actuales como serie)
+    df_prof_index = df_index_full[['fecha','salario_pesos_actuales','salario_real_ipc']].copy()
+    df_prof_index["salario_por_hora_actual"] = df_prof_index["salario_real_ipc"].fillna(df_prof_index["salario_pesos_actuales"]) / HORAS_MENSUALES
+    return df_prof_index, last_nominal_date, nominal_last_value
+
+
+@lru_cache(maxsize=None)
+def proyecciones_por_hora():
+    """
+    Proyecciones del salario por hora Profasis hasta nov-2027: tendencia lineal
+    (sep-2024 a mar-2026), aumentos ofrecidos y Ley de Financiamiento Universitario
+    """
+    df_prof_index, _, _ = serie_profasis_historica()
+    df_prof_hora = salario_hora_profasis()
+
+    # Fit linear trend on Sep-2024 to Mar-2026
+    trend_start = pd.to_datetime("2024-09-01")
+    trend_end = pd.to_datetime("2026-03-01")
+    mask_trend = (df_prof_index["fecha"] >= trend_start) & (df_prof_index["fecha"] <= trend_end)
+    recent_trend = df_prof_index.loc[mask_trend].copy()
+    x_trend = mdates.date2num(recent_trend["fecha"]).astype(float)
+    y_trend = recent_trend["salario_por_hora_actual"].values.astype(float)
+    coeff_trend = np.polyfit(x_trend, y_trend, 1)
+    trend_fn = np.poly1d(coeff_trend)
+
+    # Projection range: from last observed date to Nov 2027
+    last_date_trend = df_prof_index["fecha"].max()
+    proj_end_trend = pd.to_datetime("2027-11-01")
+    months_after_trend = pd.date_range(
+        start=(last_date_trend + pd.offsets.MonthBegin(1)).normalize(),
+        end=proj_end_trend, freq='MS'
+    )
+    proj_dates_trend = pd.DatetimeIndex([last_date_trend]).append(months_after_trend)
+
+    # Compute trend values offset so trend starts at last actual value
+    trend_vals_trend = trend_fn(mdates.date2num(proj_dates_trend))
+    delta_trend = df_prof_index["salario_por_hora_actual"].iloc[-1] - trend_vals_trend[0]
+    proj_y_trend = trend_vals_trend + delta_trend
+
+    # Apply discrete bumps (additive to preserve slope): +21% in Jun-2026, +3% in Oct-2026
+    proj_y_bumped = proj_y_trend.copy()
+    jun_2026 = pd.to_datetime("2026-06-01")
+    oct_2026 = pd.to_datetime("2026-10-01")
+    jun_idx = (proj_dates_trend == jun_2026).nonzero()[0][0]
+    oct_idx = (proj_dates_trend == oct_2026).nonzero()[0][0]
+    bump_jun = proj_y_trend[jun_idx] * 0.21
+    bump_oct = proj_y_trend[oct_idx] * 0.03
+    proj_y_bumped[jun_idx:] += bump_jun
+    proj_y_bumped[oct_idx:] += bump_oct
+
+    # Third projection: Ley de Financiamiento Universitario
+    # June 2026 value = Nov 2023 real salary, same downward slope, only from Jun-2026 onward
+    nov_2023_val = df_prof_hora.loc[df_prof_hora["fecha"] == pd.to_datetime("2023-11-01"),
+                                     "salario_hora_ajustado"].values[0]
+    slope = coeff_trend[0]  # daily slope from polyfit
+    jun_2026_num = mdates.date2num(jun_2026)
+    # LFY only from June 2026 onward
+    mask_lfy = proj_dates_trend >= jun_2026
+    proj_dates_lfy = proj_dates_trend[mask_lfy]
+    proj_y_lfy = np.array([
+        nov_2023_val + slope * (mdates.date2num(d) - jun_2026_num)
+        for d in proj_dates_lfy
+    ])
+    last_obs_y = df_prof_index["salario_por_hora_actual"].iloc[-1]
+    return (proj_dates_trend, proj_y_trend, proj_y_bumped, proj_dates_lfy, proj_y_lfy,
+            jun_idx, jun_2026, nov_2023_val, last_obs_y)
+
+
+def grafico_salario_real(tipo):
+    """
+    Salario real (pesos del último mes) de una serie de series.json con los
+    fondos presidenciales desde 2015. Opciones en graficos.salario_real: archivo,
+    titulo (con {mes}), etiqueta, alpha, nota y nota_alineacion ("right" o "center")
+    """
+    opciones = cargar_series()[tipo]["graficos"]["salario_real"]
+
+    # Leer el archivo CSV
+    df = leer_tabla(f"datos/{tipo}.csv")
+
+    # Crear figura
+    fig, ax = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
+
+    # Dibujar fondos de colores por período
+    # Para series iniciando en 2015 sólo mostrar presidencias
+    # que se solapen con 2015 en adelante
+    periodos_cic = [p for p in periodos_presidenciales() if pd.to_datetime(p[2]) >= pd.to_datetime("2015-01-01")]
+    for nombre, inicio, fin, color in periodos_cic:
+        # Exclude Cristina Fernández from the legend (still draw the span)
+        label_name = '_nolegend_' if 'Cristina' in nombre else nombre
+        ax.axvspan(pd.to_datetime(inicio), pd.to_datetime(fin), color=color, alpha=opciones.get("alpha"),
+                   label=label_name)
+
+    # Dibujar línea con puntos
+    ax.plot(df["fecha"], df["salario_real"], color="black", linewidth=2,
+            marker='o', markersize=3, label=opciones.get("etiqueta", "Salario"))
+
+    # Eje Y: límites y ticks basados en los datos
+    min_value = df["salario_real"].min()
+    max_value = df["salario_real"].max()
+    ylim_min = np.floor(0.95 * min_value / 100000) * 100000
+    ylim_max = np.ceil(1.05 * max_value / 100000) * 100000
 
-# Calcular índice base 100
-base_fecha = pd.to_datetime("2015-12-01")
-base_valor = df.loc[df["fecha"] == base_fecha, "salario_real"].values
-if base_valor.size == 0:
-    raise ValueError("No se encontró la fecha base 2015-12-01 en los datos.")
-base_valor = base_valor[0]
-df["indice_base_100"] = df["salario_real"] / base_valor * 100
-
-# Crear figura para el gráfico con base 100
-fig2, ax2 = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
-
-# Fondos presidenciales (solo desde 2015 en adelante, excluir presidentes anteriores)
-periodos_base100 = [p for p in periodos if pd.to_datetime(p[2]) >= pd.to_datetime("2015-01-01")]
-for nombre, inicio, fin, color in periodos_base100:
-    ax2.axvspan(pd.to_datetime(inicio), pd.to_datetime(fin), color=color, label=nombre)
-
-# Serie índice
-ax2.plot(df["fecha"], df["indice_base_100"], color="black", linewidth=2,
-         marker='o', markersize=3, label="Salario real")
-
-# Líneas horizontales
-yticks2 = np.arange(50, 110, 10)
-ax2.set_yticks(yticks2)
-for y in yticks2:
-    ax2.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
-
-# Ejes: x-axis de 2015 a 2027
-ax2.set_xlim(left=pd.to_datetime("2015-01-01"), right=pd.to_datetime("2027-12-01") + pd.offsets.MonthEnd(0))
-ax2.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-start_year_b100 = 2015
-end_year_b100 = 2027
-ticks_b100 = [pd.to_datetime(f"{y}-01-01") for y in range(start_year_b100, end_year_b100+1)]
-ax2.set_xticks(ticks_b100)
-ax2.set_title("Salario de bolsillo ajustado por inflación\nBase 100 = diciembre de 2015", fontsize=28)
-ax2.set_xlabel("Fecha", fontsize=20)
-ax2.set_ylabel("Salario (base 100)", fontsize=20)
-ax2.legend(fontsize=18)
-plt.xticks(rotation=45)
-
-# Comentario
-plt.figtext(0.5, 0.01, footnote_text,
-            ha="center", fontsize=14, style='italic')
-
-
-# Guardar
-plt.tight_layout(rect=[0, 0.06, 1, 1])  # Increased bottom margin from 0.03 to 0.06
-plt.savefig("plots/grafico_indice_base_100.png")
-plt.close()
+    ax.set_ylim(ylim_min, ylim_max)
+    yticks = np.arange(ylim_min, ylim_max + 100000, 100000)
+    ax.set_yticks(yticks)
 
+    ax.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
+
+    # Líneas horizontales en cada tick
+    for y in yticks:
+        ax.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
+
+    # Mirror y-axis labels on the right side
+    if not borrador.activo:
+        ax_right = ax.twinx()
+        ax_right.set_ylim(ylim_min, ylim_max)
+        ax_right.set_yticks(yticks)
+        ax_right.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
+        # Copy font properties from left y-tick labels so size and font match exactly
+        left_labels = ax.yaxis.get_ticklabels()
+        if len(left_labels) > 0:
+            left_fp = left_labels[0].get_fontproperties()
+            for lbl in ax_right.yaxis.get_ticklabels():
+                lbl.set_fontproperties(left_fp)
+        else:
+            ax_right.tick_params(axis='y', labelsize=20)
+
+    # Formatear eje de fechas
+    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    # Explicit January ticks so year labels align with January data points
+    start_year = max(2016, df['fecha'].min().year)
+    end_year = max(df['fecha'].max().year, 2026)
+    ticks = [pd.to_datetime(f"{y}-01-01") for y in range(start_year, end_year+1)]
+    ax.set_xticks(ticks)
+    ax.tick_params(axis='x', rotation=45)
+    for lbl in ax.get_xticklabels():
+        lbl.set_ha('right')
+    # Force x-axis start at January 2016 and limit to July 2026
+    ax.set_xlim(left=pd.to_datetime("2016-01-01"), right=pd.to_datetime("2026-07-01"))
+    # Get the last date from the data
+    last_date = df["fecha"].max()
+    last_date_str = f"{MONTH_NAMES[last_date.month]} de {last_date.year}"
+
+    # Update title with dynamic date reference
+    ax.set_title(opciones["titulo"].format(mes=last_date_str), fontsize=28)
+    ax.set_xlabel("Fecha", fontsize=20)
+    ax.set_ylabel("Salario real (millones)", fontsize=20)
+    ax.legend(fontsize=20)
+
+    footnote = f"{opciones['nota']}. Gráfico generado el {current_date}.\n{_AUTHOR}"
+    if opciones.get("nota_alineacion", "center") == "right":
+        plt.figtext(0.98, 0.01, footnote, ha="right", fontsize=14, style='italic')
+    else:
+        plt.figtext(0.5, 0.01, footnote, ha="center", fontsize=14, style='italic')
+
+    # Ajustar diseño y guardar
+    plt.tight_layout(rect=[0, 0.06, 1, 1])  # Increased bottom margin
+    exportacion.guardar(f"plots/{opciones['archivo']}")
+    plt.close()
+
+
+def grafico_indice_base_100():
+    """Índice base 100 en 2015-12-01"""
+    df = leer_tabla("datos/cic.csv")
+    periodos = periodos_presidenciales()
+
+    # Calcular índice base 100
+    base_fecha = pd.to_datetime("2015-12-01")
+    base_valor = df.loc[df["fecha"] == base_fecha, "salario_real"].values
+    if base_valor.size == 0:
+        raise ValueError("No se encontró la fecha base 2015-12-01 en los datos.")
+    base_valor = base_valor[0]
+    df["indice_base_100"] = df["salario_real"] / base_valor * 100
+
+    # Crear figura para el gráfico con base 100
+    fig2, ax2 = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
+
+    # Fondos presidenciales (solo desde 2015 en adelante, excluir presidentes anteriores)
+    periodos_base100 = [p for p in periodos if pd.to_datetime(p[2]) >= pd.to_datetime("2015-01-01")]
+    for nombre, inicio, fin, color in periodos_base100:
+        ax2.axvspan(pd.to_datetime(inicio), pd.to_datetime(fin), color=color, label=nombre)
+
+    # Serie índice
+    ax2.plot(df["fecha"], df["indice_base_100"], color="black", linewidth=2,
+             marker='o', markersize=3, label="Salario real")
+
+    # Líneas horizontales
+    yticks2 = np.arange(50, 110, 10)
+    ax2.set_yticks(yticks2)
+    for y in yticks2:
+        ax2.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
+
+    # Ejes: x-axis de 2015 a 2027
+    ax2.set_xlim(left=pd.to_datetime("2015-01-01"), right=pd.to_datetime("2027-12-01") + pd.offsets.MonthEnd(0))
+    ax2.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    start_year_b100 = 2015
+    end_year_b100 = 2027
+    ticks_b100 = [pd.to_datetime(f"{y}-01-01") for y in range(start_year_b100, end_year_b100+1)]
+    ax2.set_xticks(ticks_b100)
+    ax2.set_title("Salario de bolsillo ajustado por inflación\nBase 100 = diciembre de 2015", fontsize=28)
+    ax2.set_xlabel("Fecha", fontsize=20)
+    ax2.set_ylabel("Salario (base 100)", fontsize=20)
+    ax2.legend(fontsize=18)
+    plt.xticks(rotation=45)
+
+    # Comentario
+    plt.figtext(0.5, 0.01, footnote_text(),
+                ha="center", fontsize=14, style='italic')
+
+
+    # Guardar
+    plt.tight_layout(rect=[0, 0.06, 1, 1])  # Increased bottom margin from 0.03 to 0.06
+    exportacion.guardar("plots/grafico_indice_base_100.png")
+    plt.close()
 
 
 ##### GRAFICO SALARIO NOMINAL VERSUS AJUSTADO #####
@@ -280,7 +459,7 @@ def plot_nominal_vs_adjusted(csv_file, title_prefix,subtitle, output_filename, f
         Custom footnote text (defaults to standard UPCN text if None)
     """
     # Read data
-    df = pd.read_csv(csv_file, parse_dates=["fecha"])
+    df = leer_tabla(csv_file)
     
     # Create figure
     fig, ax = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
@@ -291,48 +470,6 @@ def plot_nominal_vs_adjusted(csv_file, title_prefix,subtitle, output_filename, f
     ax.plot(df["fecha"], df["ajustado"], color="red", linewidth=4,
             marker='o', markersize=6, label="Salario ajustado por inflación", zorder=2.6)
     
-    # Define point properties for labels
-    points = [
-        (df["fecha"].iloc[0], df["nominal"].iloc[0], 'blue', 25, 2),      # First nominal
-        (df["fecha"].iloc[-1], df["nominal"].iloc[-1], 'blue', -5, 15),    # Last nominal
-        (df["fecha"].iloc[-1], df["ajustado"].iloc[-1], 'red', -5, 15)     # Last adjusted
-    ]
-    
-    # Create text labels with boxes
-    texts = []
-    for date, value, color, dx, dy in points:
-        bbox_props = dict(
-            boxstyle='round,pad=0.5',
-            fc='white',
-            ec=color,
-            alpha=1,
-            zorder=3
-        )
-        
-        annotation = ax.annotate(
-            f'${value:,.0f}',
-            xy=(date, value),           # Point to annotate (arrow end)
-            xycoords='data',            # Use data coordinates for point
-            xytext=(dx, dy),      # Offset for label position
-            textcoords='offset points', # Use offset points for label
-            color=color,
-            fontsize=13,
-            fontweight='bold',
-            bbox=bbox_props,
-            horizontalalignment='right' if dx < 0 else 'left',
-            verticalalignment='bottom' if dy > 0 else 'top',
-            arrowprops=dict(
-                arrowstyle='->',
-                connectionstyle='arc3,rad=0',
-                color=color,
-                shrinkB=4,
-                lw=2,
-                zorder=2.5
-            ),
-            zorder=3
-        )
-        texts.append(annotation)
-
     # Y axis setup
     min_value = min(df["nominal"].min(), df["ajustado"].min())
     max_value = max(df["nominal"].max(), df["ajustado"].max())
@@ -348,16 +485,18 @@ def plot_nominal_vs_adjusted(csv_file, title_prefix,subtitle, output_filename, f
         ax.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
     
     # Secondary Y axis
-    ax2 = ax.twinx()
-    ax2.set_ylim(ylim_min, ylim_max)
-    ax2.set_yticks(yticks)
+    if not borrador.activo:
+        ax2 = ax.twinx()
+        ax2.set_ylim(ylim_min, ylim_max)
+        ax2.set_yticks(yticks)
     
     # Custom formatter for y-axis labels
     def millones_formatter(x, p):
         return f"{x/1000000:,.1f}M".replace(".", ",")
     
     ax.yaxis.set_major_formatter(plt.FuncFormatter(millones_formatter))
-    ax2.yaxis.set_major_formatter(plt.FuncFormatter(millones_formatter))
+    if not borrador.activo:
+        ax2.yaxis.set_major_formatter(plt.FuncFormatter(millones_formatter))
     
 
 
@@ -366,14 +505,16 @@ def plot_nominal_vs_adjusted(csv_file, title_prefix,subtitle, output_filename, f
     ax.xaxis.set_major_locator(mdates.MonthLocator())
     ax.tick_params(axis='x', rotation=90, labelsize=12)
     ax.tick_params(axis='y', labelsize=12)
-    ax2.tick_params(axis='y', labelsize=12)
+    if not borrador.activo:
+        ax2.tick_params(axis='y', labelsize=12)
     
     # Labels and title
     full_title = f"{title_prefix}\n{subtitle}"
     ax.set_title(full_title, fontsize=28)
     ax.set_xlabel("Fecha", fontsize=20)
     ax.set_ylabel("Salario", fontsize=20)
-    ax2.set_ylabel("Salario", fontsize=20)
+    if not borrador.activo:
+        ax2.set_ylabel("Salario", fontsize=20)
     ax.legend(fontsize=20, loc='upper left')
     
     # Footnote
@@ -389,824 +530,798 @@ def plot_nominal_vs_adjusted(csv_file, title_prefix,subtitle, output_filename, f
     
     # Save plot
     plt.tight_layout(rect=[0, 0.06, 1, 1])  # Increased bottom margin
+
+    # Etiquetas del primer valor, el último nominal y el último ajustado
+    colocar_etiquetas(ax, [
+        (df["fecha"].iloc[0], df["nominal"].iloc[0], f'${df["nominal"].iloc[0]:,.0f}', 'blue'),
+        (df["fecha"].iloc[-1], df["nominal"].iloc[-1], f'${df["nominal"].iloc[-1]:,.0f}', 'blue'),
+        (df["fecha"].iloc[-1], df["ajustado"].iloc[-1], f'${df["ajustado"].iloc[-1]:,.0f}', 'red'),
+    ])
     #Add "plots/" to output_filename
     output_filename = "plots/" + output_filename
-    plt.savefig(output_filename)
+    exportacion.guardar(output_filename)
     plt.close()
 
-# Usage examples:
-plot_nominal_vs_adjusted(
-    "datos/cic_ajustado.csv",
-    "Salario de bolsillo vs Ajustado por inflación",
-    "Investigador asistente",
-    "grafico_nominal_vs_ajustado_cic.png",
-    "Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\nSerie salarial reconstruida en base a actas paritarias de UPCN"
-)
-
-plot_nominal_vs_adjusted(
-    "datos/beca_conicet_ajustado.csv",
-    "Salario de bolsillo vs Ajustado por inflación",
-    "Beca Doctoral CONICET",
-    "grafico_nominal_vs_ajustado_beca_conicet.png",
-    "Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\nSerie salarial reconstruida en base a recibos de sueldo de CONICET"
-)
-
-plot_nominal_vs_adjusted(
-    "datos/foncyt_ajustado.csv",
-    "Salario de bolsillo vs Ajustado por inflación",
-    "Beca Doctoral FONCyT",
-    "grafico_nominal_vs_ajustado_foncyt.png",
-    "Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\nSerie salarial reconstruida en base a recibos de sueldo de FONCyT"
-)
-
-plot_nominal_vs_adjusted(
-    "datos/profasis_ajustado.csv",
-    "Salario de bolsillo vs Ajustado por inflación",
-    "Profesor Asistente (JTP) - Dedicación Exclusiva",
-    "grafico_nominal_vs_ajustado_profasis.png",
-    "Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\nSerie salarial reconstruida en base a recibos de sueldo de UNC"
-)
-
-plot_nominal_vs_adjusted(
-    "datos/art9_ajustado.csv",
-    "Salario de bolsillo vs Ajustado por inflación",
-    "Art. 9 - Personal contratado CONICET",
-    "grafico_nominal_vs_ajustado_art9.png",
-    "Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\nSerie salarial reconstruida en base a recibos de sueldo de UNC"
-)
-
-plot_nominal_vs_adjusted(
-    "datos/resgarrahan_ajustado.csv",
-    "Salario de bolsillo vs Ajustado por inflación",
-    "Salario para residentes de 1er año del Hospital Garrahan",
-    "grafico_nominal_vs_ajustado_resgarrahan.png",
-    "Inflación según INDEC (IPC). Se incluye el bono incluído en el decreto 527/2025.\nSe estima IPC constante para el último mes si no hay dato disponible.\nSerie salarial estimada a partir de actas paritarias de ATE"
-)
+def grafico_salario_por_hora_profasis():
+    """Salario por hora Profasis (176 horas mensuales) - Serie histórica desde 2020"""
+    df_prof_hora = salario_hora_profasis()
 
+    # Crear figura
+    fig_prof_hora, ax_prof_hora = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
 
-# =====================
-# Gráfico: Salario por hora Profasis (176 horas mensuales) - Serie histórica desde 2020
-# =====================
-
-# Leer datos profasis (desde 2020)
-df_prof_crudo = pd.read_csv("datos/crudo_profasis.csv", parse_dates=["fecha"])
+    # Dibujar fondos de colores por período (Macri sin leyenda, otros con nombres modificados)
+    ax_prof_hora.axvspan(pd.to_datetime("2015-12-01"), pd.to_datetime("2019-11-30"), color="#fff3b0")  # Macri sin leyenda
+    ax_prof_hora.axvspan(pd.to_datetime("2019-12-01"), pd.to_datetime("2023-11-30"), color="#cce5ff", label="Presidencia Fernández")  # Fernández
+    ax_prof_hora.axvspan(pd.to_datetime("2023-12-01"), df_prof_hora["fecha"].max(), color="#e6ccff", label="Presidencia Milei")  # Milei
 
-# Leer índice IPC para ajuste por inflación
-df_ipc = pd.read_csv("datos/ipc_nuevo.csv", parse_dates=["fecha"])
+    # Plot única serie: salario por hora ajustado por inflación (curva negra)
+    ax_prof_hora.plot(df_prof_hora["fecha"], df_prof_hora["salario_hora_ajustado"], color="black", linewidth=4,
+                      marker='o', markersize=4, label="Salario por hora", zorder=2.7)
 
-# Calcular salario por hora usando 176 horas mensuales
-HORAS_MENSUALES = 176
-df_prof_crudo["salario_hora"] = df_prof_crudo["salario"] / HORAS_MENSUALES
-
-# Extender IPC si falta algún mes
-last_prof_date = df_prof_crudo['fecha'].max()
-while df_ipc["fecha"].max() < last_prof_date:
-    next_date = df_ipc["fecha"].max() + pd.DateOffset(months=1)
-    projected = df_ipc["indice"].iloc[-1] * (df_ipc["indice"].iloc[-1] / df_ipc["indice"].iloc[-2])
-    df_ipc = pd.concat([df_ipc, pd.DataFrame({"fecha": [next_date], "indice": [projected]})], ignore_index=True)
-
-# Fusionar con IPC para ajuste
-df_prof_hora = df_prof_crudo.merge(df_ipc, on="fecha", how="left")
-
-# Obtener el último índice IPC disponible
-ultimo_indice = df_ipc["indice"].iloc[-1]
-ultima_fecha = df_ipc["fecha"].iloc[-1]
-
-# Ajustar salario por hora a pesos de la última fecha
-# Fórmula: salario_ajustado = salario_nominal * (indice_ultimo / indice_mes)
-df_prof_hora["salario_hora_ajustado"] = df_prof_hora["salario_hora"] * (ultimo_indice / df_prof_hora["indice"])
-
-# Crear figura
-fig_prof_hora, ax_prof_hora = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
-
-# Dibujar fondos de colores por período (Macri sin leyenda, otros con nombres modificados)
-ax_prof_hora.axvspan(pd.to_datetime("2015-12-01"), pd.to_datetime("2019-11-30"), color="#fff3b0")  # Macri sin leyenda
-ax_prof_hora.axvspan(pd.to_datetime("2019-12-01"), pd.to_datetime("2023-11-30"), color="#cce5ff", label="Presidencia Fernández")  # Fernández
-ax_prof_hora.axvspan(pd.to_datetime("2023-12-01"), df_prof_hora["fecha"].max(), color="#e6ccff", label="Presidencia Milei")  # Milei
-
-# Plot única serie: salario por hora ajustado por inflación (curva negra)
-ax_prof_hora.plot(df_prof_hora["fecha"], df_prof_hora["salario_hora_ajustado"], color="black", linewidth=4,
-                  marker='o', markersize=4, label="Salario por hora", zorder=2.7)
-
-# Encontrar el punto de Noviembre 2023 (cambio de fuente de datos)
-nov_2023 = pd.to_datetime("2023-11-01")
-nov_2023_idx = df_prof_hora[df_prof_hora["fecha"] == nov_2023].index
-if len(nov_2023_idx) > 0:
-    nov_2023_idx = nov_2023_idx[0]
-    nov_2023_value = df_prof_hora.loc[nov_2023_idx, "salario_hora_ajustado"]
-else:
-    # Si no encuentra exacto, buscar el más cercano
-    nov_2023_idx = (df_prof_hora["fecha"] - nov_2023).abs().argmin()
-    nov_2023_value = df_prof_hora.iloc[nov_2023_idx]["salario_hora_ajustado"]
-    nov_2023_date = df_prof_hora.iloc[nov_2023_idx]["fecha"]
-
-# Línea horizontal punteada gris oscura desde nov-2023 hasta el final
-last_date = df_prof_hora["fecha"].max()
-ax_prof_hora.hlines(y=nov_2023_value, xmin=nov_2023, xmax=last_date,
-                    colors='#404040', linestyles='dotted', linewidth=2,
-                    label='Ley de Financiamiento Universitario', zorder=2.6)
-
-# Texto sobre la línea punteada
-ax_prof_hora.text(pd.to_datetime("2025-01-01"), nov_2023_value * 1.01,
-                  "Ley de Financiamiento Universitario",
-                  color='#404040', fontsize=13, fontweight='bold',
-                  ha='center', va='bottom', zorder=2.8)
-
-# Etiqueta al final de la línea punteada (con borde gris oscuro, alineada a la derecha)
-ax_prof_hora.annotate(f'${nov_2023_value:.0f}', 
-                      xy=(last_date, nov_2023_value),
-                      xytext=(5, 0),
-                      textcoords='offset points',
-                      color='#404040',
-                      fontsize=13,
-                      fontweight='bold',
-                      bbox=dict(
-                          boxstyle='round,pad=0.5',
-                          fc='white',
-                          ec='#404040',
-                          alpha=1,
-                          zorder=3
-                      ),
-                      ha='left',
-                      va='center',
-                      arrowprops=dict(
-                          arrowstyle='->',
-                          connectionstyle='arc3,rad=0',
+    # Encontrar el punto de Noviembre 2023 (cambio de fuente de datos)
+    nov_2023 = pd.to_datetime("2023-11-01")
+    nov_2023_idx = df_prof_hora[df_prof_hora["fecha"] == nov_2023].index
+    if len(nov_2023_idx) > 0:
+        nov_2023_idx = nov_2023_idx[0]
+        nov_2023_value = df_prof_hora.loc[nov_2023_idx, "salario_hora_ajustado"]
+    else:
+        # Si no encuentra exacto, buscar el más cercano
+        nov_2023_idx = (df_prof_hora["fecha"] - nov_2023).abs().argmin()
+        nov_2023_value = df_prof_hora.iloc[nov_2023_idx]["salario_hora_ajustado"]
+        nov_2023_date = df_prof_hora.iloc[nov_2023_idx]["fecha"]
+
+    # Línea horizontal punteada gris oscura desde nov-2023 hasta el final
+    last_date = df_prof_hora["fecha"].max()
+    ax_prof_hora.hlines(y=nov_2023_value, xmin=nov_2023, xmax=last_date,
+                        colors='#404040', linestyles='dotted', linewidth=2,
+                        label='Ley de Financiamiento Universitario', zorder=2.6)
+
+    # Texto sobre la línea punteada
+    ax_prof_hora.text(pd.to_datetime("2025-01-01"), nov_2023_value * 1.01,
+                      "Ley de Financiamiento Universitario",
+                      color='#404040', fontsize=13, fontweight='bold',
+                      ha='center', va='bottom', zorder=2.8)
+
+    # Etiqueta al final de la línea punteada (con borde gris oscuro, alineada a la derecha)
+    ax_prof_hora.annotate(f'${nov_2023_value:.0f}', 
+                          xy=(last_date, nov_2023_value),
+                          xytext=(5, 0),
+                          textcoords='offset points',
                           color='#404040',
-                          shrinkB=4,
-                          lw=2,
-                          zorder=2.5
-                      ),
-                      zorder=3)
-
-# Flecha vertical desde el último punto negro hasta la línea punteada (ROJA, más gruesa)
-last_value = df_prof_hora["salario_hora_ajustado"].iloc[-1]
-ax_prof_hora.annotate('', 
-                      xy=(last_date, nov_2023_value),
-                      xytext=(last_date, last_value),
-                      arrowprops=dict(
-                          arrowstyle='->',
-                          color='red',
-                          lw=3,
-                          zorder=2.8
-                      ))
-
-# Calcular porcentaje de aumento necesario
-pct_increase = ((nov_2023_value - last_value) / last_value) * 100
-
-# Texto del porcentaje a la derecha de la flecha (ROJO, font size grande, bold)
-mid_y = (last_value + nov_2023_value) / 2
-ax_prof_hora.text(last_date, mid_y, 
-                  f'+{pct_increase:.0f}%', 
-                  color='red', 
-                  fontsize=18, 
-                  fontweight='bold',
-                  ha='left', 
-                  va='center', 
-                  zorder=2.9)
-
-# Definir puntos para etiquetas (último, nov-2023) - removido el primero
-points_prof = [
-    (df_prof_hora["fecha"].iloc[-1], df_prof_hora["salario_hora_ajustado"].iloc[-1], 'black', 5, 15),   # Last (moved to right)
-    (df_prof_hora["fecha"].iloc[nov_2023_idx], df_prof_hora["salario_hora_ajustado"].iloc[nov_2023_idx], 'black', 5, -20),  # Nov 2023
-]
+                          fontsize=13,
+                          fontweight='bold',
+                          bbox=dict(
+                              boxstyle='round,pad=0.5',
+                              fc='white',
+                              ec='#404040',
+                              alpha=1,
+                              zorder=3
+                          ),
+                          ha='left',
+                          va='center',
+                          arrowprops=dict(
+                              arrowstyle='->',
+                              connectionstyle='arc3,rad=0',
+                              color='#404040',
+                              shrinkB=4,
+                              lw=2,
+                              zorder=2.5
+                          ),
+                          zorder=3)
+
+    # Flecha vertical desde el último punto negro hasta la línea punteada (ROJA, más gruesa)
+    last_value = df_prof_hora["salario_hora_ajustado"].iloc[-1]
+    ax_prof_hora.annotate('', 
+                          xy=(last_date, nov_2023_value),
+                          xytext=(last_date, last_value),
+                          arrowprops=dict(
+                              arrowstyle='->',
+                              color='red',
+                              lw=3,
+                              zorder=2.8
+                          ))
+
+    # Calcular porcentaje de aumento necesario
+    pct_increase = ((nov_2023_value - last_value) / last_value) * 100
+
+    # Texto del porcentaje a la derecha de la flecha (ROJO, font size grande, bold)
+    mid_y = (last_value + nov_2023_value) / 2
+    ax_prof_hora.text(last_date, mid_y, 
+                      f'+{pct_increase:.0f}%', 
+                      color='red', 
+                      fontsize=18, 
+                      fontweight='bold',
+                      ha='left', 
+                      va='center', 
+                      zorder=2.9)
 
-# Crear etiquetas de texto con cajas
-texts_prof = []
-for i, (date, value, color, dx, dy) in enumerate(points_prof):
-    bbox_props = dict(
-        boxstyle='round,pad=0.5',
-        fc='white',
-        ec=color,
-        alpha=1,
-        zorder=3
-    )
+    # Y axis setup
+    min_value_h = df_prof_hora["salario_hora_ajustado"].min()
+    max_value_h = df_prof_hora["salario_hora_ajustado"].max()
+    ylim_min_h = np.floor(0.9 * min_value_h / 1000) * 1000
+    ylim_max_h = 11500
 
-    # Etiqueta especial para Nov 2023 (indice 1)
-    if i == 1:
-        label_text = f'nov-2023\n${value:.0f}'
-    else:
-        label_text = f'${value:.0f}'
-
-    annotation = ax_prof_hora.annotate(
-        label_text,
-        xy=(date, value),
-        xycoords='data',
-        xytext=(dx, dy),
-        textcoords='offset points',
-        color=color,
-        fontsize=13,
-        fontweight='bold',
-        bbox=bbox_props,
-        horizontalalignment='right' if dx < 0 else 'left',
-        verticalalignment='bottom' if dy > 0 else 'top',
-        arrowprops=dict(
-            arrowstyle='->',
-            connectionstyle='arc3,rad=0',
-            color=color,
-            shrinkB=4,
-            lw=2,
-            zorder=2.5
-        ),
-        zorder=3
-    )
-    texts_prof.append(annotation)
-
-# Y axis setup
-min_value_h = df_prof_hora["salario_hora_ajustado"].min()
-max_value_h = df_prof_hora["salario_hora_ajustado"].max()
-ylim_min_h = np.floor(0.9 * min_value_h / 1000) * 1000
-ylim_max_h = 11500
-
-ax_prof_hora.set_ylim(ylim_min_h, ylim_max_h)
-yticks_h = np.arange(ylim_min_h + 1000, ylim_max_h + 1000, 1000)
-ax_prof_hora.set_yticks(yticks_h)
-
-# X-axis: 2020-2026
-ax_prof_hora.set_xlim(left=pd.to_datetime("2020-01-01"), right=pd.to_datetime("2026-11-01"))
-
-# Add horizontal grid lines
-for y in yticks_h:
-    ax_prof_hora.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
-
-# Custom formatter for y-axis labels (show values in thousands with dot as decimal separator, 0 decimals)
-def miles_formatter(x, p):
-    return f"{x/1000:.0f}".replace(",", ".")
-
-ax_prof_hora.yaxis.set_major_formatter(plt.FuncFormatter(miles_formatter))
-
-# X axis formatting
-ax_prof_hora.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-ticks_prof = [pd.to_datetime(f"{y}-01-01") for y in range(2020, 2027)]
-ax_prof_hora.set_xticks(ticks_prof)
-ax_prof_hora.tick_params(axis='x', rotation=45, labelsize=12)
-ax_prof_hora.tick_params(axis='y', labelsize=12)
-
-# Get last date for title
-last_date_prof = df_prof_hora["fecha"].max()
-last_date_str_prof = f"{MONTH_NAMES[last_date_prof.month]} de {last_date_prof.year}"
-
-# Labels and title
-ax_prof_hora.set_title(f"Salario por hora Profesor Universitario\nSalario real de bolsillo (en pesos de {last_date_str_prof})", fontsize=28)
-ax_prof_hora.set_xlabel("Fecha", fontsize=20)
-ax_prof_hora.set_ylabel("Salario por hora (miles de pesos)", fontsize=16)
-ax_prof_hora.legend(fontsize=20, loc='lower left')
-
-# Footnote
-footnote_prof = f"Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\nSerie salarial reconstruida en base a recibos de sueldo de UNC y simulador de ADIUC.\nCorresponde a un cargo de Profesor Asistente (JTP) con 10 años de antigüedad. Por Rodrigo Quiroga, ver github.com/rquiroga7/salarios_CONICET.\n Gráfico generado el {current_date}"
-plt.figtext(0.5, 0.01, footnote_prof, ha="center", fontsize=11, style='italic')
-
-# Save plot
-try:
-    plt.tight_layout(rect=[0, 0.08, 1, 1])
-    plt.savefig("plots/grafico_salario_por_hora_profasis.png")
-except Exception:
-    pass
-plt.close()
+    ax_prof_hora.set_ylim(ylim_min_h, ylim_max_h)
+    yticks_h = np.arange(ylim_min_h + 1000, ylim_max_h + 1000, 1000)
+    ax_prof_hora.set_yticks(yticks_h)
 
+    # X-axis: 2020-2026
+    ax_prof_hora.set_xlim(left=pd.to_datetime("2020-01-01"), right=pd.to_datetime("2026-11-01"))
 
+    # Add horizontal grid lines
+    for y in yticks_h:
+        ax_prof_hora.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
 
-# =====================
-# Gráficos: Proyección histórica Profasis a pesos actuales (y por hora)
-# =====================
+    # Custom formatter for y-axis labels (show values in thousands with dot as decimal separator, 0 decimals)
+    def miles_formatter(x, p):
+        return f"{x/1000:.0f}".replace(",", ".")
 
-# Leer datos nominales recientes
-df_prof_nominal = pd.read_csv("datos/crudo_profasis.csv", parse_dates=["fecha"]) 
-
-# Leer serie índice base 100 (ya ajustada por inflación)
-df_prof_index = pd.read_csv("datos/profasis_base100.csv", header=None,
-                            names=["fecha", "indice"], parse_dates=["fecha"],
-                            skipinitialspace=True)
-
-# Determinar fecha y salario nominal más reciente
-last_nominal_date = df_prof_nominal["fecha"].max()
-last_nominal_value = df_prof_nominal.loc[df_prof_nominal["fecha"] == last_nominal_date, "salario"].values
-if last_nominal_value.size == 0:
-    # fallback to last available nominal
-    last_nominal_value = df_prof_nominal["salario"].iloc[-1]
-else:
-    last_nominal_value = last_nominal_value[0]
-
-# Obtener el último índice disponible y asegurar que el salario nominal usado
-# corresponde a la misma fecha del índice (si el índice no llega hasta el
-# último nominal, elegir el nominal más cercano al último índice disponible).
-last_index_date = df_prof_index["fecha"].max()
-last_index_value = df_prof_index.loc[df_prof_index["fecha"] == last_index_date, "indice"].values[0]
-if last_nominal_date != last_index_date:
-    # intentar usar el salario nominal en la fecha del último índice
-    nominal_on_index = df_prof_nominal.loc[df_prof_nominal["fecha"] == last_index_date, "salario"]
-    if nominal_on_index.size > 0:
-        last_nominal_value = nominal_on_index.values[0]
-        last_nominal_date = last_index_date
-    else:
-        # usar el nominal más cercano en el tiempo al último índice
-        idx_near = (df_prof_nominal["fecha"] - last_index_date).abs().argmin()
-        last_nominal_value = df_prof_nominal.iloc[idx_near]["salario"]
-        last_nominal_date = df_prof_nominal.iloc[idx_near]["fecha"]
-
-# Calcular proyección de la serie histórica en pesos de la última fecha
-# Paso 1: ajustar crudo_profasis por IPC para obtener salarios "reales" (pesos de la última fecha IPC)
-df_ipc = pd.read_csv("datos/ipc_nuevo.csv", parse_dates=["fecha"])
-
-# Extender IPC si falta algún mes (como hace actualiza_datos_IPC.py)
-last_nominal_date_ext = df_prof_nominal['fecha'].max()
-while df_ipc["fecha"].max() < last_nominal_date_ext:
-    next_date = df_ipc["fecha"].max() + pd.DateOffset(months=1)
-    projected = df_ipc["indice"].iloc[-1] * (df_ipc["indice"].iloc[-1] / df_ipc["indice"].iloc[-2])
-    df_ipc = pd.concat([df_ipc, pd.DataFrame({"fecha": [next_date], "indice": [projected]})], ignore_index=True)
-
-ultimo_indice_ipc = df_ipc["indice"].iloc[-1]
-
-# Fusionar IPC con crudo nominal
-df_prof_nominal = df_prof_nominal.merge(df_ipc, on='fecha', how='left')
-df_prof_nominal['salario_real_ipc'] = df_prof_nominal['salario'] * (ultimo_indice_ipc / df_prof_nominal['indice'])
-
-# Paso 2: extendemos la serie base100 hasta el último mes nominal disponible
-last_nominal_date = df_prof_nominal['fecha'].max()
-nominal_last_value = df_prof_nominal.loc[df_prof_nominal['fecha'] == last_nominal_date, 'salario'].values[0]
-
-# referencia: valor base100 en su última fecha
-base_last_date = df_prof_index['fecha'].max()
-base_last_value = df_prof_index.loc[df_prof_index['fecha'] == base_last_date, 'indice'].values[0]
-
-# referencia para escala temporal: usar salario real de referencia en 2026-01-01 (o nearest)
-ref_date = pd.to_datetime('2026-01-01')
-if ref_date not in df_prof_nominal['fecha'].values:
-    # choose nearest previous
-    ref_date = df_prof_nominal.loc[df_prof_nominal['fecha'] <= ref_date, 'fecha'].max()
-ref_real = df_prof_nominal.loc[df_prof_nominal['fecha'] == ref_date, 'salario_real_ipc'].values[0]
-
-# crear rango mensual desde primer mes del base100 hasta último nominal
-full_dates = pd.date_range(start=df_prof_index['fecha'].min(), end=last_nominal_date, freq='MS')
-df_index_full = pd.DataFrame({'fecha': full_dates})
-
-# incorporar índice original donde exista
-df_index_full = df_index_full.merge(df_prof_index, on='fecha', how='left')
-
-# incorporar salario_real_ipc por fecha si existe (no traer la columna nominal 'salario')
-df_index_full = df_index_full.merge(df_prof_nominal[['fecha','salario_real_ipc']], on='fecha', how='left')
-
-# Calcular indice_ext: para fechas posteriores al último base100, usar
-# indice_ext[month] = salario_real_ipc[month] / ref_real * base_last_value
-idx_ext = []
-for _, row in df_index_full.iterrows():
-    d = row['fecha']
-    if pd.notna(row.get('indice')):
-        idx_ext.append(row['indice'])
-    else:
-        if pd.notna(row.get('salario_real_ipc')):
-            val = row['salario_real_ipc'] / ref_real * base_last_value
-            idx_ext.append(val)
-        else:
-            idx_ext.append(np.nan)
-
-df_index_full['indice_ext'] = idx_ext
-df_index_full['indice_ext'] = df_index_full['indice_ext'].ffill()
-
-# Paso 3: escalar indice_ext para que su valor en last_nominal_date corresponda
-# al último salario nominal disponible
-if last_nominal_date in df_index_full['fecha'].values:
-    idx_at_last = df_index_full.loc[df_index_full['fecha'] == last_nominal_date, 'indice_ext'].values[0]
-else:
-    idx_at_last = df_index_full['indice_ext'].iloc[-1]
-
-df_index_full['salario_pesos_actuales'] = df_index_full['indice_ext'] / idx_at_last * nominal_last_value
-
-# Guardar CSV de depuración con sólo las columnas solicitadas
-df_index_full[['fecha','indice','indice_ext','salario_real_ipc','salario_pesos_actuales']].to_csv('plots/profasis_plotted_series.csv', index=False)
-
-# preparar df_prof_index para graficar (usar fecha y salario_pesos_actuales como serie)
-df_prof_index = df_index_full[['fecha','salario_pesos_actuales','salario_real_ipc']].copy()
-
-# --- Plot: Profasis proyectado en pesos actuales ---
-fig_p, ax_p = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
-
-# Fondos presidenciales
-for nombre, inicio, fin, color in periodos:
-    ax_p.axvspan(pd.to_datetime(inicio), pd.to_datetime(fin), color=color, label=nombre)
-
-ax_p.plot(df_prof_index["fecha"], df_prof_index["salario_pesos_actuales"], color="black", linewidth=3,
-          marker='o', markersize=3, label="Salario real de bolsillo")
-
-# Eje Y dinámico
-min_v = df_prof_index["salario_pesos_actuales"].min()
-max_v = df_prof_index["salario_pesos_actuales"].max()
-ylim_min = np.floor(0.95 * min_v / 100000) * 100000
-ylim_max = np.ceil(1.05 * max_v / 100000) * 100000
-ax_p.set_ylim(ylim_min, ylim_max)
-yticks_p = np.arange(ylim_min, ylim_max + 100000, 100000)
-ax_p.set_yticks(yticks_p)
-ax_p.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
-for y in yticks_p:
-    ax_p.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
-
-# Eje X
-ax_p.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-# Use MonthLocator at January so year labels align with January data points
-ax_p.xaxis.set_major_locator(mdates.MonthLocator(bymonth=1))
-# Ensure xtick labels rotate and right-align
-plt.sca(ax_p)
-ax_p.tick_params(axis='x', rotation=45)
-for lbl in ax_p.get_xticklabels():
-    lbl.set_ha('right')
-# Force x-axis start at January 1999 and limit to July 2026
-ax_p.set_xlim(left=pd.to_datetime("1999-01-01"), right=pd.to_datetime("2026-07-01"))
-
-last_date_p = df_prof_index["fecha"].max()
-last_date_str_p = f"{MONTH_NAMES[last_date_p.month]} de {last_date_p.year}"
-
-ax_p.set_title(f"Salario docente universitario de bolsillo ajustado por IPC\nProfesor Asistente (JTP) dedicación exclusiva ( en pesos de {last_date_str_p})", fontsize=24)
-ax_p.set_xlabel("Fecha", fontsize=18)
-ax_p.set_ylabel("Salario real (millones)", fontsize=18)
-ax_p.legend(loc='upper left', fontsize=14)
-
-plt.figtext(0.98, 0.01, f"Salario de un profesor asistente (JTP) con 10 años de antigüedad. Salario nominal de {last_nominal_date.strftime('%Y-%m-%d')} = ${int(nominal_last_value):,}.\nGráfico generado el {current_date}. Por Rodrigo Quiroga. Ver github.com/rquiroga7/salarios_CONICET.\nDatos históricos (pre-2020) cortesía de Matías Sanchez, AGD-UBA.",
-            ha="right", fontsize=12, style='italic')
-
-plt.tight_layout(rect=[0, 0.06, 1, 1])
-plt.savefig("plots/grafico_salarios_profasis.png")
-plt.close()
-
-
-# --- Plot: Profasis proyectado por hora (dividir por 176) ---
-HORAS_MENSUALES = 176
-df_prof_index["salario_por_hora_actual"] = df_prof_index["salario_real_ipc"].fillna(df_prof_index["salario_pesos_actuales"]) / HORAS_MENSUALES
+    ax_prof_hora.yaxis.set_major_formatter(plt.FuncFormatter(miles_formatter))
 
-fig_h, ax_h = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
-for nombre, inicio, fin, color in periodos:
-    ax_h.axvspan(pd.to_datetime(inicio), pd.to_datetime(fin), color=color, label=nombre)
+    # X axis formatting
+    ax_prof_hora.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    ticks_prof = [pd.to_datetime(f"{y}-01-01") for y in range(2020, 2027)]
+    ax_prof_hora.set_xticks(ticks_prof)
+    ax_prof_hora.tick_params(axis='x', rotation=45, labelsize=12)
+    ax_prof_hora.tick_params(axis='y', labelsize=12)
 
-ax_h.plot(df_prof_index["fecha"], df_prof_index["salario_por_hora_actual"], color="black", linewidth=3,
-          marker='o', markersize=3, label="Salario por hora")
+    # Get last date for title
+    last_date_prof = df_prof_hora["fecha"].max()
+    last_date_str_prof = f"{MONTH_NAMES[last_date_prof.month]} de {last_date_prof.year}"
 
-# Y axis for per-hour: fixed range 6000-15000 with breaks every 1000
-yticks_h2 = np.arange(6000, 16000, 1000)
-ax_h.set_yticks(yticks_h2)
+    # Labels and title
+    ax_prof_hora.set_title(f"Salario por hora Profesor Universitario\nSalario real de bolsillo (en pesos de {last_date_str_prof})", fontsize=28)
+    ax_prof_hora.set_xlabel("Fecha", fontsize=20)
+    ax_prof_hora.set_ylabel("Salario por hora (miles de pesos)", fontsize=16)
+    ax_prof_hora.legend(fontsize=20, loc='lower left')
 
-def formatter_horas(x, pos):
-    return f"{int(x)}"
+    # Footnote
+    footnote_prof = f"Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\nSerie salarial reconstruida en base a recibos de sueldo de UNC y simulador de ADIUC.\nCorresponde a un cargo de Profesor Asistente (JTP) con 10 años de antigüedad. Por Rodrigo Quiroga, ver github.com/rquiroga7/salarios_CONICET.\n Gráfico generado el {current_date}"
+    plt.figtext(0.5, 0.01, footnote_prof, ha="center", fontsize=11, style='italic')
 
-ax_h.yaxis.set_major_formatter(plt.FuncFormatter(formatter_horas))
-for y in yticks_h2:
-    ax_h.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
+    # Save plot
+    try:
+        plt.tight_layout(rect=[0, 0.08, 1, 1])
+    except Exception:
+        pass
+    # Etiquetas del último valor y de nov-2023
+    ultimo = df_prof_hora["salario_hora_ajustado"].iloc[-1]
+    valor_nov = df_prof_hora["salario_hora_ajustado"].iloc[nov_2023_idx]
+    colocar_etiquetas(ax_prof_hora, [
+        (df_prof_hora["fecha"].iloc[-1], ultimo, f'${ultimo:.0f}', 'black'),
+        (df_prof_hora["fecha"].iloc[nov_2023_idx], valor_nov, f'nov-2023\n${valor_nov:.0f}', 'black'),
+    ])
+    exportacion.guardar("plots/grafico_salario_por_hora_profasis.png")
+    plt.close()
 
-ax_h.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-# Use MonthLocator at January so year labels align with January data points
-ax_h.xaxis.set_major_locator(mdates.MonthLocator(bymonth=1))
-# Ensure xtick labels rotate and right-align
-plt.sca(ax_h)
-ax_h.tick_params(axis='x', rotation=45)
-for lbl in ax_h.get_xticklabels():
-    lbl.set_ha('right')
-# Force x-axis start at January 1999 and limit to July 2026
-ax_h.set_xlim(left=pd.to_datetime("1999-01-01"), right=pd.to_datetime("2026-07-01"))
 
-ax_h.set_title(f"Salario de bolsillo ajustado por IPC\nProfesor Asistente (JTP) — por hora (pesos de {last_date_str_p})", fontsize=26)
-ax_h.set_xlabel("Fecha", fontsize=18)
-ax_h.set_ylabel("Pesos por hora", fontsize=18)
-ax_h.legend(loc='upper left', fontsize=14)
+def grafico_salarios_profasis():
+    """Profasis proyectado en pesos actuales"""
+    df_prof_index, last_nominal_date, nominal_last_value = serie_profasis_historica()
+    periodos = periodos_presidenciales()
+
+    # Guardar CSV de depuración con sólo las columnas solicitadas (sólo este gráfico
+    # lo declara como salida: los demás gráficos de profasis pueden correr a la vez)
+    guardar_tabla(empalme_profasis_historico()[0], borrador.salida('plots/profasis_plotted_series.csv'),
+                  'profasis_plotted_series')
+
+    fig_p, ax_p = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
+
+    # Fondos presidenciales
+    for nombre, inicio, fin, color in periodos:
+        ax_p.axvspan(pd.to_datetime(inicio), pd.to_datetime(fin), color=color, label=nombre)
+
+    ax_p.plot(df_prof_index["fecha"], df_prof_index["salario_pesos_actuales"], color="black", linewidth=3,
+              marker='o', markersize=3, label="Salario real de bolsillo")
+
+    # Eje Y dinámico
+    min_v = df_prof_index["salario_pesos_actuales"].min()
+    max_v = df_prof_index["salario_pesos_actuales"].max()
+    ylim_min = np.floor(0.95 * min_v / 100000) * 100000
+    ylim_max = np.ceil(1.05 * max_v / 100000) * 100000
+    ax_p.set_ylim(ylim_min, ylim_max)
+    yticks_p = np.arange(ylim_min, ylim_max + 100000, 100000)
+    ax_p.set_yticks(yticks_p)
+    ax_p.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
+    for y in yticks_p:
+        ax_p.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
+
+    # Eje X
+    ax_p.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    # Use MonthLocator at January so year labels align with January data points
+    ax_p.xaxis.set_major_locator(mdates.MonthLocator(bymonth=1))
+    # Ensure xtick labels rotate and right-align
+    plt.sca(ax_p)
+    ax_p.tick_params(axis='x', rotation=45)
+    for lbl in ax_p.get_xticklabels():
+        lbl.set_ha('right')
+    # Force x-axis start at January 1999 and limit to July 2026
+    ax_p.set_xlim(left=pd.to_datetime("1999-01-01"), right=pd.to_datetime("2026-07-01"))
+
+    last_date_p = df_prof_index["fecha"].max()
+    last_date_str_p = f"{MONTH_NAMES[last_date_p.month]} de {last_date_p.year}"
+
+    ax_p.set_title(f"Salario docente universitario de bolsillo ajustado por IPC\nProfesor Asistente (JTP) dedicación exclusiva ( en pesos de {last_date_str_p})", fontsize=24)
+    ax_p.set_xlabel("Fecha", fontsize=18)
+    ax_p.set_ylabel("Salario real (millones)", fontsize=18)
+    ax_p.legend(loc='upper left', fontsize=14)
+
+    plt.figtext(0.98, 0.01, f"Salario de un profesor asistente (JTP) con 10 años de antigüedad. Salario nominal de {last_nominal_date.strftime('%Y-%m-%d')} = ${int(nominal_last_value):,}.\nGráfico generado el {current_date}. Por Rodrigo Quiroga. Ver github.com/rquiroga7/salarios_CONICET.\nDatos históricos (pre-2020) cortesía de Matías Sanchez, AGD-UBA.",
+                ha="right", fontsize=12, style='italic')
+
+    plt.tight_layout(rect=[0, 0.06, 1, 1])
+    exportacion.guardar("plots/grafico_salarios_profasis.png")
+    plt.close()
 
-plt.figtext(0.98, 0.01, f"Salario de un profesor asistente (JTP) con 10 años de antigüedad. Salario nominal de {last_nominal_date.strftime('%Y-%m-%d')} = ${int(nominal_last_value):,} y dividiendo por {HORAS_MENSUALES} horas/mes.\nGráfico generado el {current_date}. Por Rodrigo Quiroga. Ver github.com/rquiroga7/salarios_CONICET.\nDatos históricos (pre-2020) cortesía de Matías Sanchez, AGD-UBA.",
-            ha="right", fontsize=12, style='italic')
 
-plt.tight_layout(rect=[0, 0.06, 1, 1])
-plt.savefig("plots/grafico_salarios_profasis_porhora.png")
-plt.close()
+def grafico_salarios_profasis_porhora():
+    """Profasis proyectado por hora (dividir por 176)"""
+    df_prof_index, last_nominal_date, nominal_last_value = serie_profasis_historica()
+    periodos = periodos_presidenciales()
 
+    last_date_p = df_prof_index["fecha"].max()
+    last_date_str_p = f"{MONTH_NAMES[last_date_p.month]} de {last_date_p.year}"
 
-# =====================
-# Gráfico alternativo: proyección por hora con aumentos discretos
-# Misma pendiente descendente (sep-2024 a mar-2026) + 21% en jun-26 y 3% en oct-26
-# =====================
+    fig_h, ax_h = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
+    for nombre, inicio, fin, color in periodos:
+        ax_h.axvspan(pd.to_datetime(inicio), pd.to_datetime(fin), color=color, label=nombre)
 
-# Fit linear trend on Sep-2024 to Mar-2026
-trend_start = pd.to_datetime("2024-09-01")
-trend_end = pd.to_datetime("2026-03-01")
-mask_trend = (df_prof_index["fecha"] >= trend_start) & (df_prof_index["fecha"] <= trend_end)
-recent_trend = df_prof_index.loc[mask_trend].copy()
-x_trend = mdates.date2num(recent_trend["fecha"]).astype(float)
-y_trend = recent_trend["salario_por_hora_actual"].values.astype(float)
-coeff_trend = np.polyfit(x_trend, y_trend, 1)
-trend_fn = np.poly1d(coeff_trend)
-
-# Projection range: from last observed date to Nov 2027
-last_date_trend = df_prof_index["fecha"].max()
-proj_end_trend = pd.to_datetime("2027-11-01")
-months_after_trend = pd.date_range(
-    start=(last_date_trend + pd.offsets.MonthBegin(1)).normalize(),
-    end=proj_end_trend, freq='MS'
-)
-proj_dates_trend = pd.DatetimeIndex([last_date_trend]).append(months_after_trend)
-
-# Compute trend values offset so trend starts at last actual value
-trend_vals_trend = trend_fn(mdates.date2num(proj_dates_trend))
-delta_trend = df_prof_index["salario_por_hora_actual"].iloc[-1] - trend_vals_trend[0]
-proj_y_trend = trend_vals_trend + delta_trend
-
-# Apply discrete bumps (additive to preserve slope): +21% in Jun-2026, +3% in Oct-2026
-proj_y_bumped = proj_y_trend.copy()
-jun_2026 = pd.to_datetime("2026-06-01")
-oct_2026 = pd.to_datetime("2026-10-01")
-jun_idx = (proj_dates_trend == jun_2026).nonzero()[0][0]
-oct_idx = (proj_dates_trend == oct_2026).nonzero()[0][0]
-bump_jun = proj_y_trend[jun_idx] * 0.21
-bump_oct = proj_y_trend[oct_idx] * 0.03
-proj_y_bumped[jun_idx:] += bump_jun
-proj_y_bumped[oct_idx:] += bump_oct
-
-# Third projection: Ley de Financiamiento Universitario
-# June 2026 value = Nov 2023 real salary, same downward slope, only from Jun-2026 onward
-nov_2023_val = df_prof_hora.loc[df_prof_hora["fecha"] == pd.to_datetime("2023-11-01"),
-                                 "salario_hora_ajustado"].values[0]
-slope = coeff_trend[0]  # daily slope from polyfit
-jun_2026_num = mdates.date2num(jun_2026)
-# LFY only from June 2026 onward
-mask_lfy = proj_dates_trend >= jun_2026
-proj_dates_lfy = proj_dates_trend[mask_lfy]
-proj_y_lfy = np.array([
-    nov_2023_val + slope * (mdates.date2num(d) - jun_2026_num)
-    for d in proj_dates_lfy
-])
-
-# Create the alternative projection plot
-fig_alt, ax_alt = plt.subplots(figsize=(3840/300, 2400/300), dpi=300)
-
-# Extend Milei background to 2027-12
-periodos_proy = [
-    p if p[0] != "Milei" else ("Milei", "2023-12-01", "2027-12-01", "#e6ccff")
-    for p in periodos
-]
-for nombre, inicio, fin, color in periodos_proy:
-    ax_alt.axvspan(pd.to_datetime(inicio), pd.to_datetime(fin), color=color, alpha=0.6, zorder=0, label=nombre)
-
-# Observed series
-ax_alt.plot(df_prof_index["fecha"], df_prof_index["salario_por_hora_actual"], color="black", linewidth=3,
-            marker='o', markersize=3, label="Salario por hora", zorder=3)
-
-# Raw trend (no bumps) in gray dotted
-ax_alt.plot(proj_dates_trend, proj_y_trend, color='gray', linestyle=':', linewidth=2,
-            label='Tendencia lineal sin aumentos', zorder=2.5)
-
-# Bumped projection (+21% jun, +3% oct) in solid gray
-ax_alt.plot(proj_dates_trend, proj_y_bumped, color='green', linestyle='-', linewidth=2,
-            label='Aumento ofrecido (+21% jun, +3% oct)', zorder=2.7)
-
-# Ley de Financiamiento Universitario in blue solid (from Jun-2026 onward)
-ax_alt.plot(proj_dates_lfy, proj_y_lfy, color='blue', linestyle='-', linewidth=2,
-            label='Ley de Financiamiento Universitario', zorder=2.6)
-# Connect last observed dot to first LFY dot (Jun-2026)
-last_obs_y = df_prof_index["salario_por_hora_actual"].iloc[-1]
-ax_alt.plot([proj_dates_trend[0], proj_dates_lfy[0]],
-            [last_obs_y, proj_y_lfy[0]], color='blue', linestyle='-', linewidth=2, zorder=2.6)
-
-# Y axis
-all_vals_alt = np.concatenate([df_prof_index["salario_por_hora_actual"].values, proj_y_bumped, proj_y_lfy])
-ymin_alt = np.nanmin(all_vals_alt)
-ymax_alt = np.nanmax(all_vals_alt)
-ylim_min_alt = 0
-ylim_max_alt = np.ceil(1.05 * ymax_alt / 1000) * 1000
-if ylim_max_alt <= 0:
-    ylim_max_alt = 1000
-ax_alt.set_ylim(ylim_min_alt, ylim_max_alt)
-yticks_alt = np.arange(ylim_min_alt, ylim_max_alt + 1, 1000)
-ax_alt.set_yticks(yticks_alt)
-ax_alt.yaxis.set_major_formatter(plt.FuncFormatter(miles_formatter_dot))
-for y in yticks_alt:
-    ax_alt.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
-
-# Mirror y-axis right
-ax_alt_right = ax_alt.twinx()
-ax_alt_right.set_ylim(ylim_min_alt, ylim_max_alt)
-ax_alt_right.set_yticks(yticks_alt)
-ax_alt_right.yaxis.set_major_formatter(plt.FuncFormatter(miles_formatter_dot))
-ax_alt_right.tick_params(axis='y', labelsize=10)
-
-# X axis
-ax_alt.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-ax_alt.xaxis.set_major_locator(mdates.MonthLocator(bymonth=1))
-plt.sca(ax_alt)
-ax_alt.tick_params(axis='x', rotation=45)
-for lbl in ax_alt.get_xticklabels():
-    lbl.set_ha('right')
-ax_alt.set_xlim(left=pd.to_datetime("1999-01-01"), right=pd.to_datetime("2028-01-01") + pd.offsets.MonthEnd(0))
-
-ax_alt.set_title(f"Salario por hora — Proyección de escenarios\nProfesor Asistente (JTP) (pesos de {last_date_str_p})", fontsize=20)
-ax_alt.set_xlabel("Fecha", fontsize=14)
-ax_alt.set_ylabel("Pesos por hora", fontsize=14)
-ax_alt.legend(loc='lower left', fontsize=10)
-
-plt.figtext(0.98, 0.01, f"Salario de un profesor asistente (JTP) con 10 años de antigüedad. Salario nominal de {last_nominal_date.strftime('%Y-%m-%d')} = ${int(nominal_last_value):,} y dividiendo por {HORAS_MENSUALES} horas/mes.\nSe realizan tres proyecciones, lineal sin aumentos (punteada), aumentos ofrecidos (en verde, +21% jun y +3% oct), Ley de Financiamiento Universitario (azul).\nGráfico generado el {current_date}. Por Rodrigo Quiroga. Ver github.com/rquiroga7/salarios_CONICET.",
-            ha="right", fontsize=11, style='italic')
-
-plt.tight_layout(rect=[0, 0.09, 1, 1])
-plt.savefig("plots/proy2.png")
-plt.close()
-
-print("Saved: plots/proy2.png")
-
-# --- proy3: same as proy2 but x-axis restricted to 2015-01 to 2027-12 ---
-fig_alt3, ax_alt3 = plt.subplots(figsize=(3840/300, 2880/300), dpi=300)
-
-# Only show Macri, Fernández, Milei in legend for proy3
-legend_proy3 = {"Macri", "Cristina Fernández", "Fernández", "Milei"}
-for nombre, inicio, fin, color in periodos_proy:
-    lbl = nombre if nombre in legend_proy3 else '_nolegend_'
-    ax_alt3.axvspan(pd.to_datetime(inicio), pd.to_datetime(fin), color=color, alpha=0.6, zorder=0, label=lbl)
-
-ax_alt3.plot(df_prof_index["fecha"], df_prof_index["salario_por_hora_actual"], color="black", linewidth=3,
-             marker='o', markersize=3, label="Salario por hora", zorder=3)
-
-ax_alt3.plot(proj_dates_trend, proj_y_trend, color='gray', linestyle=':', linewidth=2,
-             label='Tendencia lineal sin aumentos', zorder=2.5)
-
-ax_alt3.plot(proj_dates_trend, proj_y_bumped, color='green', linestyle='-', linewidth=2,
-             label='Aumento ofrecido (+21% jun, +3% oct)', zorder=2.7)
-
-ax_alt3.plot(proj_dates_lfy, proj_y_lfy, color='blue', linestyle='-', linewidth=2,
-             label='Ley de Financiamiento Universitario', zorder=2.6)
-# Connect last observed dot to first LFY dot (Jun-2026)
-ax_alt3.plot([proj_dates_trend[0], proj_dates_lfy[0]],
-             [last_obs_y, proj_y_lfy[0]], color='blue', linestyle='-', linewidth=2, zorder=2.6)
-
-# Green "+21%" label at Jun-2026 bump
-green_y_bump = proj_y_bumped[jun_idx]
-green_label_date = jun_2026 + pd.DateOffset(months=7)
-ax_alt3.annotate('+21%', xy=(green_label_date, green_y_bump - 250),
-                 xytext=(0, 15), textcoords='offset points',
-                 color='green', fontsize=16, fontweight='bold',
-                 ha='center', va='bottom',
-                 bbox=dict(boxstyle='round,pad=0.3', fc='white', ec='green', alpha=0.9, zorder=3),
-                 zorder=3)
+    ax_h.plot(df_prof_index["fecha"], df_prof_index["salario_por_hora_actual"], color="black", linewidth=3,
+              marker='o', markersize=3, label="Salario por hora")
 
-# Blue label: % increase needed from current salary to reach nov-2023 value
-pct_needed = ((nov_2023_val - last_obs_y) / last_obs_y) * 100
-ax_alt3.text(jun_2026, nov_2023_val + 550, f'+{pct_needed:.0f}%',
-             color='blue', fontsize=16, fontweight='bold',
-             ha='center', va='top',
-             bbox=dict(boxstyle='round,pad=0.3', fc='white', ec='blue', alpha=0.9, zorder=3),
-             zorder=3)
-
-ax_alt3.set_ylim(4000, 15000)
-yticks_alt3 = np.arange(4000, 16000, 1000)
-ax_alt3.set_yticks(yticks_alt3)
-ax_alt3.yaxis.set_major_formatter(plt.FuncFormatter(miles_formatter_dot))
-ax_alt3.tick_params(axis='y', labelsize=14)
-for y in yticks_alt3:
-    ax_alt3.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
-
-ax_alt3_right = ax_alt3.twinx()
-ax_alt3_right.set_ylim(4000, 15000)
-ax_alt3_right.set_yticks(yticks_alt3)
-ax_alt3_right.yaxis.set_major_formatter(plt.FuncFormatter(miles_formatter_dot))
-ax_alt3_right.tick_params(axis='y', labelsize=14)
-
-ax_alt3.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-ax_alt3.xaxis.set_major_locator(mdates.MonthLocator(bymonth=1))
-plt.sca(ax_alt3)
-ax_alt3.tick_params(axis='x', rotation=45, labelsize=14)
-for lbl in ax_alt3.get_xticklabels():
-    lbl.set_ha('right')
-ax_alt3.set_xlim(left=pd.to_datetime("2015-01-01"), right=pd.to_datetime("2027-12-01") + pd.offsets.MonthEnd(0))
-
-ax_alt3.set_title(f"Salario por hora — Proyección de escenarios\nProfesor Asistente (JTP) (pesos de {last_date_str_p})", fontsize=26)
-ax_alt3.set_xlabel("Fecha", fontsize=18)
-ax_alt3.set_ylabel("Pesos por hora", fontsize=18)
-ax_alt3.legend(loc='lower left', fontsize=14)
-
-plt.figtext(0.98, 0.01, f"Salario de un profesor asistente (JTP) con 10 años de antigüedad. Salario nominal de {last_nominal_date.strftime('%Y-%m-%d')} = ${int(nominal_last_value):,} y dividiendo por {HORAS_MENSUALES} horas/mes.\nSe realizan tres proyecciones, lineal sin aumentos (punteada), aumentos ofrecidos (en verde, +21% jun y +3% oct), Ley de Financiamiento Universitario (azul).\nGráfico generado el {current_date}. Por Rodrigo Quiroga. Ver github.com/rquiroga7/salarios_CONICET.",
-            ha="right", fontsize=11, style='italic')
-
-plt.tight_layout(rect=[0, 0.09, 1, 1])
-plt.savefig("plots/proy3.png")
-plt.close()
-
-print("Saved: plots/proy3.png")
+    # Y axis for per-hour: fixed range 6000-15000 with breaks every 1000
+    yticks_h2 = np.arange(6000, 16000, 1000)
+    ax_h.set_yticks(yticks_h2)
 
+    def formatter_horas(x, pos):
+        return f"{int(x)}"
 
-# =====================
-# Gráfico CIC: Estilo similar a grafico_salario_por_hora_profasis
-# Salario de bolsillo ajustado por IPC — Investigador asistente CONICET
-# =====================
+    ax_h.yaxis.set_major_formatter(plt.FuncFormatter(formatter_horas))
+    for y in yticks_h2:
+        ax_h.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
+
+    ax_h.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    # Use MonthLocator at January so year labels align with January data points
+    ax_h.xaxis.set_major_locator(mdates.MonthLocator(bymonth=1))
+    # Ensure xtick labels rotate and right-align
+    plt.sca(ax_h)
+    ax_h.tick_params(axis='x', rotation=45)
+    for lbl in ax_h.get_xticklabels():
+        lbl.set_ha('right')
+    # Force x-axis start at January 1999 and limit to July 2026
+    ax_h.set_xlim(left=pd.to_datetime("1999-01-01"), right=pd.to_datetime("2026-07-01"))
+
+    ax_h.set_title(f"Salario de bolsillo ajustado por IPC\nProfesor Asistente (JTP) — por hora (pesos de {last_date_str_p})", fontsize=26)
+    ax_h.set_xlabel("Fecha", fontsize=18)
+    ax_h.set_ylabel("Pesos por hora", fontsize=18)
+    ax_h.legend(loc='upper left', fontsize=14)
+
+    plt.figtext(0.98, 0.01, f"Salario de un profesor asistente (JTP) con 10 años de antigüedad. Salario nominal de {last_nominal_date.strftime('%Y-%m-%d')} = ${int(nominal_last_value):,} y dividiendo por {HORAS_MENSUALES} horas/mes.\nGráfico generado el {current_date}. Por Rodrigo Quiroga. Ver github.com/rquiroga7/salarios_CONICET.\nDatos históricos (pre-2020) cortesía de Matías Sanchez, AGD-UBA.",
+                ha="right", fontsize=12, style='italic')
+
+    plt.tight_layout(rect=[0, 0.06, 1, 1])
+    exportacion.guardar("plots/grafico_salarios_profasis_porhora.png")
+    plt.close()
+
+
+def grafico_proy2():
+    """Proyección por hora con aumentos discretos (+21% jun-26 y +3% oct-26)"""
+    df_prof_index, last_nominal_date, nominal_last_value = serie_profasis_historica()
+    periodos = periodos_presidenciales()
+
+    last_date_p = df_prof_index["fecha"].max()
+    last_date_str_p = f"{MONTH_NAMES[last_date_p.month]} de {last_date_p.year}"
+
+    (proj_dates_trend, proj_y_trend, proj_y_bumped, proj_dates_lfy, proj_y_lfy,
+     jun_idx, jun_2026, nov_2023_val, last_obs_y) = proyecciones_por_hora()
+
+    # Create the alternative projection plot
+    fig_alt, ax_alt = plt.subplots(figsize=(3840/300, 2400/300), dpi=300)
+
+    # Extend Milei background to 2027-12
+    periodos_proy = [
+        p if p[0] != "Milei" else ("Milei", "2023-12-01", "2027-12-01", "#e6ccff")
+        for p in periodos
+    ]
+    for nombre, inicio, fin, color in periodos_proy:
+        ax_alt.axvspan(pd.to_datetime(inicio), pd.to_datetime(fin), color=color, alpha=0.6, zorder=0, label=nombre)
+
+    # Observed series
+    ax_alt.plot(df_prof_index["fecha"], df_prof_index["salario_por_hora_actual"], color="black", linewidth=3,
+                marker='o', markersize=3, label="Salario por hora", zorder=3)
+
+    # Raw trend (no bumps) in gray dotted
+    ax_alt.plot(proj_dates_trend, proj_y_trend, color='gray', linestyle=':', linewidth=2,
+                label='Tendencia lineal sin aumentos', zorder=2.5)
+
+    # Bumped projection (+21% jun, +3% oct) in solid gray
+    ax_alt.plot(proj_dates_trend, proj_y_bumped, color='green', linestyle='-', linewidth=2,
+                label='Aumento ofrecido (+21% jun, +3% oct)', zorder=2.7)
+
+    # Ley de Financiamiento Universitario in blue solid (from Jun-2026 onward)
+    ax_alt.plot(proj_dates_lfy, proj_y_lfy, color='blue', linestyle='-', linewidth=2,
+                label='Ley de Financiamiento Universitario', zorder=2.6)
+    # Connect last observed dot to first LFY dot (Jun-2026)
+    ax_alt.plot([proj_dates_trend[0], proj_dates_lfy[0]],
+                [last_obs_y, proj_y_lfy[0]], color='blue', linestyle='-', linewidth=2, zorder=2.6)
+
+    # Y axis
+    all_vals_alt = np.concatenate([df_prof_index["salario_por_hora_actual"].values, proj_y_bumped, proj_y_lfy])
+    ymin_alt = np.nanmin(all_vals_alt)
+    ymax_alt = np.nanmax(all_vals_alt)
+    ylim_min_alt = 0
+    ylim_max_alt = np.ceil(1.05 * ymax_alt / 1000) * 1000
+    if ylim_max_alt <= 0:
+        ylim_max_alt = 1000
+    ax_alt.set_ylim(ylim_min_alt, ylim_max_alt)
+    yticks_alt = np.arange(ylim_min_alt, ylim_max_alt + 1, 1000)
+    ax_alt.set_yticks(yticks_alt)
+    ax_alt.yaxis.set_major_formatter(plt.FuncFormatter(miles_formatter_dot))
+    for y in yticks_alt:
+        ax_alt.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
+
+    # Mirror y-axis right
+    if not borrador.activo:
+        ax_alt_right = ax_alt.twinx()
+        ax_alt_right.set_ylim(ylim_min_alt, ylim_max_alt)
+        ax_alt_right.set_yticks(yticks_alt)
+        ax_alt_right.yaxis.set_major_formatter(plt.FuncFormatter(miles_formatter_dot))
+        ax_alt_right.tick_params(axis='y', labelsize=10)
+
+    # X axis
+    ax_alt.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    ax_alt.xaxis.set_major_locator(mdates.MonthLocator(bymonth=1))
+    plt.sca(ax_alt)
+    ax_alt.tick_params(axis='x', rotation=45)
+    for lbl in ax_alt.get_xticklabels():
+        lbl.set_ha('right')
+    ax_alt.set_xlim(left=pd.to_datetime("1999-01-01"), right=pd.to_datetime("2028-01-01") + pd.offsets.MonthEnd(0))
+
+    ax_alt.set_title(f"Salario por hora — Proyección de escenarios\nProfesor Asistente (JTP) (pesos de {last_date_str_p})", fontsize=20)
+    ax_alt.set_xlabel("Fecha", fontsize=14)
+    ax_alt.set_ylabel("Pesos por hora", fontsize=14)
+    ax_alt.legend(loc='lower left', fontsize=10)
+
+    plt.figtext(0.98, 0.01, f"Salario de un profesor asistente (JTP) con 10 años de antigüedad. Salario nominal de {last_nominal_date.strftime('%Y-%m-%d')} = ${int(nominal_last_value):,} y dividiendo por {HORAS_MENSUALES} horas/mes.\nSe realizan tres proyecciones, lineal sin aumentos (punteada), aumentos ofrecidos (en verde, +21% jun y +3% oct), Ley de Financiamiento Universitario (azul).\nGráfico generado el {current_date}. Por Rodrigo Quiroga. Ver github.com/rquiroga7/salarios_CONICET.",
+                ha="right", fontsize=11, style='italic')
+
+    plt.tight_layout(rect=[0, 0.09, 1, 1])
+    exportacion.guardar("plots/proy2.png")
+    plt.close()
+
+    print(f"Saved: {borrador.salida('plots/proy2.png')}")
+
+
+def grafico_proy3():
+    """Igual que proy2 pero con eje x restringido a 2015-01 a 2027-12"""
+    df_prof_index, last_nominal_date, nominal_last_value = serie_profasis_historica()
+    periodos = periodos_presidenciales()
+
+    last_date_p = df_prof_index["fecha"].max()
+    last_date_str_p = f"{MONTH_NAMES[last_date_p.month]} de {last_date_p.year}"
+
+    (proj_dates_trend, proj_y_trend, proj_y_bumped, proj_dates_lfy, proj_y_lfy,
+     jun_idx, jun_2026, nov_2023_val, last_obs_y) = proyecciones_por_hora()
+
+    fig_alt3, ax_alt3 = plt.subplots(figsize=(3840/300, 2880/300), dpi=300)
+
+    # Extend Milei background to 2027-12
+    periodos_proy = [
+        p if p[0] != "Milei" else ("Milei", "2023-12-01", "2027-12-01", "#e6ccff")
+        for p in periodos
+    ]
+    # Only show Macri, Fernández, Milei in legend for proy3
+    legend_proy3 = {"Macri", "Cristina Fernández", "Fernández", "Milei"}
+    for nombre, inicio, fin, color in periodos_proy:
+        lbl = nombre if nombre in legend_proy3 else '_nolegend_'
+        ax_alt3.axvspan(pd.to_datetime(inicio), pd.to_datetime(fin), color=color, alpha=0.6, zorder=0, label=lbl)
+
+    ax_alt3.plot(df_prof_index["fecha"], df_prof_index["salario_por_hora_actual"], color="black", linewidth=3,
+                 marker='o', markersize=3, label="Salario por hora", zorder=3)
+
+    ax_alt3.plot(proj_dates_trend, proj_y_trend, color='gray', linestyle=':', linewidth=2,
+                 label='Tendencia lineal sin aumentos', zorder=2.5)
+
+    ax_alt3.plot(proj_dates_trend, proj_y_bumped, color='green', linestyle='-', linewidth=2,
+                 label='Aumento ofrecido (+21% jun, +3% oct)', zorder=2.7)
+
+    ax_alt3.plot(proj_dates_lfy, proj_y_lfy, color='blue', linestyle='-', linewidth=2,
+                 label='Ley de Financiamiento Universitario', zorder=2.6)
+    # Connect last observed dot to first LFY dot (Jun-2026)
+    ax_alt3.plot([proj_dates_trend[0], proj_dates_lfy[0]],
+                 [last_obs_y, proj_y_lfy[0]], color='blue', linestyle='-', linewidth=2, zorder=2.6)
+
+    # Green "+21%" label at Jun-2026 bump
+    green_y_bump = proj_y_bumped[jun_idx]
+    green_label_date = jun_2026 + pd.DateOffset(months=7)
+    ax_alt3.annotate('+21%', xy=(green_label_date, green_y_bump - 250),
+                     xytext=(0, 15), textcoords='offset points',
+                     color='green', fontsize=16, fontweight='bold',
+                     ha='center', va='bottom',
+                     bbox=dict(boxstyle='round,pad=0.3', fc='white', ec='green', alpha=0.9, zorder=3),
+                     zorder=3)
 
-df_cic_full = pd.read_csv("datos/cic.csv", parse_dates=["fecha"])
-df_cic_full = df_cic_full.sort_values("fecha")
-
-# Background periods for CIC plot (Fernández and Milei only, like profasis)
-fig_cic2, ax_cic2 = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
-
-ax_cic2.axvspan(pd.to_datetime("2019-12-01"), pd.to_datetime("2023-11-30"), color="#cce5ff", label="Presidencia Fernández")
-ax_cic2.axvspan(pd.to_datetime("2023-12-01"), df_cic_full["fecha"].max(), color="#e6ccff", label="Presidencia Milei")
-
-# Plot salary line
-ax_cic2.plot(df_cic_full["fecha"], df_cic_full["salario_real"], color="black", linewidth=4,
-             marker='o', markersize=4, label="Salario", zorder=2.7)
-
-# Find nov-2023 value
-nov_2023_cic = pd.to_datetime("2023-11-01")
-if nov_2023_cic in df_cic_full["fecha"].values:
-    nov_2023_val_cic = df_cic_full.loc[df_cic_full["fecha"] == nov_2023_cic, "salario_real"].values[0]
-else:
-    nearest_idx = (df_cic_full["fecha"] - nov_2023_cic).abs().argmin()
-    nov_2023_val_cic = df_cic_full.iloc[nearest_idx]["salario_real"]
-
-last_date_cic2 = df_cic_full["fecha"].max()
-last_value_cic2 = df_cic_full["salario_real"].iloc[-1]
-
-# Dotted horizontal line at nov-2023 level
-ax_cic2.hlines(y=nov_2023_val_cic, xmin=nov_2023_cic, xmax=last_date_cic2,
-               colors='#404040', linestyles='dotted', linewidth=2,
-               label='Ley de Emergencia Científica', zorder=2.6)
-
-# Text on the dotted line
-ax_cic2.text(pd.to_datetime("2025-01-01"), nov_2023_val_cic * 1.01,
-             "Ley de Emergencia Científica",
-             color='#404040', fontsize=13, fontweight='bold',
-             ha='center', va='bottom', zorder=2.8)
-
-# Label at end of dotted line with value (1 month to the right)
-label_date = last_date_cic2 + pd.DateOffset(months=1)
-ax_cic2.annotate(f'${nov_2023_val_cic/1e6:.1f}M',
-                 xy=(last_date_cic2, nov_2023_val_cic),
-                 xytext=(15, 0),
-                 textcoords='offset points',
-                 color='#404040',
-                 fontsize=13,
-                 fontweight='bold',
-                 bbox=dict(boxstyle='round,pad=0.5', fc='white', ec='#404040', alpha=1, zorder=3),
-                 ha='left', va='center',
-                 arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0',
-                                 color='#404040', shrinkB=4, lw=2, zorder=2.5),
+    # Blue label: % increase needed from current salary to reach nov-2023 value
+    pct_needed = ((nov_2023_val - last_obs_y) / last_obs_y) * 100
+    ax_alt3.text(jun_2026, nov_2023_val + 550, f'+{pct_needed:.0f}%',
+                 color='blue', fontsize=16, fontweight='bold',
+                 ha='center', va='top',
+                 bbox=dict(boxstyle='round,pad=0.3', fc='white', ec='blue', alpha=0.9, zorder=3),
                  zorder=3)
 
-# Red vertical arrow from current value to nov-2023 level
-ax_cic2.annotate('',
-                 xy=(last_date_cic2, nov_2023_val_cic),
-                 xytext=(last_date_cic2, last_value_cic2),
-                 arrowprops=dict(arrowstyle='->', color='red', lw=3, zorder=2.8))
-
-# Percentage label (1 month to the right)
-pct_cic = ((nov_2023_val_cic - last_value_cic2) / last_value_cic2) * 100
-mid_y_cic = (last_value_cic2 + nov_2023_val_cic) / 2
-ax_cic2.text(label_date, mid_y_cic,
-             f'+{pct_cic:.0f}%',
-             color='red', fontsize=18, fontweight='bold',
-             ha='left', va='center', zorder=2.9)
-
-# Labels for nov-2023 and current value (1 month to the right for current)
-points_cic2 = [
-    (last_date_cic2, last_value_cic2, 'black', 15, 15),
-    (nov_2023_cic, nov_2023_val_cic, 'black', 5, -20),
-]
-for i, (date, value, color, dx, dy) in enumerate(points_cic2):
-    bbox_props = dict(boxstyle='round,pad=0.5', fc='white', ec=color, alpha=1, zorder=3)
-    if i == 1:
-        label_text = f'nov-2023\n${value/1e6:.1f}M'
+    ax_alt3.set_ylim(4000, 15000)
+    yticks_alt3 = np.arange(4000, 16000, 1000)
+    ax_alt3.set_yticks(yticks_alt3)
+    ax_alt3.yaxis.set_major_formatter(plt.FuncFormatter(miles_formatter_dot))
+    ax_alt3.tick_params(axis='y', labelsize=14)
+    for y in yticks_alt3:
+        ax_alt3.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
+
+    if not borrador.activo:
+        ax_alt3_right = ax_alt3.twinx()
+        ax_alt3_right.set_ylim(4000, 15000)
+        ax_alt3_right.set_yticks(yticks_alt3)
+        ax_alt3_right.yaxis.set_major_formatter(plt.FuncFormatter(miles_formatter_dot))
+        ax_alt3_right.tick_params(axis='y', labelsize=14)
+
+    ax_alt3.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    ax_alt3.xaxis.set_major_locator(mdates.MonthLocator(bymonth=1))
+    plt.sca(ax_alt3)
+    ax_alt3.tick_params(axis='x', rotation=45, labelsize=14)
+    for lbl in ax_alt3.get_xticklabels():
+        lbl.set_ha('right')
+    ax_alt3.set_xlim(left=pd.to_datetime("2015-01-01"), right=pd.to_datetime("2027-12-01") + pd.offsets.MonthEnd(0))
+
+    ax_alt3.set_title(f"Salario por hora — Proyección de escenarios\nProfesor Asistente (JTP) (pesos de {last_date_str_p})", fontsize=26)
+    ax_alt3.set_xlabel("Fecha", fontsize=18)
+    ax_alt3.set_ylabel("Pesos por hora", fontsize=18)
+    ax_alt3.legend(loc='lower left', fontsize=14)
+
+    plt.figtext(0.98, 0.01, f"Salario de un profesor asistente (JTP) con 10 años de antigüedad. Salario nominal de {last_nominal_date.strftime('%Y-%m-%d')} = ${int(nominal_last_value):,} y dividiendo por {HORAS_MENSUALES} horas/mes.\nSe realizan tres proyecciones, lineal sin aumentos (punteada), aumentos ofrecidos (en verde, +21% jun y +3% oct), Ley de Financiamiento Universitario (azul).\nGráfico generado el {current_date}. Por Rodrigo Quiroga. Ver github.com/rquiroga7/salarios_CONICET.",
+                ha="right", fontsize=11, style='italic')
+
+    plt.tight_layout(rect=[0, 0.09, 1, 1])
+    exportacion.guardar("plots/proy3.png")
+    plt.close()
+
+    print(f"Saved: {borrador.salida('plots/proy3.png')}")
+
+
+def grafico_salarios_cic_bolsillo():
+    """Salario de bolsillo ajustado por IPC - Investigador asistente CONICET (estilo por hora Profasis)"""
+    df_cic_full = leer_tabla("datos/cic.csv")
+    df_cic_full = df_cic_full.sort_values("fecha")
+
+    # Background periods for CIC plot (Fernández and Milei only, like profasis)
+    fig_cic2, ax_cic2 = plt.subplots(figsize=(3840/300, 2700/300), dpi=300)
+
+    ax_cic2.axvspan(pd.to_datetime("2019-12-01"), pd.to_datetime("2023-11-30"), color="#cce5ff", label="Presidencia Fernández")
+    ax_cic2.axvspan(pd.to_datetime("2023-12-01"), df_cic_full["fecha"].max(), color="#e6ccff", label="Presidencia Milei")
+
+    # Plot salary line
+    ax_cic2.plot(df_cic_full["fecha"], df_cic_full["salario_real"], color="black", linewidth=4,
+                 marker='o', markersize=4, label="Salario", zorder=2.7)
+
+    # Find nov-2023 value
+    nov_2023_cic = pd.to_datetime("2023-11-01")
+    if nov_2023_cic in df_cic_full["fecha"].values:
+        nov_2023_val_cic = df_cic_full.loc[df_cic_full["fecha"] == nov_2023_cic, "salario_real"].values[0]
     else:
-        label_text = f'${value/1e6:.1f}M'
-    ax_cic2.annotate(label_text,
-                     xy=(date, value), xycoords='data',
-                     xytext=(dx, dy), textcoords='offset points',
-                     color=color, fontsize=13, fontweight='bold', bbox=bbox_props,
-                     horizontalalignment='right' if dx < 0 else 'left',
-                     verticalalignment='bottom' if dy > 0 else 'top',
+        nearest_idx = (df_cic_full["fecha"] - nov_2023_cic).abs().argmin()
+        nov_2023_val_cic = df_cic_full.iloc[nearest_idx]["salario_real"]
+
+    last_date_cic2 = df_cic_full["fecha"].max()
+    last_value_cic2 = df_cic_full["salario_real"].iloc[-1]
+
+    # Dotted horizontal line at nov-2023 level
+    ax_cic2.hlines(y=nov_2023_val_cic, xmin=nov_2023_cic, xmax=last_date_cic2,
+                   colors='#404040', linestyles='dotted', linewidth=2,
+                   label='Ley de Emergencia Científica', zorder=2.6)
+
+    # Text on the dotted line
+    ax_cic2.text(pd.to_datetime("2025-01-01"), nov_2023_val_cic * 1.01,
+                 "Ley de Emergencia Científica",
+                 color='#404040', fontsize=13, fontweight='bold',
+                 ha='center', va='bottom', zorder=2.8)
+
+    # Label at end of dotted line with value (1 month to the right)
+    label_date = last_date_cic2 + pd.DateOffset(months=1)
+    ax_cic2.annotate(f'${nov_2023_val_cic/1e6:.1f}M',
+                     xy=(last_date_cic2, nov_2023_val_cic),
+                     xytext=(15, 0),
+                     textcoords='offset points',
+                     color='#404040',
+                     fontsize=13,
+                     fontweight='bold',
+                     bbox=dict(boxstyle='round,pad=0.5', fc='white', ec='#404040', alpha=1, zorder=3),
+                     ha='left', va='center',
                      arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0',
-                                     color=color, shrinkB=4, lw=2, zorder=2.5),
+                                     color='#404040', shrinkB=4, lw=2, zorder=2.5),
                      zorder=3)
 
-# Y axis: 1.4M to 2.8M
-ax_cic2.set_ylim(1400000, 2800000)
-yticks_cic2 = np.arange(1400000, 2900000, 100000)
-ax_cic2.set_yticks(yticks_cic2)
-ax_cic2.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
-for y in yticks_cic2:
-    ax_cic2.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
-
-# X axis: 2020-01 to 2027-01
-ax_cic2.set_xlim(left=pd.to_datetime("2020-01-01"), right=pd.to_datetime("2027-01-31"))
-ax_cic2.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
-ticks_cic2 = [pd.to_datetime(f"{y}-01-01") for y in range(2020, 2027)]
-ax_cic2.set_xticks(ticks_cic2)
-ax_cic2.tick_params(axis='x', rotation=45, labelsize=12)
-ax_cic2.tick_params(axis='y', labelsize=12)
-
-# Title
-last_date_cic2_str = f"{MONTH_NAMES[last_date_cic2.month]} de {last_date_cic2.year}"
-ax_cic2.set_title(f"Salario de bolsillo ajustado por IPC\nInvestigador asistente CONICET (pesos de {last_date_cic2_str})", fontsize=28)
-ax_cic2.set_xlabel("Fecha", fontsize=20)
-ax_cic2.set_ylabel("Salario real (millones)", fontsize=20)
-ax_cic2.legend(fontsize=20, loc='upper left')
-
-# Footnote
-footnote_cic2 = (
-    f"Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\n"
-    f"Serie reconstruida en base a actas paritarias de UPCN. Gráfico generado el {current_date}.\n{_AUTHOR}"
-)
-plt.figtext(0.5, 0.01, footnote_cic2, ha="center", fontsize=11, style='italic')
-
-plt.tight_layout(rect=[0, 0.08, 1, 1])
-plt.savefig("plots/grafico_salarios_CIC_bolsillo.png")
-plt.close()
-
-print("Saved: plots/grafico_salarios_CIC_bolsillo.png")
+    # Red vertical arrow from current value to nov-2023 level
+    ax_cic2.annotate('',
+                     xy=(last_date_cic2, nov_2023_val_cic),
+                     xytext=(last_date_cic2, last_value_cic2),
+                     arrowprops=dict(arrowstyle='->', color='red', lw=3, zorder=2.8))
+
+    # Percentage label (1 month to the right)
+    pct_cic = ((nov_2023_val_cic - last_value_cic2) / last_value_cic2) * 100
+    mid_y_cic = (last_value_cic2 + nov_2023_val_cic) / 2
+    ax_cic2.text(label_date, mid_y_cic,
+                 f'+{pct_cic:.0f}%',
+                 color='red', fontsize=18, fontweight='bold',
+                 ha='left', va='center', zorder=2.9)
+
+    # Y axis: 1.4M to 2.8M
+    ax_cic2.set_ylim(1400000, 2800000)
+    yticks_cic2 = np.arange(1400000, 2900000, 100000)
+    ax_cic2.set_yticks(yticks_cic2)
+    ax_cic2.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
+    for y in yticks_cic2:
+        ax_cic2.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
+
+    # X axis: 2020-01 to 2027-01
+    ax_cic2.set_xlim(left=pd.to_datetime("2020-01-01"), right=pd.to_datetime("2027-01-31"))
+    ax_cic2.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
+    ticks_cic2 = [pd.to_datetime(f"{y}-01-01") for y in range(2020, 2027)]
+    ax_cic2.set_xticks(ticks_cic2)
+    ax_cic2.tick_params(axis='x', rotation=45, labelsize=12)
+    ax_cic2.tick_params(axis='y', labelsize=12)
+
+    # Title
+    last_date_cic2_str = f"{MONTH_NAMES[last_date_cic2.month]} de {last_date_cic2.year}"
+    ax_cic2.set_title(f"Salario de bolsillo ajustado por IPC\nInvestigador asistente CONICET (pesos de {last_date_cic2_str})", fontsize=28)
+    ax_cic2.set_xlabel("Fecha", fontsize=20)
+    ax_cic2.set_ylabel("Salario real (millones)", fontsize=20)
+    ax_cic2.legend(fontsize=20, loc='upper left')
+
+    # Footnote
+    footnote_cic2 = (
+        f"Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\n"
+        f"Serie reconstruida en base a actas paritarias de UPCN. Gráfico generado el {current_date}.\n{_AUTHOR}"
+    )
+    plt.figtext(0.5, 0.01, footnote_cic2, ha="center", fontsize=11, style='italic')
+
+    plt.tight_layout(rect=[0, 0.08, 1, 1])
+    # Labels for the current value and nov-2023
+    colocar_etiquetas(ax_cic2, [
+        (last_date_cic2, last_value_cic2, f'${last_value_cic2/1e6:.1f}M', 'black'),
+        (nov_2023_cic, nov_2023_val_cic, f'nov-2023\n${nov_2023_val_cic/1e6:.1f}M', 'black'),
+    ])
+    exportacion.guardar("plots/grafico_salarios_CIC_bolsillo.png")
+    plt.close()
+
+    print(f"Saved: {borrador.salida('plots/grafico_salarios_CIC_bolsillo.png')}")
+
+
+# =====================
+# Registro de gráficos: (nombre, función, entradas, salidas)
+# La clave de dibujo de cada gráfico suma a sus entradas el código que lo dibuja
+# =====================
+
+ENTRADAS_PROFASIS = ["datos/crudo_profasis.csv", "datos/profasis_base100.csv", "datos/ipc_nuevo.csv",
+                     "datos/cic.csv", "proyeccion_ipc.py"]
+ENTRADAS_PROFASIS_HORA = ["datos/crudo_profasis.csv", "datos/ipc_nuevo.csv", "proyeccion_ipc.py"]
+
+# Gráficos por serie, declarados en series.json
+GRAFICOS = [
+    (f"salario_real_{tipo}", partial(grafico_salario_real, tipo),
+     [f"datos/{tipo}.csv", "datos/cic.csv", "series.json"], [f"plots/{serie['graficos']['salario_real']['archivo']}"])
+    for tipo, serie in cargar_series().items() if "salario_real" in serie["graficos"]
+] + [
+    ("indice_base_100", grafico_indice_base_100, ["datos/cic.csv"], ["plots/grafico_indice_base_100.png"]),
+] + [
+    (f"nominal_vs_ajustado_{tipo}",
+     partial(plot_nominal_vs_adjusted, f"datos/{tipo}_ajustado.csv", opciones["titulo"], opciones["subtitulo"],
+             opciones["archivo"], opciones["nota"]),
+     [f"datos/{tipo}_ajustado.csv", "series.json"], [f"plots/{opciones['archivo']}"])
+    for tipo, serie in cargar_series().items()
+    for opciones in [serie["graficos"].get("nominal_vs_ajustado")] if opciones
+] + [
+    ("salario_por_hora_profasis", grafico_salario_por_hora_profasis, ENTRADAS_PROFASIS_HORA,
+     ["plots/grafico_salario_por_hora_profasis.png"]),
+    ("salarios_profasis", grafico_salarios_profasis, ENTRADAS_PROFASIS,
+     ["plots/grafico_salarios_profasis.png", "plots/profasis_plotted_series.csv",
+      "plots/profasis_plotted_series.columnas.npz"]),
+    ("salarios_profasis_porhora", grafico_salarios_profasis_porhora, ENTRADAS_PROFASIS,
+     ["plots/grafico_salarios_profasis_porhora.png"]),
+    ("proy2", grafico_proy2, ENTRADAS_PROFASIS, ["plots/proy2.png"]),
+    ("proy3", grafico_proy3, ENTRADAS_PROFASIS, ["plots/proy3.png"]),
+    ("salarios_CIC_bolsillo", grafico_salarios_cic_bolsillo, ["datos/cic.csv"],
+     ["plots/grafico_salarios_CIC_bolsillo.png"]),
+]
+
+# Módulos que dibujan o guardan cualquier gráfico: entrada de todos
+MODULOS_DIBUJO = ["borrador.py", "exportacion.py", "etiquetas.py"]
+GRAFICOS = [(nombre, funcion, entradas + MODULOS_DIBUJO, salidas) for nombre, funcion, entradas, salidas in GRAFICOS]
+
+
+def seleccionar_graficos(solo=None, patron=None):
+    """
+    Gráficos de GRAFICOS a dibujar. `solo` es una lista de nombres: cada uno
+    selecciona el gráfico con ese nombre o cuyo nombre termina en "_{nombre}"
+    (sin distinguir mayúsculas: "cic_bolsillo" -> salarios_CIC_bolsillo, "art9" ->
+    nominal_vs_ajustado_art9). `patron` es una expresión regular que se busca en
+    el nombre y en los archivos de salida. Lanza ValueError si un nombre de `solo`
+    no selecciona ningún gráfico
+    """
+    seleccion = GRAFICOS
+    if solo:
+        elegidos = set()
+        for pedido in solo:
+            pedido = pedido.lower()
+            coinciden = [n for n, _, _, _ in GRAFICOS if n.lower() == pedido or n.lower().endswith("_" + pedido)]
+            if not coinciden:
+                raise ValueError(f"Ningún gráfico se llama {pedido}")
+            elegidos.update(coinciden)
+        seleccion = [g for g in seleccion if g[0] in elegidos]
+    if patron:
+        regex = re.compile(patron, re.IGNORECASE)
+        seleccion = [g for g in seleccion if any(regex.search(texto) for texto in [g[0]] + g[3])]
+    return seleccion
+
+
+# Claves de dibujo de cada gráfico y hash de sus PNG. Se versiona junto con plots/:
+# un gráfico cuyos datos, parámetros y código no cambiaron no se vuelve a dibujar
+ARCHIVO_CLAVES = Path("plots") / "claves_graficos.json"
+
+
+def _codigo(funcion, fuentes):
+    """
+    Agrega a `fuentes` el código de `funcion` y el de las funciones y constantes
+    de este módulo que usa, directa o indirectamente. La fecha de generación
+    (current_date) no cuenta: cambiarla no obliga a redibujar
+    """
+    funcion = getattr(funcion, "__wrapped__", funcion)  # lru_cache
+    fuentes[funcion.__name__] = inspect.getsource(funcion)
+    codigos = [funcion.__code__]
+    while codigos:
+        codigo = codigos.pop()
+        codigos.extend(c for c in codigo.co_consts if inspect.iscode(c))
+        for nombre in codigo.co_names:
+            valor = globals().get(nombre)
+            if nombre in fuentes or nombre == "current_date":
+                continue
+            if inspect.isfunction(getattr(valor, "__wrapped__", valor)) and valor.__module__ == __name__:
+                _codigo(valor, fuentes)
+            elif isinstance(valor, (int, float, str, tuple, list, dict)):
+                fuentes[nombre] = repr(valor)
+
+
+@lru_cache(maxsize=None)
+def modulos_auxiliares():
+    """
+    Archivos .py del proyecto que usa este módulo, directa o indirectamente
+    (etiquetas.py, exportacion.py, tablas.py, ...): su código también dibuja
+    """
+    directorio = Path(__file__).resolve().parent
+    propio = Path(__file__).resolve()
+    vistos = {}
+    pendientes = [sys.modules[__name__]]
+    while pendientes:
+        for valor in list(vars(pendientes.pop()).values()):
+            modulo = valor if inspect.ismodule(valor) else sys.modules.get(getattr(valor, "__module__", None) or "")
+            archivo = getattr(modulo, "__file__", None)
+            if not archivo:
+                continue
+            archivo = Path(archivo).resolve()
+            if archivo.parent == directorio and archivo != propio and archivo.name not in vistos:
+                vistos[archivo.name] = archivo
+                pendientes.append(modulo)
+    return tuple(sorted(vistos))
+
+
+def clave_grafico(funcion, entradas):
+    """
+    Clave de dibujo: hash del código del gráfico y de los módulos del proyecto
+    que usa, sus parámetros, el contenido de sus datos de entrada y la versión
+    de matplotlib
+    """
+    fuentes = {}
+    _codigo(getattr(funcion, "func", funcion), fuentes)
+    directorio = Path(__file__).resolve().parent
+    contenido = {
+        "codigo": fuentes,
+        "modulos": {nombre: hash_archivo(directorio / nombre) for nombre in modulos_auxiliares()},
+        "parametros": repr((getattr(funcion, "args", ()), getattr(funcion, "keywords", {}))),
+        "datos": hashes(entradas),
+        "matplotlib": matplotlib.__version__,
+    }
+    return hashlib.sha256(json.dumps(contenido, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def dibujar(nombre, fecha=None, draft=False, presupuesto_web=None):
+    """
+    Dibuja el gráfico `nombre` de GRAFICOS con la fecha de generación `fecha`
+    ("dd/mm/aaaa"), en modo borrador si `draft` y exportando a los demás formatos
+    si hay `presupuesto_web` (KB). Retorna su medición (tiempo y memoria) para
+    anotarla en el proceso principal cuando corre en un proceso del pool
+    """
+    global current_date
+    if fecha is not None:
+        current_date = fecha
+    if draft and not borrador.activo:
+        borrador.activar()
+    if presupuesto_web is not None:
+        exportacion.activar(presupuesto_web)
+    funcion = next(f for n, f, _, _ in GRAFICOS if n == nombre)
+    with medir(nombre, "grafico", funcion=getattr(funcion, "func", funcion).__name__):
+        funcion()
+    return reporte()["mediciones"][-1]
+
+
+def main():
+    parser = exportacion.parser_graficos("Genera los gráficos de salarios")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="Gráficos que se dibujan a la vez, cada uno en su proceso (1 = en este proceso)")
+    parser.add_argument("--only", type=lambda texto: [n for n in texto.split(",") if n],
+                        help="Dibujar sólo estos gráficos, separados por comas (ej. cic_bolsillo,art9)")
+    parser.add_argument("--match", help="Dibujar sólo los gráficos cuyo nombre o archivo coincide con esta expresión")
+    parser.add_argument("--listar", action="store_true", help="Listar los gráficos con sus entradas y salir")
+    args = parser.parse_args()
+    presupuesto_web = args.presupuesto_web if args.exportar else None
+
+    try:
+        graficos = seleccionar_graficos(args.only, args.match)
+    except (ValueError, re.error) as e:
+        parser.error(str(e))
+    if args.listar:
+        for nombre, _, entradas, salidas in graficos:
+            print(f"{nombre}: {', '.join(salidas)}\n    entradas: {', '.join(entradas)}")
+        return
+    if not graficos:
+        print(f"Ningún gráfico coincide con {args.match}")
+        return
+
+    # Los datos se leen dentro de cada gráfico: sólo se cargan los de la selección
+    claves = cargar_manifiesto(ARCHIVO_CLAVES)
+    pendientes, omitidos = {}, []
+    for nombre, funcion, entradas, salidas in graficos:
+        entradas = {"clave_dibujo": clave_grafico(funcion, entradas)}
+        # Los archivos columnares son copias del CSV que no se versionan (np.savez escribe
+        # siempre los mismos bytes, pero en un clon nuevo no existen): no cuentan
+        salidas = [s for s in salidas if not s.endswith(".columnas.npz")]
+        if args.exportar:
+            salidas += [e for s in salidas if s.endswith(".png") for e in exportacion.rutas_exportadas(s)]
+        if args.draft:
+            motivo = "borrador"
+        elif args.forzar:
+            motivo = "forzado"
+        else:
+            motivo = verificar(claves, "graf_cic", nombre, entradas, salidas)
+        if motivo is None:
+            omitidos.append(nombre)
+        else:
+            pendientes[nombre] = ("cambiaron los datos, los parámetros o el código"
+                                  if motivo == "cambió clave_dibujo" else motivo, entradas, salidas)
+
+    procesados = {}
+
+    def terminado(nombre):
+        motivo, entradas, salidas = pendientes[nombre]
+        if not args.draft:
+            registrar(claves, "graf_cic", nombre, entradas, salidas)
+            guardar_manifiesto(claves, ARCHIVO_CLAVES, etapas=["graf_cic"])
+        procesados[nombre] = motivo
+
+    jobs = min(args.jobs, len(pendientes))
+    if jobs <= 1:
+        for nombre in pendientes:
+            dibujar(nombre, args.fecha, args.draft, presupuesto_web)
+            terminado(nombre)
+    else:
+        # Cada gráfico es independiente: se dibujan en procesos separados con Agg, el
+        # mismo backend que usa savefig para PNG, así que los píxeles no cambian
+        with ProcessPoolExecutor(max_workers=jobs, initializer=matplotlib.use, initargs=("Agg",)) as pool:
+            futuros = {pool.submit(dibujar, nombre, args.fecha, args.draft, presupuesto_web): nombre for nombre in pendientes}
+            for futuro in as_completed(futuros):
+                anotar(**futuro.result())
+                terminado(futuros[futuro])
+
+    procesados = {nombre: procesados[nombre] for nombre in pendientes}
+    imprimir_resumen("graf_cic", procesados, omitidos)
 
 
+if __name__ == "__main__":
+    main()
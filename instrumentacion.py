@@ -0,0 +1,160 @@
+"""
+Tiempos y memoria de cada etapa y de cada gráfico.
+
+Los scripts marcan sus etapas con `medir` (bloque with) o `medido` (decorador),
+que anotan tiempo de reloj, tiempo de CPU y pico de memoria residente (RSS) del
+proceso. Con la variable de entorno REPORTE_TIEMPOS, al terminar cada script
+agrega sus mediciones al reporte JSON de esa ruta; con PERFIL_DIR, además guarda
+un volcado de cProfile por etapa ({script}.{etapa}.prof, para leer con pstats o
+snakeviz).
+
+    REPORTE_TIEMPOS=datos/reporte_tiempos.json python graf_cic.py
+    python ejecuta_todo.py --reporte datos/reporte_tiempos.json --perfil perfiles
+
+Reporte:
+    {"scripts": {script: {"inicio", "pid", "total": {...},
+                          "mediciones": [{"nombre", "categoria", "pared_s", "cpu_s",
+                                          "rss_pico_mb", "rss_incremento_mb", ...}]}}}
+
+El pico de RSS es el del proceso hasta el final de la etapa; rss_incremento_mb
+es cuánto creció ese pico durante la etapa (0 si la etapa no superó el pico previo).
+"""
+
+import atexit
+import cProfile
+import json
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+
+from manifiesto import bloqueo
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+ENV_REPORTE = "REPORTE_TIEMPOS"
+ENV_PERFIL = "PERFIL_DIR"
+# Categorías que se perfilan con PERFIL_DIR (sólo la más externa si se anidan)
+CATEGORIAS_PERFIL = {"etapa", "grafico"}
+
+_PID = os.getpid()
+_INICIO = (datetime.now().isoformat(timespec="seconds"), time.perf_counter(), time.process_time())
+_mediciones = []
+_perfilando = False
+_volcados = {}
+
+
+def maxrss_mb(ru_maxrss):
+    """Convierte ru_maxrss a MB (Linux lo informa en KB, macOS en bytes)"""
+    return ru_maxrss / (1024 * 1024) if sys.platform == "darwin" else ru_maxrss / 1024
+
+
+def rss_pico_mb():
+    """Pico de memoria residente del proceso hasta ahora, en MB"""
+    if resource is None:
+        return None
+    return maxrss_mb(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def nombre_script():
+    return Path(sys.argv[0]).stem or "python"
+
+
+def anotar(nombre, categoria="etapa", **valores):
+    """Agrega una medición hecha por fuera de `medir` (por ejemplo, de un subproceso)"""
+    _mediciones.append({"nombre": nombre, "categoria": categoria, **valores})
+
+
+@contextmanager
+def medir(nombre, categoria="etapa", **detalle):
+    """
+    Mide el bloque: tiempo de reloj, de CPU y pico de RSS. `detalle` se copia a
+    la medición (por ejemplo archivo=...)
+    """
+    global _perfilando
+    perfil = None
+    directorio = os.environ.get(ENV_PERFIL)
+    if directorio and categoria in CATEGORIAS_PERFIL and not _perfilando:
+        perfil = cProfile.Profile()
+        _perfilando = True
+        perfil.enable()
+
+    rss_antes = rss_pico_mb()
+    pared, cpu = time.perf_counter(), time.process_time()
+    try:
+        yield
+    finally:
+        pared, cpu = time.perf_counter() - pared, time.process_time() - cpu
+        if perfil is not None:
+            perfil.disable()
+            _perfilando = False
+            Path(directorio).mkdir(parents=True, exist_ok=True)
+            # Una etapa que se repite (guardar_salarios por tipo) numera sus volcados
+            etapa = re.sub(r"[^\w.-]", "_", nombre)
+            _volcados[etapa] = _volcados.get(etapa, 0) + 1
+            sufijo = f".{_volcados[etapa]}" if _volcados[etapa] > 1 else ""
+            perfil.dump_stats(Path(directorio) / f"{nombre_script()}.{etapa}{sufijo}.prof")
+        rss = rss_pico_mb()
+        anotar(nombre, categoria, pared_s=round(pared, 6), cpu_s=round(cpu, 6), rss_pico_mb=rss,
+               rss_incremento_mb=None if rss is None else rss - rss_antes, **detalle)
+
+
+def medido(nombre=None, categoria="etapa"):
+    """Decorador: mide cada llamada a la función con `medir`"""
+    def decorador(funcion):
+        @wraps(funcion)
+        def envoltura(*args, **kwargs):
+            with medir(nombre or funcion.__name__, categoria):
+                return funcion(*args, **kwargs)
+        return envoltura
+    return decorador
+
+
+def reporte():
+    """Mediciones de este proceso hasta ahora, con el total del script"""
+    inicio, pared, cpu = _INICIO
+    return {
+        "inicio": inicio,
+        "pid": _PID,
+        "total": {
+            "pared_s": round(time.perf_counter() - pared, 6),
+            "cpu_s": round(time.process_time() - cpu, 6),
+            "rss_pico_mb": rss_pico_mb(),
+        },
+        "mediciones": list(_mediciones),
+    }
+
+
+def guardar_reporte(archivo, script=None):
+    """
+    Agrega (o reemplaza) la entrada de este script en el reporte `archivo`.
+    Varios scripts corriendo a la vez pueden escribir el mismo reporte
+    """
+    archivo = Path(archivo)
+    archivo.parent.mkdir(parents=True, exist_ok=True)
+    with bloqueo(archivo):
+        try:
+            with open(archivo, encoding="utf-8") as f:
+                datos = json.load(f)
+        except (OSError, ValueError):
+            datos = {}
+        datos.setdefault("scripts", {})[script or nombre_script()] = reporte()
+        temp_path = archivo.with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(datos, f, ensure_ascii=False, indent=1)
+        temp_path.replace(archivo)
+
+
+@atexit.register
+def _al_salir():
+    # Sólo el proceso principal (no los procesos de un pool) escribe el reporte
+    archivo = os.environ.get(ENV_REPORTE)
+    if archivo and os.getpid() == _PID:
+        guardar_reporte(archivo)
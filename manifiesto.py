@@ -0,0 +1,132 @@
+"""
+Manifiesto de entradas y salidas para recalcular sólo lo que cambió.
+
+Cada etapa (actualiza_datos, graf_cic, proyeccion_profasis) registra, por cada
+serie o gráfico, el hash SHA-256 de sus archivos de entrada (CSV crudos,
+ipc_nuevo.csv, archivos REM y el código que los procesa) y de sus salidas.
+En la próxima corrida una serie o gráfico se omite si ninguna entrada cambió
+y sus salidas siguen intactas.
+
+El manifiesto se guarda en datos/manifiesto.json:
+    {etapa: {clave: {"entradas": {archivo: hash}, "salidas": {archivo: hash}}}}
+
+graf_cic usa el mismo formato en plots/claves_graficos.json, que se versiona con
+los gráficos, con una sola entrada por gráfico: su clave de dibujo.
+"""
+
+import hashlib
+import json
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows: sin bloqueo entre procesos
+    fcntl = None
+
+ARCHIVO_MANIFIESTO = Path("datos") / "manifiesto.json"
+
+
+def hash_archivo(path):
+    """SHA-256 del contenido de `path`, o None si no existe"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for bloque in iter(lambda: f.read(1 << 20), b""):
+            h.update(bloque)
+    return h.hexdigest()
+
+
+def hashes(archivos):
+    return {str(a): hash_archivo(a) for a in archivos}
+
+
+def cargar_manifiesto(archivo=ARCHIVO_MANIFIESTO):
+    if not Path(archivo).exists():
+        return {}
+    try:
+        with open(archivo, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+@contextmanager
+def bloqueo(archivo):
+    """Bloqueo exclusivo entre procesos sobre {archivo}.lock (sin efecto en Windows)"""
+    if fcntl is None:
+        yield
+        return
+    with open(Path(archivo).with_suffix(".lock"), "w") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def guardar_manifiesto(manifiesto, archivo=ARCHIVO_MANIFIESTO, etapas=None):
+    """
+    Guarda el manifiesto. Con `etapas`, sólo reemplaza esas etapas sobre lo que
+    haya en disco, para que varios scripts corriendo a la vez (ejecuta_todo.py)
+    no se pisen los registros
+    """
+    with bloqueo(archivo):
+        if etapas is not None:
+            actual = cargar_manifiesto(archivo)
+            actual.update({etapa: manifiesto.get(etapa, {}) for etapa in etapas})
+            manifiesto = actual
+        temp_path = Path(archivo).with_suffix(".tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(manifiesto, f, indent=1, sort_keys=True)
+        temp_path.replace(archivo)
+
+
+def verificar(manifiesto, etapa, clave, entradas, salidas):
+    """
+    Retorna el motivo por el que hay que recalcular `clave`, o None si está al día.
+    `entradas` es una lista de archivos o un dict {nombre: hash} ya calculado
+    """
+    registro = manifiesto.get(etapa, {}).get(clave)
+    if registro is None:
+        return "sin registro previo"
+    previas = registro.get("entradas", {})
+    if set(previas) != {str(a) for a in entradas}:
+        return "cambiaron las entradas declaradas"
+    for archivo, digest in (entradas if isinstance(entradas, dict) else hashes(entradas)).items():
+        if digest != previas[archivo]:
+            return f"falta entrada {archivo}" if digest is None else f"cambió {archivo}"
+    previas = registro.get("salidas", {})
+    for archivo, digest in hashes(salidas).items():
+        if digest is None:
+            return f"falta salida {archivo}"
+        if digest != previas.get(archivo):
+            return f"salida {archivo} modificada"
+    return None
+
+
+def registrar(manifiesto, etapa, clave, entradas, salidas):
+    """
+    Anota los hashes actuales de entradas y salidas de `clave` (llamar tras generarlas).
+    `entradas` es una lista de archivos o un dict {nombre: hash} ya calculado
+    """
+    manifiesto.setdefault(etapa, {})[clave] = {
+        "entradas": dict(entradas) if isinstance(entradas, dict) else hashes(entradas),
+        "salidas": hashes(salidas),
+    }
+
+
+def imprimir_resumen(etapa, procesados, omitidos):
+    """
+    `procesados`: {clave: motivo}; `omitidos`: {clave: motivo} o lista de claves
+    (sin motivo se muestran como al día)
+    """
+    if not isinstance(omitidos, dict):
+        omitidos = dict.fromkeys(omitidos)
+    print(f"\n=== {etapa}: {len(procesados)} recalculados, {len(omitidos)} omitidos ===")
+    for clave, motivo in procesados.items():
+        print(f"  recalculado {clave}: {motivo}")
+    for clave, motivo in omitidos.items():
+        print(f"  omitido {clave}: {motivo or 'entradas sin cambios'}")
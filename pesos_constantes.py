@@ -0,0 +1,151 @@
+"""
+Salarios reales en pesos de cualquier mes.
+
+actualiza_datos.py guarda en datos/indice_acumulado.npz, por cada tipo, el
+índice de precios acumulado de su deflactor (IPC extendido hasta el último
+salario) y el salario deflactado (salario / índice) sobre la misma grilla
+mensual. Expresar una serie en pesos de otro mes es entonces una sola
+multiplicación:
+
+    real = deflactado * indice[:, mes_base]
+
+Uso:
+    python pesos_constantes.py --base 2019-12                 # todas las series
+    python pesos_constantes.py --base 2019-12 --tipo cic --salida cic_2019.csv
+"""
+
+import argparse
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+ARCHIVO_INDICE = Path("datos") / "indice_acumulado.npz"
+
+
+def construir_indice_acumulado(tipos=None, ipc=None, archivo=ARCHIVO_INDICE):
+    """
+    Calcula y guarda el índice acumulado y los salarios deflactados de `tipos`
+    (por defecto todos). Si no se pasa `ipc`, cada tipo usa su deflactor de series.json
+    """
+    from actualiza_datos import TIPOS, leer_crudos, meses_ordinales, alinear_indice
+    from proyeccion_ipc import extender_ipc
+    from registro_series import serie, leer_deflactor
+
+    crudos, errores = leer_crudos(TIPOS if tipos is None else tipos)
+    if not crudos:
+        raise ValueError(f"No se pudo leer ningún salario: {errores}")
+    ultima_fecha = max(df["fecha"].max() for df in crudos.values())
+    deflactores = {}
+    for tipo in crudos:
+        nombre = serie(tipo)["deflactor"]
+        if nombre not in deflactores:
+            deflactores[nombre] = extender_ipc(leer_deflactor(nombre) if ipc is None else ipc, ultima_fecha)
+
+    meses_tipo = {tipo: meses_ordinales(df["fecha"]) for tipo, df in crudos.items()}
+    meses_ipc = {nombre: meses_ordinales(d["fecha"]) for nombre, d in deflactores.items()}
+    primer_mes = min(*(m.min() for m in meses_ipc.values()), *(m.min() for m in meses_tipo.values()))
+    ultimo_mes = max(*(m.max() for m in meses_ipc.values()), *(m.max() for m in meses_tipo.values()))
+    meses = np.arange(primer_mes, ultimo_mes + 1)
+
+    indice = np.full((len(crudos), len(meses)), np.nan)
+    deflactado = np.full((len(crudos), len(meses)), np.nan)
+    for fila, (tipo, df) in enumerate(crudos.items()):
+        nombre = serie(tipo)["deflactor"]
+        indice[fila] = alinear_indice(meses, meses_ipc[nombre],
+                                      deflactores[nombre]["indice"].to_numpy(dtype=np.float64))
+        pos = meses_tipo[tipo] - primer_mes
+        deflactado[fila, pos] = df["salario"].to_numpy(dtype=np.float64) / indice[fila, pos]
+
+    temp_path = Path(archivo).with_suffix(".tmp")
+    with open(temp_path, "wb") as f:
+        np.savez(
+            f,
+            tipos=np.array(list(crudos)),
+            meses=(meses - 1970 * 12).astype("datetime64[M]"),
+            indice=indice,
+            deflactado=deflactado,
+        )
+    temp_path.replace(archivo)
+    return errores
+
+
+@lru_cache(maxsize=4)
+def _cargar(archivo, mtime):
+    with np.load(archivo) as store:
+        return (list(store["tipos"]), store["meses"], store["indice"], store["deflactado"])
+
+
+def cargar_indice_acumulado(archivo=ARCHIVO_INDICE):
+    """
+    Retorna (tipos, meses datetime64[M], indice y deflactado, ambos tipos x meses).
+    Se lee del disco sólo cuando el archivo cambió
+    """
+    archivo = Path(archivo)
+    if not archivo.exists():
+        raise FileNotFoundError(f"No existe {archivo}; correr actualiza_datos.py")
+    return _cargar(str(archivo), archivo.stat().st_mtime_ns)
+
+
+def _posicion_base(meses, indice, base):
+    base = np.datetime64(str(base)[:7], "M")
+    pos = int((base - meses[0]).astype(int))
+    if not 0 <= pos < len(meses) or np.isnan(indice[..., pos]).any():
+        raise ValueError(f"No hay IPC para el mes base {base}")
+    return pos
+
+
+def reales(base, archivo=ARCHIVO_INDICE):
+    """
+    Todas las series en pesos del mes `base` ("2019-12", "2019-12-01", ...).
+    Retorna (tipos, meses, matriz tipos x meses con NaN donde no hay salario)
+    """
+    tipos, meses, indice, deflactado = cargar_indice_acumulado(archivo)
+    pos = _posicion_base(meses, indice, base)
+    return tipos, meses, deflactado * indice[:, pos:pos + 1]
+
+
+def real(tipo, base="2019-12", archivo=ARCHIVO_INDICE):
+    """
+    Salario real de `tipo` en pesos del mes `base`.
+    Retorna (fechas, valores) sólo para los meses con salario
+    """
+    tipos, meses, indice, deflactado = cargar_indice_acumulado(archivo)
+    if tipo not in tipos:
+        raise ValueError(f"Tipo desconocido: {tipo}")
+    fila = tipos.index(tipo)
+    validos = ~np.isnan(deflactado[fila])
+    return meses[validos], deflactado[fila, validos] * indice[fila, _posicion_base(meses, indice[fila], base)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Salarios reales en pesos de un mes dado")
+    parser.add_argument("--base", required=True, help="Mes base, ej. 2019-12")
+    parser.add_argument("--tipo", action="append", help="Tipo a emitir (se puede repetir; por defecto todos)")
+    parser.add_argument("--salida", help="Archivo CSV de salida (por defecto, salida estándar)")
+    args = parser.parse_args()
+
+    tipos, meses, matriz = reales(args.base)
+    if args.tipo:
+        desconocidos = [t for t in args.tipo if t not in tipos]
+        if desconocidos:
+            parser.error(f"Tipos desconocidos: {', '.join(desconocidos)}")
+        matriz = matriz[[tipos.index(t) for t in args.tipo]]
+        tipos = args.tipo
+
+    # Sólo los meses en los que alguna serie tiene dato
+    con_dato = ~np.isnan(matriz).all(axis=0)
+    fechas = np.char.add(meses[con_dato].astype(str), "-01")
+    valores = np.where(np.isnan(matriz[:, con_dato]), "", np.char.mod("%.2f", matriz[:, con_dato]))
+    lineas = [",".join(["fecha"] + list(tipos))]
+    lineas += [",".join(fila) for fila in np.column_stack([fechas, valores.T])]
+
+    salida = open(args.salida, "w", encoding="utf-8") if args.salida else sys.stdout
+    salida.write("\n".join(lineas) + "\n")
+    if args.salida:
+        salida.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Estimación de meses de IPC todavía no publicados por INDEC.
+
+Todos los scripts extienden la serie de IPC con la misma función, de modo que
+los valores estimados coinciden entre datos procesados y gráficos.
+"""
+
+import numpy as np
+import pandas as pd
+
+REGLAS = ("crecimiento", "rem", "promedio")
+
+
+def tasas_rem(archivo="datos/relevamiento-expectativas-mercado-rem.csv"):
+    """
+    Retorna las variaciones mensuales esperadas de IPC (en fracción, 0.02 = 2%)
+    del último relevamiento REM-BCRA, indexadas por mes
+    """
+    rem = pd.read_csv(archivo, parse_dates=["indice_tiempo"])
+    ultimo = rem.dropna(subset=["rem_ipc_nac_var_mensual_t_1"]).iloc[-1]
+    columnas = ["rem_ipc_nac_var_mensual_t"] + [f"rem_ipc_nac_var_mensual_t_{k}" for k in range(1, 7)]
+    fechas = pd.date_range(ultimo["indice_tiempo"], periods=len(columnas), freq="MS")
+    return pd.Series(ultimo[columnas].to_numpy(dtype=float), index=fechas).dropna()
+
+
+def extender_ipc(ipc, hasta, regla="crecimiento", tasas=None, meses=3):
+    """
+    Extiende una serie de IPC (columnas fecha, indice) hasta el mes `hasta`
+    en una sola operación.
+
+    Reglas:
+      "crecimiento": repite la variación del último mes publicado
+      "rem": usa las variaciones esperadas `tasas` (Series mes -> fracción);
+             los meses sin expectativa repiten la variación del último mes
+      "promedio": repite la variación mensual promedio (geométrica) de los
+                  últimos `meses` meses
+    """
+    if regla not in REGLAS:
+        raise ValueError(f"Regla de proyección desconocida: {regla}")
+
+    ultima_fecha = ipc["fecha"].iloc[-1]
+    fechas = pd.date_range(ultima_fecha + pd.DateOffset(months=1), pd.to_datetime(hasta), freq="MS")
+    if len(fechas) == 0:
+        return ipc
+
+    indice = ipc["indice"].to_numpy(dtype=float)
+    crecimiento = np.full(len(fechas), indice[-1] / indice[-2])
+    if regla == "promedio":
+        crecimiento[:] = (indice[-1] / indice[-1 - meses]) ** (1 / meses)
+    elif regla == "rem":
+        if tasas is None:
+            tasas = tasas_rem()
+        esperado = 1 + tasas.reindex(fechas).to_numpy(dtype=float)
+        crecimiento = np.where(np.isnan(esperado), crecimiento, esperado)
+
+    proyectado = pd.DataFrame({
+        "fecha": fechas,
+        "indice": indice[-1] * np.cumprod(crecimiento),
+    })
+    return pd.concat([ipc, proyectado], ignore_index=True)
@@ -3,6 +3,10 @@ import numpy as np
 import matplotlib.dates as mdates
 import matplotlib.pyplot as plt
 from datetime import datetime
+from tablas import leer_tabla
+from instrumentacion import medido
+import borrador
+import exportacion
 
 
 def miles_formatter_dot(x, pos):
@@ -17,11 +21,14 @@ def millones_coma(x, pos):
     return s.replace(',', 'TEMP').replace('.', ',').replace('TEMP', '.')
 
 
+@medido()
 def main():
+    args = exportacion.parser_graficos("Proyecciones de salario hasta noviembre de 2027", forzar=False).parse_args()
+    exportacion.activar_opciones(args)
     infile = "plots/profasis_plotted_series.csv"
     outpng = "plots/grafico_salarios_profasis_porhora_proy.png"
 
-    df = pd.read_csv(infile, parse_dates=["fecha"]) 
+    df = leer_tabla(infile)
     df = df.sort_values("fecha")
     df["salario_por_hora_actual"] = df["salario_real_ipc"] / 176
     df = df.dropna(subset=["salario_por_hora_actual"])
@@ -102,11 +109,12 @@ def main():
         ax.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
 
     # Mirror y-axis labels on the right side
-    ax_right = ax.twinx()
-    ax_right.set_ylim(ylim_min, ylim_max)
-    ax_right.set_yticks(yticks_h2)
-    ax_right.yaxis.set_major_formatter(plt.FuncFormatter(miles_formatter_dot))
-    ax_right.tick_params(axis='y', labelsize=10)
+    if not borrador.activo:
+        ax_right = ax.twinx()
+        ax_right.set_ylim(ylim_min, ylim_max)
+        ax_right.set_yticks(yticks_h2)
+        ax_right.yaxis.set_major_formatter(plt.FuncFormatter(miles_formatter_dot))
+        ax_right.tick_params(axis='y', labelsize=10)
 
     # X axis formatting
     ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
@@ -134,7 +142,7 @@ def main():
     ax.legend(loc='lower left', fontsize=10)
 
     # Footnote similar to graf_cic.py
-    current_date = pd.Timestamp.now().strftime("%d/%m/%Y")
+    current_date = args.fecha
     footnote_text = (
         "Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\n"
         "Serie salarial reconstruida en base a recibos de sueldo de UNC y simulador de ADIUC.\n"
@@ -144,15 +152,15 @@ def main():
     plt.figtext(0.98, 0.01, footnote_text, ha='right', fontsize=11, style='italic')
 
     plt.tight_layout(rect=[0, 0.09, 1, 1])
-    plt.savefig(outpng)
+    exportacion.guardar(outpng)
     plt.close()
 
-    print(f"Saved: {outpng}")
+    print(f"Saved: {borrador.salida(outpng)}")
 
     # ------------------
     # CIC plot with linear projection to Nov 2027
     # ------------------
-    df_cic = pd.read_csv("datos/cic.csv", parse_dates=["fecha"]) 
+    df_cic = leer_tabla("datos/cic.csv")
     df_cic = df_cic.sort_values("fecha")
     last_date_c = df_cic["fecha"].max()
     last_val_c = df_cic.loc[df_cic["fecha"] == last_date_c, "salario_real"].values[0]
@@ -230,24 +238,25 @@ def main():
     axc.legend(loc='lower left', fontsize=12)
 
     # Add right-side secondary y-axis mirroring the left axis
-    axc_right = axc.twinx()
-    axc_right.set_ylim(ylim_min, ylim_max)
-    axc_right.set_yticks(yticks)
-    axc_right.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
-    axc_right.tick_params(axis='y', labelsize=12)
+    if not borrador.activo:
+        axc_right = axc.twinx()
+        axc_right.set_ylim(ylim_min, ylim_max)
+        axc_right.set_yticks(yticks)
+        axc_right.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
+        axc_right.tick_params(axis='y', labelsize=12)
 
-    plt.figtext(0.98, 0.01, f"Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\nSerie reconstruida en base a actas paritarias de UPCN. Gráfico generado el {pd.Timestamp.now().strftime('%d/%m/%Y')}.\nPor Rodrigo Quiroga. Ver github.com/rquiroga7/salarios_CONICET", ha="right", fontsize=12, style='italic')
+    plt.figtext(0.98, 0.01, f"Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\nSerie reconstruida en base a actas paritarias de UPCN. Gráfico generado el {current_date}.\nPor Rodrigo Quiroga. Ver github.com/rquiroga7/salarios_CONICET", ha="right", fontsize=12, style='italic')
 
     plt.tight_layout(rect=[0, 0.06, 1, 1])
-    plt.savefig("plots/grafico_salarios_CIC_proy.png")
+    exportacion.guardar("plots/grafico_salarios_CIC_proy.png")
     plt.close()
 
-    print("Saved: plots/grafico_salarios_CIC_proy.png")
+    print(f"Saved: {borrador.salida('plots/grafico_salarios_CIC_proy.png')}")
 
     # ------------------
     # Beca Doctoral plot using CIC-style formatting, projected to Nov 2027
     # ------------------
-    df_beca = pd.read_csv("datos/beca_conicet.csv", parse_dates=["fecha"]) 
+    df_beca = leer_tabla("datos/beca_conicet.csv")
     df_beca = df_beca.sort_values("fecha")
     last_date_b = df_beca["fecha"].max()
     last_val_b = df_beca.loc[df_beca["fecha"] == last_date_b, "salario_real"].values[0]
@@ -301,17 +310,18 @@ def main():
         axb.axhline(y=y, color='gray', linestyle='--', linewidth=0.5)
 
     # Mirror right axis
-    axb_right = axb.twinx()
-    axb_right.set_ylim(ylim_min_b, ylim_max_b)
-    axb_right.set_yticks(yticks_b)
-    axb_right.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
-    left_labels_b = axb.yaxis.get_ticklabels()
-    if len(left_labels_b) > 0:
-        left_fp_b = left_labels_b[0].get_fontproperties()
-        for lbl in axb_right.yaxis.get_ticklabels():
-            lbl.set_fontproperties(left_fp_b)
-    else:
-        axb_right.tick_params(axis='y', labelsize=12)
+    if not borrador.activo:
+        axb_right = axb.twinx()
+        axb_right.set_ylim(ylim_min_b, ylim_max_b)
+        axb_right.set_yticks(yticks_b)
+        axb_right.yaxis.set_major_formatter(plt.FuncFormatter(millones_coma))
+        left_labels_b = axb.yaxis.get_ticklabels()
+        if len(left_labels_b) > 0:
+            left_fp_b = left_labels_b[0].get_fontproperties()
+            for lbl in axb_right.yaxis.get_ticklabels():
+                lbl.set_fontproperties(left_fp_b)
+        else:
+            axb_right.tick_params(axis='y', labelsize=12)
 
     axb.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m'))
     start_y = 2016
@@ -330,13 +340,13 @@ def main():
     axb.set_ylabel("Salario real (millones)", fontsize=16)
     axb.legend(loc='lower left', fontsize=12)
 
-    plt.figtext(0.98, 0.01, f"Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\nSerie reconstruida en base a publicaciones periódicas de CONICET. Gráfico generado el {pd.Timestamp.now().strftime('%d/%m/%Y')}.\nPor Rodrigo Quiroga. Ver github.com/rquiroga7/salarios_CONICET", ha="right", fontsize=12, style='italic')
+    plt.figtext(0.98, 0.01, f"Inflación según INDEC (IPC). Se estima IPC constante para el último mes si no hay dato disponible.\nSerie reconstruida en base a publicaciones periódicas de CONICET. Gráfico generado el {current_date}.\nPor Rodrigo Quiroga. Ver github.com/rquiroga7/salarios_CONICET", ha="right", fontsize=12, style='italic')
 
     plt.tight_layout(rect=[0, 0.06, 1, 1])
-    plt.savefig("plots/grafico_salarios_beca_doctoral_proy.png")
+    exportacion.guardar("plots/grafico_salarios_beca_doctoral_proy.png")
     plt.close()
 
-    print("Saved: plots/grafico_salarios_beca_doctoral_proy.png")
+    print(f"Saved: {borrador.salida('plots/grafico_salarios_beca_doctoral_proy.png')}")
 
 if __name__ == '__main__':
     main()
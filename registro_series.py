@@ -0,0 +1,80 @@
+"""
+Registro de series salariales.
+
+Cada serie se declara una sola vez en series.json: nombre, CSV crudo, serie de
+IPC con la que se deflacta (cualquier columna de datos/ipc_series.csv), mes base
+del salario ajustado y los gráficos que la muestran con sus opciones y notas.
+actualiza_datos.py, actualiza_datos_IPC.py y graf_cic.py toman de acá la lista
+de series, de modo que agregar una categoría es agregar una entrada al archivo.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import pandas as pd
+
+from tablas import leer_tabla
+
+ARCHIVO_SERIES = Path("series.json")
+DEFLACTOR_GENERAL = "nacional.nivel_general"
+
+_DEFAULTS = {
+    "deflactor": DEFLACTOR_GENERAL,
+    "base_ajustado": "2023-11-01",
+    "graficos": {},
+}
+
+
+@lru_cache(maxsize=None)
+def _leer(archivo):
+    with open(archivo, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def cargar_series(archivo=ARCHIVO_SERIES):
+    """
+    Retorna {tipo: definición} en el orden del archivo, con valores por defecto
+    para los campos omitidos
+    """
+    series = {}
+    for tipo, definicion in _leer(str(archivo)).items():
+        serie = dict(_DEFAULTS, crudo=f"datos/crudo_{tipo}.csv")
+        serie.update(definicion)
+        series[tipo] = serie
+    return series
+
+
+def serie(tipo, archivo=ARCHIVO_SERIES):
+    """Definición de `tipo`; los tipos no registrados usan los valores por defecto"""
+    return cargar_series(archivo).get(tipo, dict(_DEFAULTS, crudo=f"datos/crudo_{tipo}.csv"))
+
+
+def archivos_deflactor(deflactor):
+    """Archivos de datos de los que depende un deflactor (para el manifiesto)"""
+    if deflactor == DEFLACTOR_GENERAL:
+        return ["datos/ipc_nuevo.csv", "datos/ipc_nuevo.columnas.npz"]
+    return ["datos/ipc_crudo.csv", "datos/ipc_series.csv"]
+
+
+def leer_deflactor(deflactor):
+    """
+    Serie de IPC (columnas fecha, indice) con la que se deflacta.
+    El nivel general es datos/ipc_nuevo.csv; las demás series salen de
+    datos/ipc_series.csv, que empieza en 2017, y antes de eso se completan con
+    el nivel general de datos/ipc_crudo.csv (misma base)
+    """
+    if deflactor == DEFLACTOR_GENERAL:
+        return leer_tabla("datos/ipc_nuevo.csv")
+    series = pd.read_csv("datos/ipc_series.csv", parse_dates=["fecha"])
+    if deflactor not in series.columns:
+        raise ValueError(f"Deflactor desconocido: {deflactor}")
+    ipc = pd.read_csv("datos/ipc_crudo.csv", parse_dates=["fecha"])
+    serie_ipc = series[["fecha", deflactor]].rename(columns={deflactor: "indice"})
+    return pd.concat([ipc[ipc["fecha"] < serie_ipc["fecha"].min()], serie_ipc], ignore_index=True)
+
+
+def ultima_fecha_salarios(archivo=ARCHIVO_SERIES):
+    """Último mes con salario entre todas las series registradas"""
+    return max(pd.read_csv(s["crudo"], parse_dates=["fecha"])["fecha"].max()
+               for s in cargar_series(archivo).values())
@@ -13,6 +13,7 @@ import requests
 from bs4 import BeautifulSoup
 from datetime import datetime
 import os
+from instrumentacion import medido
 
 # Configuración
 URL_SIMULADOR = "https://simusueldo.adiuc.org.ar"
@@ -35,6 +36,7 @@ def obtener_session():
     return session
 
 
+@medido(categoria="pedido")
 def obtener_token_csrf(session):
     """Obtiene el token CSRF del formulario"""
     response = session.get(URL_SIMULADOR)
@@ -101,6 +103,7 @@ def extraer_neto_cobrar_html(html_content):
         return None
 
 
+@medido(categoria="pedido")
 def simular_salario_request(session, mes, anio, csrf_token):
     """
     Simula el salario para un mes, año y cargo específicos.
@@ -151,6 +154,7 @@ def simular_salario_request(session, mes, anio, csrf_token):
         return None
 
 
+@medido()
 def scrape_historico():
     """Scrapea todo el histórico de salarios"""
     session = obtener_session()
@@ -0,0 +1,186 @@
+"""
+Servicio HTTP local con las series salariales en JSON o CSV.
+
+Uso:
+    python servidor.py                      # http://127.0.0.1:8000
+    python servidor.py --puerto 8080
+
+Rutas (agregar ?formato=csv, o el encabezado Accept: text/csv, para CSV):
+    /series                        tipos disponibles (de series.json)
+    /series/{tipo}                 fecha, nominal y salario real en pesos del último mes
+    /series/{tipo}?base=2019-12    salario real en pesos de cualquier mes
+    /ipc                           IPC nivel general
+    /kpis                          último valor de cada serie y sus variaciones reales
+
+Cada respuesta lleva un ETag fuerte: el hash de la ruta y de los hashes SHA-256
+de sus archivos de entrada (los mismos que registra datos/manifiesto.json para
+actualiza_datos). Las respuestas se guardan en memoria ya serializadas; un
+cliente que repite la consulta con If-None-Match recibe 304 mientras los datos
+no cambien, y al actualizarlos el ETag cambia solo.
+"""
+
+import argparse
+import hashlib
+import json
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+import consultas
+from actualiza_datos import TIPOS, entradas_salidas
+from registro_series import ARCHIVO_SERIES, DEFLACTOR_GENERAL, archivos_deflactor, cargar_series
+
+MES_PERDIDA = "2023-11"
+FORMATOS = {"json": "application/json; charset=utf-8", "csv": "text/csv; charset=utf-8"}
+
+
+def _fechas(df):
+    df = df.copy()
+    df["fecha"] = df["fecha"].dt.strftime("%Y-%m-%d")
+    return df
+
+
+def _tabla_series():
+    return pd.DataFrame([{"tipo": tipo, "nombre": d.get("nombre", tipo), "deflactor": d["deflactor"]}
+                         for tipo, d in cargar_series().items()])
+
+
+def _tabla_serie(tipo, base):
+    df = consultas.serie(tipo)
+    real = consultas.real(tipo, base)
+    return _fechas(pd.DataFrame({
+        "fecha": df["fecha"],
+        "nominal": df["salario"],
+        "salario_real": real["salario_real"],
+    }))
+
+
+def _tabla_kpis():
+    filas = []
+    for tipo in TIPOS:
+        real = consultas.real(tipo)["salario_real"].to_numpy()
+        df = consultas.serie(tipo)
+        fila = {
+            "tipo": tipo,
+            "fecha": df["fecha"].iloc[-1].strftime("%Y-%m-%d"),
+            "nominal": int(df["salario"].iloc[-1]),
+            "variacion_real_mensual_pct": float((real[-1] / real[-2] - 1) * 100) if len(real) > 1 else None,
+            "variacion_real_interanual_pct": float((real[-1] / real[-13] - 1) * 100) if len(real) > 12 else None,
+            f"perdida_desde_{MES_PERDIDA}_pct": None,
+        }
+        try:
+            fila[f"perdida_desde_{MES_PERDIDA}_pct"] = consultas.perdida_desde(tipo, MES_PERDIDA)["perdida_pct"]
+        except ValueError:
+            pass
+        filas.append(fila)
+    return pd.DataFrame(filas)
+
+
+def resolver(ruta, parametros):
+    """
+    Retorna (entradas, funcion que arma la tabla) de una ruta. Lanza LookupError
+    si la ruta o el tipo no existen
+    """
+    partes = [p for p in ruta.split("/") if p]
+    if partes == ["series"]:
+        return [ARCHIVO_SERIES], _tabla_series
+    if len(partes) == 2 and partes[0] == "series":
+        tipo = partes[1]
+        if tipo not in TIPOS:
+            raise LookupError(f"Tipo desconocido: {tipo}")
+        base = parametros.get("base")
+        return consultas.entradas_real(tipo, base), lambda: _tabla_serie(tipo, base)
+    if partes == ["ipc"]:
+        return archivos_deflactor(DEFLACTOR_GENERAL), lambda: _fechas(consultas.ipc())
+    if partes == ["kpis"]:
+        entradas = sorted({str(a) for tipo in TIPOS for a in entradas_salidas(tipo)[0]})
+        return entradas, _tabla_kpis
+    raise LookupError(f"Ruta desconocida: {ruta}")
+
+
+@lru_cache(maxsize=1024)
+def _respuesta(ruta, parametros, formato, huella):
+    """
+    Cuerpo serializado y ETag de una consulta. `huella` (hashes de las entradas)
+    forma parte de la clave: si cambia un archivo la respuesta se recalcula
+    """
+    _, tabla = resolver(ruta, dict(parametros))
+    df = tabla()
+    if formato == "csv":
+        cuerpo = df.to_csv(index=False).encode("utf-8")
+    else:
+        cuerpo = json.dumps(df.to_dict(orient="records"), ensure_ascii=False).encode("utf-8")
+    etag = hashlib.sha256(repr((ruta, parametros, formato, huella)).encode("utf-8")).hexdigest()[:32]
+    return cuerpo, f'"{etag}"'
+
+
+def consultar(ruta, parametros, formato):
+    """Retorna (cuerpo, etag) de una ruta; usa el caché mientras las entradas no cambien"""
+    entradas, _ = resolver(ruta, parametros)
+    return _respuesta(ruta, tuple(sorted(parametros.items())), formato, consultas.huella(entradas))
+
+
+class Manejador(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Encabezados y cuerpo salen en dos escrituras: con Nagle cada respuesta espera el ACK diferido
+    disable_nagle_algorithm = True
+    registrar_pedidos = False
+
+    def do_GET(self):
+        partes = urlsplit(self.path)
+        parametros = {k: v[-1] for k, v in parse_qs(partes.query).items()}
+        formato = parametros.pop("formato", None)
+        if formato is None:
+            formato = "csv" if "text/csv" in self.headers.get("Accept", "") else "json"
+        try:
+            if formato not in FORMATOS:
+                raise ValueError(f"Formato desconocido: {formato}")
+            cuerpo, etag = consultar(partes.path, parametros, formato)
+        except (LookupError, ValueError) as e:
+            estado = 404 if isinstance(e, LookupError) else 400
+            self._enviar(estado, json.dumps({"error": str(e)}, ensure_ascii=False).encode("utf-8"),
+                         FORMATOS["json"])
+            return
+        if etag in [v.strip() for v in self.headers.get("If-None-Match", "").split(",")]:
+            self._enviar(304, b"", None, etag)
+        else:
+            self._enviar(200, cuerpo, FORMATOS[formato], etag)
+
+    def _enviar(self, estado, cuerpo, tipo_contenido, etag=None):
+        self.send_response(estado)
+        if tipo_contenido:
+            self.send_header("Content-Type", tipo_contenido)
+        if etag:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        self.send_header("Content-Length", str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, format, *args):
+        if self.registrar_pedidos:
+            super().log_message(format, *args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servicio HTTP local con las series salariales")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8000)
+    parser.add_argument("--log", action="store_true", help="Registrar cada pedido en la salida de errores")
+    args = parser.parse_args()
+
+    Manejador.registrar_pedidos = args.log
+    servidor = ThreadingHTTPServer((args.host, args.puerto), Manejador)
+    print(f"Sirviendo en http://{args.host}:{args.puerto}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Tablas procesadas en formato columnar tipado.
+
+Cada tabla procesada (datos/{tipo}.csv, datos/{tipo}_ajustado.csv,
+datos/ipc_nuevo.csv y plots/profasis_plotted_series.csv) se guarda también como
+{nombre}.columnas.npz: un array por columna con el tipo fijado en ESQUEMAS
+(fechas como datetime64[D], sin volver a parsear texto) y el esquema en la
+clave "__esquema__". El CSV queda como copia legible.
+
+leer_tabla() usa el archivo columnar si existe y no es más viejo que el CSV (si
+el CSV se editó a mano después, se lee el CSV). pandas escribe cada float con
+su representación más corta y el CSV se lee con float_precision="round_trip",
+así que los dos caminos dan exactamente los mismos valores (la lectura
+round_trip cambia a propósito algunos valores en ~1e-16 relativo respecto del
+parseo por defecto de pandas, que no devuelve el float escrito).
+
+Los .columnas.npz son un caché local: no se versionan (ver .gitignore), se
+regeneran en cada corrida y, si faltan, se lee el CSV, que sigue siendo el
+archivo versionado. Se usa .npz en lugar de Parquet o Feather porque numpy ya
+es dependencia del proyecto y pyarrow no; np.load alcanza para columnas tipadas
+con fechas datetime64.
+"""
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ESQUEMAS = {
+    "salario_real": {"fecha": "datetime64[D]", "salario_real": "float64"},
+    "ajustado": {"fecha": "datetime64[D]", "nominal": "int64", "ajustado": "float64"},
+    "ipc": {"fecha": "datetime64[D]", "indice": "float64"},
+    "profasis_plotted_series": {
+        "fecha": "datetime64[D]",
+        "indice": "float64",
+        "indice_ext": "float64",
+        "salario_real_ipc": "float64",
+        "salario_pesos_actuales": "float64",
+    },
+}
+
+
+def ruta_columnar(csv_path):
+    """datos/cic.csv -> datos/cic.columnas.npz"""
+    return Path(csv_path).with_suffix(".columnas.npz")
+
+
+def _convertir(columna, dtype):
+    valores = columna.to_numpy()
+    if dtype.startswith("datetime64"):
+        return pd.to_datetime(columna).to_numpy().astype(dtype)
+    convertido = valores.astype(dtype)
+    if np.issubdtype(convertido.dtype, np.integer) and not np.array_equal(convertido, valores):
+        raise ValueError(f"La columna {columna.name} no es entera como indica el esquema")
+    return convertido
+
+
+def guardar_tabla(df, csv_path, esquema):
+    """
+    Escribe `df` (sólo las columnas de `esquema`, un nombre de ESQUEMAS o un dict
+    columna -> dtype) como CSV y como archivo columnar tipado
+    """
+    if isinstance(esquema, str):
+        esquema = ESQUEMAS[esquema]
+    df = df[list(esquema)]
+    df.to_csv(csv_path, index=False)
+
+    columnas = {nombre: _convertir(df[nombre], dtype) for nombre, dtype in esquema.items()}
+    destino = ruta_columnar(csv_path)
+    temp_path = destino.with_suffix(".tmp")
+    with open(temp_path, "wb") as f:
+        np.savez(f, __esquema__=np.array(json.dumps(esquema)), **columnas)
+    temp_path.replace(destino)
+
+
+def leer_columnar(path):
+    """Lee un archivo .columnas.npz como DataFrame, en el orden de su esquema"""
+    with np.load(path) as store:
+        esquema = json.loads(str(store["__esquema__"]))
+        return pd.DataFrame({nombre: store[nombre] for nombre in esquema})
+
+
+def leer_tabla(csv_path):
+    """
+    Lee una tabla procesada: del archivo columnar si está al día, si no del CSV
+    (con la columna fecha parseada y los floats idénticos a los del columnar)
+    """
+    csv_path = Path(csv_path)
+    columnar = ruta_columnar(csv_path)
+    if columnar.exists() and (not csv_path.exists() or
+                              columnar.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns):
+        try:
+            return leer_columnar(columnar)
+        except (OSError, ValueError, KeyError):
+            pass
+    return pd.read_csv(csv_path, parse_dates=["fecha"], float_precision="round_trip")
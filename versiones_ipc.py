@@ -0,0 +1,191 @@
+"""
+Almacén de versiones (vintages) del IPC de INDEC.
+
+Cada archivo sh_ipc_MM_YY.xls de la carpeta datos es una versión. Todas se
+guardan en un único archivo columnar (datos/ipc_versiones.npz) con una fila por
+(versión, serie, mes); un mes sólo se vuelve a guardar si la nueva versión lo
+revisó, así que cada versión agrega sus meses nuevos y sus revisiones.
+
+Uso:
+    python versiones_ipc.py                       # registra las versiones nuevas
+    python versiones_ipc.py --diff sh_ipc_04_26.xls sh_ipc_05_26.xls
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from actualiza_datos_IPC import leer_series_ipc, parse_ipc_filename, SERIE_NACIONAL
+
+ARCHIVO_VERSIONES = Path("datos") / "ipc_versiones.npz"
+
+
+def _clave_version(nombre):
+    month, year = parse_ipc_filename(nombre)
+    return year * 12 + month
+
+
+def _nombre_version(version):
+    """Acepta 'sh_ipc_05_26.xls', 'sh_ipc_05_26' o '05_26'"""
+    version = Path(version).name.replace(".xls", "")
+    if not version.startswith("sh_ipc_"):
+        version = f"sh_ipc_{version}"
+    return f"{version}.xls"
+
+
+def cargar_versiones(archivo=ARCHIVO_VERSIONES):
+    """
+    Retorna (versiones, ultimos, series, tabla): nombres de versión, último mes
+    publicado en cada una, nombres de serie y un DataFrame con columnas
+    version, serie, fecha, valor (versiones y series como índices enteros)
+    """
+    if not Path(archivo).exists():
+        vacia = pd.DataFrame({
+            "version": np.array([], dtype=np.int16),
+            "serie": np.array([], dtype=np.int16),
+            "fecha": np.array([], dtype="datetime64[M]"),
+            "valor": np.array([], dtype=np.float64),
+        })
+        return [], [], [], vacia
+    with np.load(archivo) as store:
+        tabla = pd.DataFrame({
+            "version": store["version"],
+            "serie": store["serie"],
+            "fecha": store["fecha"],
+            "valor": store["valor"],
+        })
+        return list(store["versiones"]), list(store["ultimos"]), list(store["series"]), tabla
+
+
+def _guardar(versiones, ultimos, series, tabla, archivo=ARCHIVO_VERSIONES):
+    temp_path = Path(archivo).with_suffix(".tmp")
+    with open(temp_path, "wb") as f:
+        np.savez_compressed(
+            f,
+            versiones=np.array(versiones),
+            ultimos=np.array(ultimos, dtype="datetime64[M]"),
+            series=np.array(series),
+            version=tabla["version"].to_numpy(dtype=np.int16),
+            serie=tabla["serie"].to_numpy(dtype=np.int16),
+            fecha=tabla["fecha"].to_numpy(dtype="datetime64[M]"),
+            valor=tabla["valor"].to_numpy(dtype=np.float64),
+        )
+    temp_path.replace(archivo)
+
+
+def _ultimos_valores(tabla):
+    """Último valor guardado para cada (serie, mes)"""
+    return tabla.drop_duplicates(subset=["serie", "fecha"], keep="last")
+
+
+def actualizar_versiones(data_dir=Path("datos"), archivo=ARCHIVO_VERSIONES):
+    """
+    Registra en el almacén todas las versiones de IPC de `data_dir` que aún no estén
+    """
+    versiones, ultimos, series, tabla = cargar_versiones(archivo)
+    archivos = sorted(Path(data_dir).glob("sh_ipc_*_*.xls"), key=lambda p: _clave_version(p.name))
+    nuevas = [p for p in archivos if p.name not in versiones]
+    if not nuevas:
+        print("Versiones de IPC: sin versiones nuevas")
+        return versiones
+
+    for path in nuevas:
+        fechas, nombres, valores = leer_series_ipc(path)
+        for nombre in nombres:
+            if nombre not in series:
+                series.append(nombre)
+        indices_serie = np.array([series.index(n) for n in nombres], dtype=np.int16)
+
+        nueva = pd.DataFrame({
+            "serie": np.repeat(indices_serie[np.newaxis, :], len(fechas), axis=0).ravel(),
+            "fecha": np.repeat(fechas, len(nombres)),
+            "valor": valores.ravel(),
+        }).dropna(subset=["valor"])
+
+        # Guardar sólo meses nuevos o revisados respecto de lo ya almacenado
+        previos = _ultimos_valores(tabla)[["serie", "fecha", "valor"]]
+        nueva = nueva.merge(previos, on=["serie", "fecha"], how="left", suffixes=("", "_previo"))
+        nueva = nueva[nueva["valor"] != nueva["valor_previo"]].drop(columns="valor_previo")
+        nueva.insert(0, "version", len(versiones))
+
+        versiones.append(path.name)
+        ultimos.append(fechas.max())
+        tabla = pd.concat([tabla, nueva], ignore_index=True)
+        print(f"Versiones de IPC: {path.name} agrega {len(nueva)} valores nuevos o revisados")
+
+    _guardar(versiones, ultimos, series, tabla, archivo)
+    return versiones
+
+
+def ipc_de_version(version, serie=SERIE_NACIONAL, archivo=ARCHIVO_VERSIONES):
+    """
+    Reconstruye la serie de IPC tal como fue publicada en `version`, con el mismo
+    formato y base que read_ipc_from_xls (columnas fecha, indice)
+    """
+    versiones, ultimos, series, tabla = cargar_versiones(archivo)
+    version = _nombre_version(version)
+    if version not in versiones:
+        raise ValueError(f"La versión {version} no está en {archivo}")
+    posicion = versiones.index(version)
+
+    filas = tabla[(tabla["version"] <= posicion) & (tabla["serie"] == series.index(serie))]
+    filas = _ultimos_valores(filas).sort_values("fecha")
+    filas = filas[filas["fecha"] <= ultimos[posicion]]
+
+    ipc = pd.read_csv("datos/ipc_crudo.csv", parse_dates=["fecha"])
+    ultimo_indice = ipc["indice"].iloc[-1]
+    ipc2 = pd.DataFrame({
+        "fecha": pd.to_datetime(filas["fecha"].to_numpy()),
+        "indice": filas["valor"].to_numpy() * ultimo_indice / 100,
+    })
+    return pd.concat([ipc, ipc2], ignore_index=True)
+
+
+def comparar_versiones(version_a, version_b, archivo=ARCHIVO_VERSIONES):
+    """
+    Compara dos versiones de IPC. Retorna (ipc, salarios):
+      ipc: fecha, indice_a, indice_b y revisión porcentual de cada mes
+      salarios: por tipo y mes, ajustado y salario_real con cada versión y su diferencia
+    """
+    from actualiza_datos import procesar_lote, TIPOS
+
+    ipc_a = ipc_de_version(version_a, archivo=archivo)
+    ipc_b = ipc_de_version(version_b, archivo=archivo)
+    ipc = ipc_a.merge(ipc_b, on="fecha", how="outer", suffixes=("_a", "_b"))
+    ipc["revision_pct"] = (ipc["indice_b"] / ipc["indice_a"] - 1) * 100
+
+    resultados_a, _ = procesar_lote(TIPOS, ipc_a)
+    resultados_b, _ = procesar_lote(TIPOS, ipc_b)
+    salarios = []
+    for tipo in [t for t in TIPOS if t in resultados_a and t in resultados_b]:
+        df_a, df_b = resultados_a[tipo], resultados_b[tipo]
+        df = df_a[["fecha", "ajustado", "salario_real"]].merge(
+            df_b[["fecha", "ajustado", "salario_real"]], on="fecha", suffixes=("_a", "_b"))
+        df["dif_ajustado_pct"] = (df["ajustado_b"] / df["ajustado_a"] - 1) * 100
+        df["dif_salario_real_pct"] = (df["salario_real_b"] / df["salario_real_a"] - 1) * 100
+        df.insert(0, "tipo", tipo)
+        salarios.append(df)
+
+    return ipc, pd.concat(salarios, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Almacén de versiones del IPC de INDEC")
+    parser.add_argument("--diff", nargs=2, metavar=("VERSION_A", "VERSION_B"),
+                        help="Compara dos versiones (ej. 04_26 05_26)")
+    args = parser.parse_args()
+
+    actualizar_versiones()
+    if args.diff:
+        ipc, salarios = comparar_versiones(*args.diff)
+        revisados = ipc[ipc["revision_pct"].abs() > 1e-9]
+        print(f"\n=== Meses de IPC revisados ({len(revisados)}) ===")
+        print(revisados.to_string(index=False))
+        print("\n=== Último mes de cada serie salarial ===")
+        print(salarios.groupby("tipo").tail(1).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()